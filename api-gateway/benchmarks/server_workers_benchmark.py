@@ -0,0 +1,85 @@
+"""
+Measures gateway throughput on /ping for several worker counts.
+
+Usage (from api-gateway directory):
+    python -m benchmarks.server_workers_benchmark --workers 1 2 4 --requests 20000 --concurrency 256
+"""
+from typing import List
+import subprocess
+import argparse
+import asyncio
+import aiohttp
+import time
+import sys
+import os
+
+
+async def _wait_until_ready(session: aiohttp.ClientSession, url: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    return
+        except aiohttp.ClientError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Gateway did not start")
+
+
+async def _load(url: str, requests: int, concurrency: int) -> float:
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await _wait_until_ready(session, url)
+
+        remaining = requests
+
+        async def _worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                async with session.get(url) as response:
+                    await response.read()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+def _run(workers: int, port: int, requests: int, concurrency: int) -> float:
+    env = dict(
+        os.environ,
+        APP_HOST="127.0.0.1",
+        APP_PORT=str(port),
+        SERVER_WORKERS=str(workers),
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.main"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        return asyncio.run(_load(f"http://127.0.0.1:{port}/ping", requests, concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--port", type=int, default=18082)
+    args = parser.parse_args(argv)
+
+    baseline = None
+    for workers in args.workers:
+        rps = _run(workers, args.port, args.requests, args.concurrency)
+        baseline = baseline or rps
+        print(f"workers={workers:<3} {rps:10.0f} req/s  x{rps / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compares access token verification throughput of the signing algorithms.
+Keys are parsed once, as the gateway does with the keys from the JWKS endpoint.
+
+Usage (from api-gateway directory):
+    python -m benchmarks.token_verification_benchmark --algorithms HS256 ES256 EdDSA RS256 --tokens 20000
+"""
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from typing import Callable, List, Tuple
+import argparse
+import datetime
+import time
+import jwt
+
+
+def _generate_key(algorithm: str) -> Tuple[object, object]:
+    if algorithm == "HS256":
+        secret = "benchmark-secret-with-enough-entropy-for-hs256"
+        return secret, secret
+    if algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    elif algorithm == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+    elif algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        raise ValueError(f"Unknown algorithm {algorithm}")
+    return private_key, private_key.public_key()
+
+
+def _payload() -> dict:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return {
+        "sub": "7f9c24e5-3c1b-4a55-9d0e-0b8f5a1e6c42",
+        "exp": now + datetime.timedelta(minutes=10),
+        "iat": now,
+        "name": "benchmark",
+        "role": "USER",
+        "status": "ACTIVE",
+        "blocked_for": "None",
+    }
+
+
+def _measure(operation: Callable[[int], object], count: int) -> float:
+    started = time.perf_counter()
+    for index in range(count):
+        operation(index)
+    return count / (time.perf_counter() - started)
+
+
+def _run(algorithm: str, tokens: int) -> Tuple[float, float, int]:
+    signing_key, verifying_key = _generate_key(algorithm)
+
+    # Distinct tokens, so nothing is served from a cache
+    signed = []
+    sign_rate = _measure(
+        lambda index: signed.append(jwt.encode({**_payload(), "jti": str(index)}, signing_key, algorithm=algorithm)),
+        tokens
+    )
+    verify_rate = _measure(
+        lambda index: jwt.decode(signed[index], verifying_key, algorithms=[algorithm]),
+        tokens
+    )
+    return sign_rate, verify_rate, len(signed[0])
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--algorithms", nargs="+", default=["HS256", "ES256", "EdDSA", "RS256"])
+    parser.add_argument("--tokens", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    baseline = None
+    for algorithm in args.algorithms:
+        sign_rate, verify_rate, token_size = _run(algorithm, args.tokens)
+        baseline = baseline or verify_rate
+        print(
+            f"{algorithm:<6} sign {sign_rate:10.0f} tokens/s  "
+            f"verify {verify_rate:10.0f} tokens/s  x{verify_rate / baseline:.2f}  "
+            f"token {token_size} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 from src.core.proxy_session_core import get_proxy_client_session
+from src.core.upstream_core import UpstreamRegistry, get_upstream_registry
 from src.core.redis_core import get_redis_client
+from src.core.session_revocation_core import RevokedUsersRegistry, get_session_revocations
+from src.core.jwks_core import JwksKeyCache, get_jwks_key_cache
 from fastapi import Depends
 from redis.asyncio import Redis
 from typing import Annotated
@@ -14,3 +17,18 @@ ClientSession = Annotated[
     aiohttp.ClientSession,
     Depends(get_proxy_client_session)
 ]
+
+Upstreams = Annotated[
+    UpstreamRegistry,
+    Depends(get_upstream_registry)
+]
+
+SigningKeys = Annotated[
+    JwksKeyCache,
+    Depends(get_jwks_key_cache)
+]
+
+SessionRevocations = Annotated[
+    RevokedUsersRegistry,
+    Depends(get_session_revocations)
+]
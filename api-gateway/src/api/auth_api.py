@@ -1,10 +1,11 @@
 from src.utils.trace_id import add_trace_id, replace_trace_id
 from src.exceptions.code_exceptions import GatewayTimeoutException, ForbiddenException
-from src.annotations import ClientSession
+from src.services.upstream_service import UpstreamService
+from src.core.upstream_core import UpstreamRegistry
+from src.annotations import ClientSession, Upstreams
 from src.globals import (
-    REGISTER_URL, REFRESH_URL, LOGIN_URL, AUTH_SERVICE_NAME, SERVICE_NOT_RESPONDING_TIMEOUT, ALLOWED_RETURNING_HEADERS,
+    REGISTER_URL, REFRESH_URL, LOGIN_URL, AUTH_SERVICE_NAME, ALLOWED_RETURNING_HEADERS,
     TOKEN_COOKIE_NAME, TOKEN_COOKIE_HTTP_ONLY, TOKEN_COOKIE_MAX_AGE, TOKEN_COOKIE_SAME_SITE, TOKEN_COOKIE_SECURE,
-    SERVICES_URLS
 )
 
 from fastapi import APIRouter, Request, Response
@@ -23,21 +24,21 @@ async def _auth_proxy(
     resp: Response,
     proxy_url: str,
     client_session: aiohttp.ClientSession,
+    upstreams: UpstreamRegistry,
 ):
     req_headers = dict(req.headers)
     add_trace_id(req_headers)
 
-    target_url = SERVICES_URLS["user-service"] + "/users" + proxy_url
-    logger.debug(f"Routing to {target_url}")
+    upstream_service = UpstreamService(upstreams, client_session)
 
     try:
-        async with client_session.request(
+        async with await upstream_service.request(
+            service="user-service",
+            path="users" + proxy_url,
             method=req.method,
-            url=target_url,
             headers=req_headers,
             data=await req.body(),
-            params=req.query_params,
-            timeout=SERVICE_NOT_RESPONDING_TIMEOUT
+            params=req.query_params
         ) as response:
             returned_headers = MultiDict(response.headers)
             response_data = await response.read()
@@ -78,13 +79,13 @@ async def _auth_proxy(
 
 
 @auth_router.post("/api" + AUTH_SERVICE_NAME + REGISTER_URL)
-async def register(req: Request, resp: Response, client_session: ClientSession):
-    return await _auth_proxy(req, resp, REGISTER_URL, client_session)
+async def register(req: Request, resp: Response, client_session: ClientSession, upstreams: Upstreams):
+    return await _auth_proxy(req, resp, REGISTER_URL, client_session, upstreams)
 
 @auth_router.post("/api" + AUTH_SERVICE_NAME + LOGIN_URL)
-async def login(req: Request, resp: Response, client_session: ClientSession):
-    return await _auth_proxy(req, resp, LOGIN_URL, client_session)
+async def login(req: Request, resp: Response, client_session: ClientSession, upstreams: Upstreams):
+    return await _auth_proxy(req, resp, LOGIN_URL, client_session, upstreams)
 
 @auth_router.post("/api" + AUTH_SERVICE_NAME + REFRESH_URL)
-async def refresh(req: Request, resp: Response, client_session: ClientSession):
-    return await _auth_proxy(req, resp, REFRESH_URL, client_session)
+async def refresh(req: Request, resp: Response, client_session: ClientSession, upstreams: Upstreams):
+    return await _auth_proxy(req, resp, REFRESH_URL, client_session, upstreams)
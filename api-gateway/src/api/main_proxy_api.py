@@ -1,8 +1,9 @@
-from src.globals import SERVICES_URLS, STATIC_NGINX_URL, SERVICE_NOT_RESPONDING_TIMEOUT, ALLOWED_RETURNING_HEADERS
+from src.globals import STATIC_NGINX_URL, ALLOWED_RETURNING_HEADERS, STATIC_RETURNING_HEADERS, STATIC_FORWARDED_HEADERS
 from src.exceptions.code_exceptions import NotFoundException, GatewayTimeoutException
 from src.utils.trace_id import add_trace_id, replace_trace_id
+from src.services.upstream_service import UpstreamService
 from src.services.token_service import TokenService
-from src.annotations import ClientSession
+from src.annotations import ClientSession, Upstreams, SessionRevocations, SigningKeys
 
 from fastapi import APIRouter, Request, Response, HTTPException
 from fastapi.responses import StreamingResponse
@@ -34,29 +35,33 @@ async def proxy_api(
     path: str,
     req: Request,
     resp: Response,
-    client_session: ClientSession
+    client_session: ClientSession,
+    upstreams: Upstreams,
+    signing_keys: SigningKeys,
+    revocations: SessionRevocations
 ):
-    if service not in SERVICES_URLS:
+    if service not in upstreams:
         raise NotFoundException("Cannot find such service!")
 
-    token_service = TokenService(req, resp)
+    token_service = TokenService(req, resp, signing_keys, revocations)
     req_headers = dict(req.headers)
     add_trace_id(req_headers)
     await token_service.add_user_context(req_headers)
 
-    target_url = urljoin(SERVICES_URLS[service], path)
-    logger.debug(f"Routing to {target_url}")
-
     body = await req.body()
 
-    response = await client_session.request(
+    upstream_service = UpstreamService(upstreams, client_session)
+    response = await upstream_service.request(
+        service=service,
+        path=path,
         method=req.method,
-        url=target_url,
         headers=req_headers,
         data=body,
         params=req.query_params,
-        timeout=SERVICE_NOT_RESPONDING_TIMEOUT
+        # Compressed upstream bodies are passed to the client verbatim
+        auto_decompress=False
     )
+    target_url = str(response.url)
 
     try:
         returned_headers = MultiDict(response.headers)
@@ -67,8 +72,18 @@ async def proxy_api(
                 resp.headers[header_name] = value
 
         content_type = resp.headers.get("Content-Type", "").lower()
+        content_encoding = response.headers.get("Content-Encoding", "identity").lower()
+
+        if "application/json" in content_type and content_encoding != "identity":
+            content = await response.read()
+            await response.release()
+            return Response(
+                content=content,
+                status_code=response.status,
+                headers=dict(resp.headers)
+            )
 
-        if "application/json" in content_type:
+        elif "application/json" in content_type:
             content = await response.read()
             try:
                 json_data = json.loads(content)
@@ -115,13 +130,32 @@ async def proxy_api(
 @main_router.get("/static/{path:path}")
 async def proxy_static(
     path: str,
+    req: Request,
     client_session: ClientSession
 ):
-    target_url = urljoin(STATIC_NGINX_URL, path)
-
-    async with client_session.get(target_url) as response:
-        return StreamingResponse(
-            content=response.content,
-            status_code=response.status,
-            headers=dict(response.headers),
-        )
+    target_url = urljoin(STATIC_NGINX_URL, "static/" + path)
+    req_headers = {
+        header_name: value
+        for header_name, value in req.headers.items()
+        if header_name.lower() in STATIC_FORWARDED_HEADERS
+    }
+
+    try:
+        response = await client_session.get(target_url, headers=req_headers, auto_decompress=False)
+    except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+        logger.error(f"Static request to {target_url} failed: {e}")
+        raise HTTPException(502, "Bad gateway")
+
+    headers = {
+        header_name: value
+        for header_name, value in response.headers.items()
+        if header_name.lower() in STATIC_RETURNING_HEADERS
+    }
+
+    # The body is streamed after the handler returns, so the response is
+    # released by the stream instead of a context manager
+    return StreamingResponse(
+        content=_stream_from_aiohttp(response),
+        status_code=response.status,
+        headers=headers
+    )
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+@dataclass
+class CompressionConfig:
+    min_size: int = 1024
+    thread_pool_min_size: int = 64 * 1024
+    thread_pool_workers: int = 2
+    # Server preference used when the client accepts several encodings equally
+    encodings: Tuple[str, ...] = ("br", "zstd", "gzip")
+    levels: Dict[str, int] = field(default_factory=lambda: {"br": 4, "zstd": 3, "gzip": 6})
+    compressible_types: Tuple[str, ...] = (
+        "application/json", "application/javascript", "application/xml", "image/svg+xml", "text/"
+    )
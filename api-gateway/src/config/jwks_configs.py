@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+@dataclass
+class JwksConfig:
+    service: str = "user-service"
+    path: str = "users/.well-known/jwks.json"
+    refresh_interval: float = 300.0
+    # Unknown key ids trigger a refetch at most this often
+    min_refresh_interval: float = 10.0
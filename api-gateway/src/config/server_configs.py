@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ServerConfig:
+    host: str
+    port: int
+    workers: int = 1
+    loop: str = "auto"
+    http: str = "auto"
+    backlog: int = 2048
+    timeout_keep_alive: int = 75
+    timeout_graceful_shutdown: Optional[int] = 30
+    limit_concurrency: Optional[int] = None
+    forwarded_allow_ips: str = "*"
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+@dataclass
+class SessionRevocationConfig:
+    # Matches the access token TTL, older revocations cannot affect live tokens
+    window: int = 10 * 60
+    channel: str = "users:revocations"
+    recent_revocations_key: str = "users:revocations:recent"
@@ -0,0 +1,39 @@
+from src.models.enums import LoadBalancingStrategy
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+@dataclass
+class CircuitBreakerConfig:
+    failure_threshold: int = 5
+    open_timeout: float = 15.0
+    half_open_max_requests: int = 1
+
+@dataclass
+class RetryConfig:
+    max_attempts: int = 3
+    backoff: float = 0.05
+    budget_ratio: float = 0.2
+    budget_min_per_second: float = 5.0
+    budget_max_tokens: float = 50.0
+    retryable_methods: frozenset = frozenset({"GET", "HEAD", "OPTIONS"})
+    retryable_statuses: frozenset = frozenset({502, 503, 504})
+
+@dataclass
+class HealthCheckConfig:
+    path: str = "/ping"
+    interval: float = 5.0
+    timeout: float = 2.0
+    unhealthy_threshold: int = 2
+    healthy_threshold: int = 1
+
+@dataclass
+class TimeoutConfig:
+    default_timeout: float = 5.0
+    connect_timeout: float = 2.0
+    route_timeouts: Dict[str, List[Tuple[str, float]]] = field(default_factory=dict)
+
+@dataclass
+class LoadBalancingConfig:
+    strategy: LoadBalancingStrategy = LoadBalancingStrategy.POWER_OF_TWO_CHOICES
+    hash_routes: Dict[str, List[str]] = field(default_factory=dict)
@@ -0,0 +1,109 @@
+from src.config.jwks_configs import JwksConfig
+from src.core.upstream_core import UpstreamRegistry
+from src.services.upstream_service import UpstreamService
+
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, Dict, Optional
+from fastapi import FastAPI, Request
+import aiohttp
+import asyncio
+import logging
+import time
+import jwt
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class JwksKeyCache:
+    """
+    Token verification keys of user-service by key id. The set is refreshed
+    periodically, a token with an unknown key id triggers an early refetch
+    so newly rotated keys are picked up without waiting for the next round.
+    """
+
+    def __init__(
+        self,
+        upstreams: UpstreamRegistry,
+        client_session: aiohttp.ClientSession,
+        config: JwksConfig
+    ):
+        self._upstreams = upstreams
+        self._client_session = client_session
+        self._config = config
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._fetched_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def get(self, key_id: str) -> Optional[jwt.PyJWK]:
+        key = self._keys.get(key_id)
+        if key is not None:
+            return key
+
+        async with self._lock:
+            # Concurrent misses wait for the fetch already in flight
+            if key_id not in self._keys and time.monotonic() - self._fetched_at >= self._config.min_refresh_interval:
+                await self._fetch()
+
+        return self._keys.get(key_id)
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            await self._fetch()
+
+    async def _fetch(self) -> None:
+        self._fetched_at = time.monotonic()
+        upstream_service = UpstreamService(self._upstreams, self._client_session)
+
+        try:
+            async with await upstream_service.request(
+                service=self._config.service,
+                path=self._config.path,
+                method="GET",
+                headers={},
+                data=b"",
+                params=None
+            ) as response:
+                if response.status != 200:
+                    logger.warning(f"JWKS request returned {response.status}, keeping {list(self._keys)}")
+                    return
+                jwks = await response.json()
+
+            key_set = jwt.PyJWKSet.from_dict(jwks)
+        except Exception as e:
+            logger.warning(f"Cannot fetch JWKS, keeping {list(self._keys)}: {e}")
+            return
+
+        keys = {key.key_id: key for key in key_set.keys if key.key_id}
+        if keys.keys() != self._keys.keys():
+            logger.info(f"Token verification keys updated: {list(keys)}")
+        self._keys = keys
+
+
+async def _jwks_refresh_loop(cache: JwksKeyCache, interval: float) -> None:
+    while True:
+        await cache.refresh()
+        await asyncio.sleep(interval)
+
+
+@asynccontextmanager
+async def jwks_init(
+    app: FastAPI,
+    config: JwksConfig
+) -> None:
+    cache = JwksKeyCache(app.state.upstream_registry, app.state.proxy_client_session, config)
+    app.state.jwks_key_cache = cache
+
+    refresh_task = asyncio.create_task(_jwks_refresh_loop(cache, config.refresh_interval))
+    logger.info("JWKS key cache started")
+
+    try:
+        yield
+    finally:
+        refresh_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresh_task
+        logger.info("JWKS key cache stopped")
+
+
+async def get_jwks_key_cache(req: Request) -> AsyncGenerator[JwksKeyCache, None]:
+    yield req.app.state.jwks_key_cache
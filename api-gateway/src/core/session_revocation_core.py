@@ -0,0 +1,100 @@
+from src.config.session_revocation_configs import SessionRevocationConfig
+
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, Dict
+from fastapi import FastAPI, Request
+from redis.exceptions import RedisError
+from redis.asyncio import Redis
+import asyncio
+import logging
+import json
+import time
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class RevokedUsersRegistry:
+    """
+    In-process view of the user-service revocation feed. Access tokens of a
+    revoked user issued before the revocation are rejected until they would
+    have expired anyway.
+    """
+
+    def __init__(self, window: int):
+        self._window = window
+        self._revoked_at: Dict[str, float] = {}
+
+    def revoke(self, user_id: str, revoked_at: float) -> None:
+        if revoked_at > self._revoked_at.get(user_id, 0.0):
+            self._revoked_at[user_id] = revoked_at
+
+    def is_revoked(self, user_id: str, issued_at: float) -> bool:
+        revoked_at = self._revoked_at.get(user_id)
+        if revoked_at is None:
+            return False
+
+        if revoked_at + self._window < time.time():
+            del self._revoked_at[user_id]
+            return False
+
+        return issued_at < revoked_at
+
+
+async def _revocation_listener(
+    registry: RevokedUsersRegistry,
+    redis_client: Redis,
+    config: SessionRevocationConfig
+) -> None:
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(config.channel)
+
+                # Catch up on revocations published while we were not subscribed
+                recent = await redis_client.zrangebyscore(
+                    config.recent_revocations_key,
+                    time.time() - config.window,
+                    "+inf",
+                    withscores=True
+                )
+                for user_id, revoked_at in recent:
+                    registry.revoke(user_id.decode(), revoked_at)
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+
+                    try:
+                        revocation = json.loads(message["data"])
+                        registry.revoke(revocation["user_id"], float(revocation["revoked_at"]))
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Malformed revocation message {message['data']!r}: {e}")
+        except RedisError as e:
+            logger.warning(f"Session revocation listener failed: {e}")
+            await asyncio.sleep(1)
+
+
+@asynccontextmanager
+async def session_revocations_init(
+    app: FastAPI,
+    config: SessionRevocationConfig
+) -> None:
+    registry = RevokedUsersRegistry(config.window)
+    app.state.session_revocations = registry
+
+    listener_task = asyncio.create_task(
+        _revocation_listener(registry, app.state.redis_client, config)
+    )
+    logger.info("Session revocation listener started")
+
+    try:
+        yield
+    finally:
+        listener_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener_task
+        logger.info("Session revocation listener stopped")
+
+
+async def get_session_revocations(req: Request) -> AsyncGenerator[RevokedUsersRegistry, None]:
+    yield req.app.state.session_revocations
@@ -0,0 +1,226 @@
+from src.config.upstream_configs import CircuitBreakerConfig, RetryConfig, HealthCheckConfig, TimeoutConfig, LoadBalancingConfig
+from src.exceptions.code_exceptions import NotFoundException
+from src.utils.circuit_breaker import CircuitBreaker
+from src.models.enums import LoadBalancingStrategy
+from src.utils.retry_budget import RetryBudget
+
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, Dict, List, Optional, Sequence, Tuple
+from fastapi import FastAPI, Request
+import hashlib
+import aiohttp
+import asyncio
+import logging
+import random
+import re
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Upstream:
+    def __init__(
+        self,
+        service: str,
+        url: str,
+        breaker_config: CircuitBreakerConfig
+    ):
+        self.service = service
+        self.url = url
+        self.healthy = True
+        self.in_flight = 0
+        self.breaker = CircuitBreaker(f"{service}@{url}", breaker_config)
+        self._health_failures = 0
+        self._health_successes = 0
+
+    def is_available(self) -> bool:
+        return self.healthy and self.breaker.can_attempt()
+
+    def record_health(self, is_ok: bool, config: HealthCheckConfig) -> None:
+        if is_ok:
+            self._health_failures = 0
+            self._health_successes += 1
+
+            if not self.healthy and self._health_successes >= config.healthy_threshold:
+                logger.info(f"Upstream {self.service}@{self.url} is healthy again")
+                self.healthy = True
+        else:
+            self._health_successes = 0
+            self._health_failures += 1
+
+            if self.healthy and self._health_failures >= config.unhealthy_threshold:
+                logger.warning(f"Upstream {self.service}@{self.url} failed health checks")
+                self.healthy = False
+
+
+class UpstreamPool:
+    def __init__(
+        self,
+        service: str,
+        urls: List[str],
+        breaker_config: CircuitBreakerConfig,
+        retry_config: RetryConfig,
+        strategy: LoadBalancingStrategy,
+        hash_routes: List[str]
+    ):
+        self.service = service
+        self.upstreams = [Upstream(service, url, breaker_config) for url in urls]
+        self.retry_budget = RetryBudget(
+            ratio=retry_config.budget_ratio,
+            min_per_second=retry_config.budget_min_per_second,
+            max_tokens=retry_config.budget_max_tokens
+        )
+        self._strategy = strategy
+        self._hash_routes = [re.compile(pattern) for pattern in hash_routes]
+
+    def _get_hash_key(self, path: str) -> Optional[str]:
+        for pattern in self._hash_routes:
+            match = pattern.match(path)
+            if match:
+                return match.group("key")
+        return None
+
+    @staticmethod
+    def _rendezvous_weight(key: str, upstream: Upstream) -> int:
+        digest = hashlib.blake2b(f"{key}|{upstream.url}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def pick(self, path: str, exclude: Sequence[Upstream] = ()) -> Optional[Upstream]:
+        candidates = [
+            upstream for upstream in self.upstreams
+            if upstream not in exclude and upstream.is_available()
+        ]
+
+        if not candidates:
+            return None
+
+        # Rendezvous hashing keeps a key on the same replica while it is
+        # available and moves only that replica's keys when it is not
+        hash_key = self._get_hash_key(path)
+        if hash_key is not None:
+            return max(candidates, key=lambda upstream: self._rendezvous_weight(hash_key, upstream))
+
+        if len(candidates) == 1:
+            return candidates[0]
+
+        if self._strategy == LoadBalancingStrategy.LEAST_OUTSTANDING:
+            return min(candidates, key=lambda upstream: upstream.in_flight)
+
+        first, second = random.sample(candidates, 2)
+        return first if first.in_flight <= second.in_flight else second
+
+
+class UpstreamRegistry:
+    def __init__(
+        self,
+        services_urls: Dict[str, List[str]],
+        breaker_config: CircuitBreakerConfig,
+        retry_config: RetryConfig,
+        timeout_config: TimeoutConfig,
+        load_balancing_config: LoadBalancingConfig
+    ):
+        self.retry_config = retry_config
+        self._timeout_config = timeout_config
+        self._pools: Dict[str, UpstreamPool] = {
+            service: UpstreamPool(
+                service=service,
+                urls=urls,
+                breaker_config=breaker_config,
+                retry_config=retry_config,
+                strategy=load_balancing_config.strategy,
+                hash_routes=load_balancing_config.hash_routes.get(service, [])
+            )
+            for service, urls in services_urls.items()
+        }
+        self._route_timeouts: Dict[str, List[Tuple[re.Pattern, aiohttp.ClientTimeout]]] = {
+            service: [
+                (re.compile(pattern), self._build_timeout(seconds))
+                for pattern, seconds in routes
+            ]
+            for service, routes in timeout_config.route_timeouts.items()
+        }
+        self._default_timeout = self._build_timeout(timeout_config.default_timeout)
+
+    def _build_timeout(self, seconds: float) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=seconds,
+            connect=self._timeout_config.connect_timeout
+        )
+
+    def __contains__(self, service: str) -> bool:
+        return service in self._pools
+
+    def all(self) -> List[Upstream]:
+        return [upstream for pool in self._pools.values() for upstream in pool.upstreams]
+
+    def get(self, service: str) -> UpstreamPool:
+        if service not in self._pools:
+            raise NotFoundException("Cannot find such service!")
+        return self._pools[service]
+
+    def get_timeout(self, service: str, path: str) -> aiohttp.ClientTimeout:
+        for pattern, timeout in self._route_timeouts.get(service, []):
+            if pattern.match(path):
+                return timeout
+        return self._default_timeout
+
+
+async def _check_upstream(
+    upstream: Upstream,
+    session: aiohttp.ClientSession,
+    config: HealthCheckConfig
+) -> None:
+    try:
+        async with session.get(
+            upstream.url + config.path,
+            timeout=aiohttp.ClientTimeout(total=config.timeout)
+        ) as response:
+            upstream.record_health(response.status < 500, config)
+    except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+        logger.debug(f"Health check of {upstream.service}@{upstream.url} failed: {e}")
+        upstream.record_health(False, config)
+
+
+async def _health_check_loop(
+    registry: UpstreamRegistry,
+    session: aiohttp.ClientSession,
+    config: HealthCheckConfig
+) -> None:
+    while True:
+        await asyncio.gather(*(
+            _check_upstream(upstream, session, config)
+            for upstream in registry.all()
+        ))
+        await asyncio.sleep(config.interval)
+
+
+@asynccontextmanager
+async def upstreams_init(
+    app: FastAPI,
+    services_urls: Dict[str, List[str]],
+    breaker_config: CircuitBreakerConfig,
+    retry_config: RetryConfig,
+    health_check_config: HealthCheckConfig,
+    timeout_config: TimeoutConfig,
+    load_balancing_config: LoadBalancingConfig
+) -> None:
+    registry = UpstreamRegistry(
+        services_urls, breaker_config, retry_config, timeout_config, load_balancing_config
+    )
+    app.state.upstream_registry = registry
+
+    health_check_task = asyncio.create_task(
+        _health_check_loop(registry, app.state.proxy_client_session, health_check_config)
+    )
+    logger.info("Upstream health checks started")
+
+    try:
+        yield
+    finally:
+        health_check_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await health_check_task
+        logger.info("Upstream health checks stopped")
+
+
+async def get_upstream_registry(req: Request) -> AsyncGenerator[UpstreamRegistry, None]:
+    yield req.app.state.upstream_registry
@@ -67,6 +67,10 @@ class BadGatewayException(CodeException):
     def __init__(self, message: str):
         super().__init__(message=message, status_code=502)
 
+class ServiceUnavailableException(CodeException):
+    def __init__(self, message: str):
+        super().__init__(message=message, status_code=503)
+
 class GatewayTimeoutException(CodeException):
     def __init__(self, message: str):
         super().__init__(message=message, status_code=504)
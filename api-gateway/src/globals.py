@@ -11,6 +11,19 @@ APP_HOST: str = os.environ.get("APP_HOST", )
 APP_PORT: int = int(os.environ.get("APP_PORT"))
 STARTUP_PROFILE: str = "dev"
 
+#
+# Server configs
+#
+SERVER_WORKERS: int = int(os.environ.get("SERVER_WORKERS") or 1)
+# "auto" picks uvloop and httptools when they are installed
+SERVER_LOOP: str = os.environ.get("SERVER_LOOP") or "auto"
+SERVER_HTTP: str = os.environ.get("SERVER_HTTP") or "auto"
+SERVER_BACKLOG: int = int(os.environ.get("SERVER_BACKLOG", 2048))
+# Must outlive the keepalive_timeout of local-nginx upstream connections
+SERVER_KEEP_ALIVE_TIMEOUT: int = int(os.environ.get("SERVER_KEEP_ALIVE_TIMEOUT") or 75)
+SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: int = int(os.environ.get("SERVER_GRACEFUL_SHUTDOWN_TIMEOUT") or 30)
+SERVER_LIMIT_CONCURRENCY: int | None = int(os.environ["SERVER_LIMIT_CONCURRENCY"]) if os.environ.get("SERVER_LIMIT_CONCURRENCY") else None
+
 #
 # Logging config
 #
@@ -22,7 +35,7 @@ LOGS_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # Redis configs
 #
 REDIS_HOST: str = os.environ.get("REDIS_HOST")
-REDIS_PORT: int = os.environ.get("REDIS_PORT")
+REDIS_PORT: int = int(os.environ.get("REDIS_PORT") or 6379)
 
 #
 # SESSION
@@ -33,7 +46,18 @@ TOKEN_COOKIE_SECURE = False
 TOKEN_COOKIE_HTTP_ONLY = True
 TOKEN_COOKIE_SAME_SITE = "Lax"
 TOKEN_CACHE_TTL = 60 * 5
+# Only verifies HS256 tokens issued before the switch to signing keys, unset it once they expired
 ACCESS_TOKEN_SECRET = os.environ.get("ACCESS_TOKEN_SECRET")
+# Shared with the services, signs the user context header
+USER_CONTEXT_SECRET: str = os.environ.get("USER_CONTEXT_SECRET")
+# Public keys of user-service access tokens
+JWKS_PATH: str = os.environ.get("JWKS_PATH") or "users/.well-known/jwks.json"
+JWKS_REFRESH_INTERVAL: float = float(os.environ.get("JWKS_REFRESH_INTERVAL") or 300)
+JWKS_MIN_REFRESH_INTERVAL: float = float(os.environ.get("JWKS_MIN_REFRESH_INTERVAL") or 10)
+# Published by user-service when all sessions of a user are revoked
+SESSION_REVOCATION_CHANNEL: str = os.environ.get("SESSION_REVOCATION_CHANNEL") or "users:revocations"
+# Access token TTL of user-service
+SESSION_REVOCATION_WINDOW: int = int(os.environ.get("SESSION_REVOCATION_WINDOW") or 10 * 60)
 
 #
 # ROUTING
@@ -43,12 +67,70 @@ AUTH_FREE_PATHS = {
     "user-service": "/users/auth",
     "user-service": "/users/refresh",
 }
+# Comma separated list of replicas per service
 SERVICES_URLS = {
-    "user-service": "http://user-service:8084",
-    "book-service": "http://book-service:8083",
-    "review-service": "http://review-service:8085"
+    "user-service": (os.environ.get("USER_SERVICE_URLS") or "http://user-service:8084").split(","),
+    "book-service": (os.environ.get("BOOK_SERVICE_URLS") or "http://book-service:8083").split(","),
+    "review-service": (os.environ.get("REVIEW_SERVICE_URLS") or "http://review-service:8085").split(",")
+}
+STATIC_NGINX_URL = os.environ.get("STATIC_NGINX_URL") or "http://static-nginx:8081"
+
+#
+# Upstream resilience configs
+#
+SERVICE_NOT_RESPONDING_TIMEOUT: float = float(os.environ.get("SERVICE_NOT_RESPONDING_TIMEOUT", 5))
+SERVICE_CONNECT_TIMEOUT: float = float(os.environ.get("SERVICE_CONNECT_TIMEOUT", 2))
+# Per service list of (path regex, timeout in seconds), first match wins
+ROUTE_TIMEOUTS = {
+    "book-service": [
+        (r"^books/[^/]+/(file|pages|content)$", float(os.environ.get("FILE_ROUTES_TIMEOUT", 120))),
+        (r"^books/[^/]+/(page/\d+|cover)$", float(os.environ.get("PAGE_ROUTES_TIMEOUT", 30))),
+        (r"^books/import$", float(os.environ.get("IMPORT_ROUTES_TIMEOUT", 600))),
+    ],
+}
+HEALTH_CHECK_PATH = "/ping"
+HEALTH_CHECK_INTERVAL: float = float(os.environ.get("HEALTH_CHECK_INTERVAL", 5))
+HEALTH_CHECK_TIMEOUT: float = 2
+HEALTH_CHECK_UNHEALTHY_THRESHOLD: int = 2
+HEALTH_CHECK_HEALTHY_THRESHOLD: int = 1
+CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(os.environ.get("CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5))
+CIRCUIT_BREAKER_OPEN_TIMEOUT: float = float(os.environ.get("CIRCUIT_BREAKER_OPEN_TIMEOUT", 15))
+CIRCUIT_BREAKER_HALF_OPEN_MAX_REQUESTS: int = 1
+RETRY_MAX_ATTEMPTS: int = int(os.environ.get("RETRY_MAX_ATTEMPTS", 3))
+RETRY_BACKOFF: float = 0.05
+RETRY_BUDGET_RATIO: float = float(os.environ.get("RETRY_BUDGET_RATIO", 0.2))
+RETRY_BUDGET_MIN_PER_SECOND: float = 5
+RETRY_BUDGET_MAX_TOKENS: float = 50
+RETRYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRYABLE_STATUSES = frozenset({502, 503, 504})
+
+#
+# Load balancing configs
+#
+LOAD_BALANCING_STRATEGY: str = os.environ.get("LOAD_BALANCING_STRATEGY") or "p2c"
+# Per service list of path regexes routed by consistent hash of the `key` group
+HASH_ROUTES = {
+    "book-service": [
+        r"^books/(?P<key>[^/]+)/(page/\d+|pages)$",
+    ],
 }
-STATIC_NGINX_URL = "http://static-nginx"
+
+#
+# Compression configs
+#
+COMPRESSION_MIN_SIZE: int = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+# Bodies from this size are compressed in the thread pool
+COMPRESSION_THREAD_POOL_MIN_SIZE: int = 64 * 1024
+COMPRESSION_THREAD_POOL_WORKERS: int = int(os.environ.get("COMPRESSION_THREAD_POOL_WORKERS", 2))
+COMPRESSION_ENCODINGS = ("br", "zstd", "gzip")
+COMPRESSION_LEVELS = {"br": 4, "zstd": 3, "gzip": 6}
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
 
 #
 # Auth api configs
@@ -61,11 +143,8 @@ REFRESH_URL = "/refresh"
 #
 # HEADER'S NAMES
 #
-USER_ID_HEADER_NAME = "x-user-id"
-USER_ROLE_HEADER_NAME = "x-user-role"
-USER_NAME_HEADER_NAME = "x-user-name"
-USER_STATUS_HEADER_NAME = "x-user-status"
-USER_BLOCKED_FOR_HEADER_NAME = "x-user-blocked-for"
+# Signed user claims, see utils/user_context.py
+USER_CONTEXT_HEADER_NAME = "x-user-context"
 TRACE_ID_HEADER_NAME = "x-trace-id"
 REQUEST_ID_HEADER_NAME = "request-id"
 
@@ -78,7 +157,25 @@ ALLOWED_RETURNING_HEADERS = [
     "location",
     "date",
     "request-id",
-    "set-cookie"
+    "set-cookie",
+    "content-encoding",
+    "vary"
+]
+
+# Static assets are served by nginx, the gateway route is a fallback
+STATIC_RETURNING_HEADERS = [
+    "content-type",
+    "content-length",
+    "content-encoding",
+    "cache-control",
+    "etag",
+    "last-modified",
+    "vary"
+]
+STATIC_FORWARDED_HEADERS = [
+    "accept-encoding",
+    "if-none-match",
+    "if-modified-since"
 ]
 
 #
@@ -88,8 +185,3 @@ ALLOWED_ORIGINS = ["*"]
 ALLOWED_METHODS = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
 ALLOWED_HEADERS = ["*"]
 ALLOWED_CREDENTIALS = True
-
-#
-# Other configs
-#
-SERVICE_NOT_RESPONDING_TIMEOUT = 10
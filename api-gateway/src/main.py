@@ -2,13 +2,37 @@ from src.api.main_proxy_api import main_router
 from src.api.auth_api import auth_router
 from src.core.logging_core import setup_logging
 from src.core.proxy_session_core import proxy_client_session_init
+from src.core.upstream_core import upstreams_init
+from src.core.redis_core import redis_client_init
+from src.core.session_revocation_core import session_revocations_init
+from src.core.jwks_core import jwks_init
+from src.middlewares.compression_middleware import CompressionMiddleware
+from src.config.compression_configs import CompressionConfig
+from src.config.session_revocation_configs import SessionRevocationConfig
+from src.config.jwks_configs import JwksConfig
+from src.config.server_configs import ServerConfig
+from src.config.upstream_configs import CircuitBreakerConfig, RetryConfig, HealthCheckConfig, TimeoutConfig, LoadBalancingConfig
+from src.models.enums import LoadBalancingStrategy
 from src.exceptions.code_exceptions import CodeException
 from src.exceptions.exception_handlers import (
     pydantic_validation_exception_handler,
     exception_handler,
     code_exception_handler,
 )
-from src.globals import APP_HOST, APP_PORT, LOGS_LEVEL, LOGS_FILENAME, LOGS_FORMAT
+from src.globals import (
+    APP_HOST, APP_PORT, SERVER_WORKERS, SERVER_LOOP, SERVER_HTTP, SERVER_BACKLOG, SERVER_KEEP_ALIVE_TIMEOUT,
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT, SERVER_LIMIT_CONCURRENCY, LOGS_LEVEL, LOGS_FILENAME, LOGS_FORMAT, SERVICES_URLS,
+    SERVICE_NOT_RESPONDING_TIMEOUT, SERVICE_CONNECT_TIMEOUT, ROUTE_TIMEOUTS,
+    HEALTH_CHECK_PATH, HEALTH_CHECK_INTERVAL, HEALTH_CHECK_TIMEOUT,
+    HEALTH_CHECK_UNHEALTHY_THRESHOLD, HEALTH_CHECK_HEALTHY_THRESHOLD,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_OPEN_TIMEOUT, CIRCUIT_BREAKER_HALF_OPEN_MAX_REQUESTS,
+    RETRY_MAX_ATTEMPTS, RETRY_BACKOFF, RETRY_BUDGET_RATIO, RETRY_BUDGET_MIN_PER_SECOND, RETRY_BUDGET_MAX_TOKENS,
+    RETRYABLE_METHODS, RETRYABLE_STATUSES, LOAD_BALANCING_STRATEGY, HASH_ROUTES,
+    COMPRESSION_MIN_SIZE, COMPRESSION_THREAD_POOL_MIN_SIZE, COMPRESSION_THREAD_POOL_WORKERS,
+    COMPRESSION_ENCODINGS, COMPRESSION_LEVELS, COMPRESSIBLE_CONTENT_TYPES,
+    REDIS_HOST, REDIS_PORT, SESSION_REVOCATION_CHANNEL, SESSION_REVOCATION_WINDOW,
+    JWKS_PATH, JWKS_REFRESH_INTERVAL, JWKS_MIN_REFRESH_INTERVAL
+)
 
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
@@ -30,7 +54,57 @@ async def app_lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger: logging.Logger = logging.getLogger(__name__)
 
     async with (
-        proxy_client_session_init(app)
+        proxy_client_session_init(app),
+        upstreams_init(
+            app=app,
+            services_urls=SERVICES_URLS,
+            breaker_config=CircuitBreakerConfig(
+                failure_threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                open_timeout=CIRCUIT_BREAKER_OPEN_TIMEOUT,
+                half_open_max_requests=CIRCUIT_BREAKER_HALF_OPEN_MAX_REQUESTS
+            ),
+            retry_config=RetryConfig(
+                max_attempts=RETRY_MAX_ATTEMPTS,
+                backoff=RETRY_BACKOFF,
+                budget_ratio=RETRY_BUDGET_RATIO,
+                budget_min_per_second=RETRY_BUDGET_MIN_PER_SECOND,
+                budget_max_tokens=RETRY_BUDGET_MAX_TOKENS,
+                retryable_methods=RETRYABLE_METHODS,
+                retryable_statuses=RETRYABLE_STATUSES
+            ),
+            health_check_config=HealthCheckConfig(
+                path=HEALTH_CHECK_PATH,
+                interval=HEALTH_CHECK_INTERVAL,
+                timeout=HEALTH_CHECK_TIMEOUT,
+                unhealthy_threshold=HEALTH_CHECK_UNHEALTHY_THRESHOLD,
+                healthy_threshold=HEALTH_CHECK_HEALTHY_THRESHOLD
+            ),
+            timeout_config=TimeoutConfig(
+                default_timeout=SERVICE_NOT_RESPONDING_TIMEOUT,
+                connect_timeout=SERVICE_CONNECT_TIMEOUT,
+                route_timeouts=ROUTE_TIMEOUTS
+            ),
+            load_balancing_config=LoadBalancingConfig(
+                strategy=LoadBalancingStrategy(LOAD_BALANCING_STRATEGY),
+                hash_routes=HASH_ROUTES
+            )
+        ),
+        jwks_init(
+            app=app,
+            config=JwksConfig(
+                path=JWKS_PATH,
+                refresh_interval=JWKS_REFRESH_INTERVAL,
+                min_refresh_interval=JWKS_MIN_REFRESH_INTERVAL
+            )
+        ),
+        redis_client_init(app, REDIS_HOST, REDIS_PORT),
+        session_revocations_init(
+            app=app,
+            config=SessionRevocationConfig(
+                window=SESSION_REVOCATION_WINDOW,
+                channel=SESSION_REVOCATION_CHANNEL
+            )
+        )
     ):
         logger.info(f"Server is started on {APP_HOST}:{APP_PORT}")
         yield
@@ -39,6 +113,18 @@ async def app_lifespan(app: FastAPI) -> AsyncIterator[None]:
 
 app = FastAPI(lifespan=app_lifespan)
 
+app.add_middleware(
+    CompressionMiddleware,
+    config=CompressionConfig(
+        min_size=COMPRESSION_MIN_SIZE,
+        thread_pool_min_size=COMPRESSION_THREAD_POOL_MIN_SIZE,
+        thread_pool_workers=COMPRESSION_THREAD_POOL_WORKERS,
+        encodings=COMPRESSION_ENCODINGS,
+        levels=COMPRESSION_LEVELS,
+        compressible_types=COMPRESSIBLE_CONTENT_TYPES
+    )
+)
+
 app.include_router(auth_router)
 app.include_router(main_router)
 
@@ -50,5 +136,35 @@ app.add_exception_handler(RequestValidationError, pydantic_validation_exception_
 app.add_exception_handler(CodeException, code_exception_handler)
 app.add_exception_handler(Exception, exception_handler)
 
+
+def run_server(config: ServerConfig) -> None:
+    # Workers are spawned as separate processes, so the app is passed by import path.
+    # On SIGTERM uvicorn stops accepting connections and lets in-flight requests finish
+    uvicorn.run(
+        "src.main:app",
+        host=config.host,
+        port=config.port,
+        workers=config.workers,
+        loop=config.loop,
+        http=config.http,
+        backlog=config.backlog,
+        timeout_keep_alive=config.timeout_keep_alive,
+        timeout_graceful_shutdown=config.timeout_graceful_shutdown,
+        limit_concurrency=config.limit_concurrency,
+        proxy_headers=True,
+        forwarded_allow_ips=config.forwarded_allow_ips,
+    )
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host=APP_HOST, port=APP_PORT)
+    run_server(ServerConfig(
+        host=APP_HOST,
+        port=APP_PORT,
+        workers=SERVER_WORKERS,
+        loop=SERVER_LOOP,
+        http=SERVER_HTTP,
+        backlog=SERVER_BACKLOG,
+        timeout_keep_alive=SERVER_KEEP_ALIVE_TIMEOUT,
+        timeout_graceful_shutdown=SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+        limit_concurrency=SERVER_LIMIT_CONCURRENCY
+    ))
@@ -0,0 +1,125 @@
+from src.utils.compression import StreamCompressor, available_encodings, negotiate_encoding, compress
+from src.config.compression_configs import CompressionConfig
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.datastructures import Headers, MutableHeaders
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with the best encoding accepted by the client.
+    Responses that already carry `Content-Encoding` (e.g. precompressed
+    upstream bodies) are sent verbatim.
+    """
+
+    def __init__(self, app: ASGIApp, config: CompressionConfig):
+        self.app = app
+        self.config = config
+        self.encodings = available_encodings(config.encodings)
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.thread_pool_workers,
+            thread_name_prefix="compression"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""),
+            self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str):
+        self._middleware = middleware
+        self._config = middleware.config
+        self._send = send
+        self._encoding = encoding
+        self._level = self._config.levels[encoding]
+        self._start_message: Optional[Message] = None
+        self._compressor: Optional[StreamCompressor] = None
+        self._passthrough = False
+
+    def _is_compressible(self, headers: MutableHeaders, status: int) -> bool:
+        if status < 200 or status in (204, 304):
+            return False
+        if headers.get("content-encoding") or "no-transform" in headers.get("cache-control", ""):
+            return False
+
+        content_type = headers.get("content-type", "").lower()
+        return any(content_type.startswith(prefix) for prefix in self._config.compressible_types)
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            if self._is_compressible(headers, message["status"]):
+                headers.add_vary_header("Accept-Encoding")
+                self._start_message = message
+            else:
+                self._passthrough = True
+                await self._send(message)
+            return
+
+        if self._passthrough or message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is not None:
+            chunk = self._compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += self._compressor.finish()
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        headers = MutableHeaders(raw=self._start_message["headers"])
+
+        if not more_body:
+            if len(body) >= self._config.min_size:
+                body = await self._compress(body)
+                headers["Content-Encoding"] = self._encoding
+                headers["Content-Length"] = str(len(body))
+
+            await self._send(self._start_message)
+            await self._send({"type": "http.response.body", "body": body, "more_body": False})
+            return
+
+        # Streamed body, its size is unknown so it is always compressed
+        self._compressor = StreamCompressor(self._encoding, self._level)
+        headers["Content-Encoding"] = self._encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+
+        await self._send(self._start_message)
+        await self._send({
+            "type": "http.response.body",
+            "body": self._compressor.compress(body) if body else b"",
+            "more_body": True
+        })
+
+    async def _compress(self, body: bytes) -> bytes:
+        # Large bodies would block the event loop for milliseconds
+        if len(body) < self._config.thread_pool_min_size:
+            return compress(body, self._encoding, self._level)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._middleware.executor, compress, body, self._encoding, self._level
+        )
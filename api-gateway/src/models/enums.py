@@ -21,3 +21,13 @@ class ResponseDataType(str, Enum):
     STRING = "str"
     JSON = "json"
 
+
+class CircuitState(str, Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class LoadBalancingStrategy(str, Enum):
+    POWER_OF_TWO_CHOICES = "p2c"
+    LEAST_OUTSTANDING = "least_outstanding"
@@ -1,23 +1,44 @@
 from src.exceptions.code_exceptions import UnauthorizedException
-from src.globals import (
-    ACCESS_TOKEN_SECRET, TOKEN_COOKIE_NAME,
-    USER_BLOCKED_FOR_HEADER_NAME, USER_ID_HEADER_NAME, USER_NAME_HEADER_NAME, USER_ROLE_HEADER_NAME, USER_STATUS_HEADER_NAME
-)
+from src.core.session_revocation_core import RevokedUsersRegistry
+from src.core.jwks_core import JwksKeyCache
+from src.utils.user_context import user_context_signer
+from src.globals import ACCESS_TOKEN_SECRET, TOKEN_COOKIE_NAME, USER_CONTEXT_HEADER_NAME
 
 from fastapi import Request, Response
+from typing import Optional
 import logging
 import jwt
 
 logger = logging.getLogger(__name__)
 
 class TokenService:
-    def __init__(self, req: Request, resp: Response):
+    def __init__(
+        self,
+        req: Request,
+        resp: Response,
+        signing_keys: JwksKeyCache,
+        revocations: Optional[RevokedUsersRegistry] = None
+    ):
         self._req = req
         self._resp = resp
+        self._signing_keys = signing_keys
+        self._revocations = revocations
     
     async def _decode_access_token(self, token: str) -> dict:
         try:
-            payload = jwt.decode(token, ACCESS_TOKEN_SECRET, algorithms=["HS256"])
+            key_id = jwt.get_unverified_header(token).get("kid")
+
+            if key_id is not None:
+                signing_key = await self._signing_keys.get(key_id)
+                if signing_key is None:
+                    raise UnauthorizedException("Access token is signed with an unknown key")
+                key, algorithms = signing_key.key, [signing_key.algorithm_name]
+            elif ACCESS_TOKEN_SECRET:
+                key, algorithms = ACCESS_TOKEN_SECRET, ["HS256"]
+            else:
+                raise UnauthorizedException("Access token is invalid")
+
+            payload = jwt.decode(token, key, algorithms=algorithms)
             return payload
         except jwt.ExpiredSignatureError:
             raise UnauthorizedException("Access token has expired")
@@ -28,15 +49,21 @@ class TokenService:
         token = self._req.cookies.get(TOKEN_COOKIE_NAME)
         user_data = await self._decode_access_token(token)
 
+        if self._revocations is not None and self._revocations.is_revoked(user_data.get("sub"), user_data.get("iat", 0)):
+            raise UnauthorizedException("Session has been revoked")
+
         logger.debug(f"USER CONTEXT - {user_data}")
 
         try:
-            headers[USER_ID_HEADER_NAME] = user_data["sub"]
-            headers[USER_NAME_HEADER_NAME] = user_data["name"]
-            headers[USER_ROLE_HEADER_NAME] = user_data["role"]
-            headers[USER_STATUS_HEADER_NAME] = user_data["status"]
-            headers[USER_BLOCKED_FOR_HEADER_NAME] = str(user_data["blocked_for"])
+            # Expires with the access token, so services can cache the verified value
+            headers[USER_CONTEXT_HEADER_NAME] = user_context_signer.sign(
+                user_id=user_data["sub"],
+                name=user_data["name"],
+                role=user_data["role"],
+                status=user_data["status"],
+                expires_at=int(user_data["exp"])
+            )
         except Exception as e:
             logger.debug(f"Error while try to add user context. {e}")
-            return UnauthorizedException("Invalid token data")
+            raise UnauthorizedException("Invalid token data")
 
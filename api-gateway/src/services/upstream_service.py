@@ -0,0 +1,108 @@
+from src.exceptions.code_exceptions import BadGatewayException, GatewayTimeoutException, ServiceUnavailableException
+from src.core.upstream_core import UpstreamRegistry
+
+from urllib.parse import urljoin
+from typing import Any
+import aiohttp
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamService:
+    def __init__(self, registry: UpstreamRegistry, client_session: aiohttp.ClientSession):
+        self._registry = registry
+        self._client_session = client_session
+
+    async def request(
+        self,
+        service: str,
+        path: str,
+        method: str,
+        headers: dict,
+        data: bytes,
+        params: Any,
+        auto_decompress: bool = True
+    ) -> aiohttp.ClientResponse:
+        """
+        Sends the request to the service and returns the not yet read response.
+        The caller is responsible for releasing it.
+        """
+        pool = self._registry.get(service)
+        retry_config = self._registry.retry_config
+        timeout = self._registry.get_timeout(service, path)
+        is_retryable = method.upper() in retry_config.retryable_methods
+
+        pool.retry_budget.deposit()
+
+        tried = []
+        attempt = 0
+        while True:
+            attempt += 1
+
+            # Prefer a replica that has not failed this request yet
+            upstream = pool.pick(path, exclude=tried) or pool.pick(path)
+
+            if not upstream or not upstream.breaker.allow_request():
+                logger.warning(f"Fast-failing request to unavailable {service}")
+                raise ServiceUnavailableException("Service is temporarily unavailable")
+
+            tried.append(upstream)
+            target_url = urljoin(upstream.url, path)
+            logger.debug(f"Routing to {target_url} (attempt {attempt})")
+
+            can_retry = (
+                is_retryable
+                and attempt < retry_config.max_attempts
+            )
+
+            # Outstanding requests are counted until the response headers
+            # arrive, services finish rendering before they start to answer
+            upstream.in_flight += 1
+            try:
+                response = await self._client_session.request(
+                    method=method,
+                    url=target_url,
+                    headers=headers,
+                    data=data,
+                    params=params,
+                    timeout=timeout,
+                    auto_decompress=auto_decompress
+                )
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                upstream.breaker.record_failure()
+                logger.error(f"Request to {target_url} failed: {e!r}")
+
+                if can_retry and pool.retry_budget.try_withdraw():
+                    await asyncio.sleep(retry_config.backoff * attempt)
+                    continue
+
+                if isinstance(e, asyncio.TimeoutError):
+                    raise GatewayTimeoutException("Service is not responding")
+                raise BadGatewayException("Bad gateway")
+            except BaseException:
+                # Cancellation or an unexpected error says nothing about the
+                # upstream, only its half-open probe slot is given back
+                upstream.breaker.release()
+                raise
+            finally:
+                upstream.in_flight -= 1
+
+            if response.status < 500:
+                upstream.breaker.record_success()
+                return response
+
+            upstream.breaker.record_failure()
+
+            if (
+                can_retry
+                and response.status in retry_config.retryable_statuses
+                and pool.retry_budget.try_withdraw()
+            ):
+                logger.warning(f"Retrying {target_url} after status {response.status}")
+                response.release()
+                await asyncio.sleep(retry_config.backoff * attempt)
+                continue
+
+            return response
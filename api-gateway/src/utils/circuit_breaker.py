@@ -0,0 +1,93 @@
+from src.config.upstream_configs import CircuitBreakerConfig
+from src.models.enums import CircuitState
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker. Doubles as outlier detection: an upstream
+    that keeps answering 5xx or timing out is ejected for `open_timeout`
+    seconds, after which a limited number of probe requests decide whether
+    it comes back.
+    """
+
+    def __init__(self, name: str, config: CircuitBreakerConfig):
+        self._name = name
+        self._config = config
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_at = 0.0
+        self._half_open_in_flight = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def can_attempt(self) -> bool:
+        if self._state == CircuitState.OPEN:
+            return time.monotonic() - self._opened_at >= self._config.open_timeout
+        if self._state == CircuitState.HALF_OPEN:
+            return self._half_open_in_flight < self._config.half_open_max_requests or self._is_half_open_stale()
+        return True
+
+    def allow_request(self) -> bool:
+        if self._state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self._config.open_timeout:
+                return False
+
+            logger.info(f"Circuit {self._name} is half-open")
+            self._start_half_open()
+
+        if self._state == CircuitState.HALF_OPEN:
+            if self._half_open_in_flight >= self._config.half_open_max_requests:
+                if not self._is_half_open_stale():
+                    return False
+                # Probes that never reported back must not hold the circuit forever
+                logger.warning(f"Circuit {self._name} probes did not finish, probing again")
+                self._start_half_open()
+            self._half_open_in_flight += 1
+
+        return True
+
+    def release(self) -> None:
+        """
+        Frees the probe slot of a request that ended without an outcome,
+        e.g. cancelled by a client disconnect.
+        """
+        if self._state == CircuitState.HALF_OPEN and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"Circuit {self._name} is closed")
+            self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        self._failures += 1
+
+        if (
+            self._state == CircuitState.HALF_OPEN
+            or self._failures >= self._config.failure_threshold
+        ):
+            self.trip()
+
+    def _start_half_open(self) -> None:
+        self._state = CircuitState.HALF_OPEN
+        self._half_open_at = time.monotonic()
+        self._half_open_in_flight = 0
+
+    def _is_half_open_stale(self) -> bool:
+        return time.monotonic() - self._half_open_at >= self._config.open_timeout
+
+    def trip(self) -> None:
+        if self._state != CircuitState.OPEN:
+            logger.warning(f"Circuit {self._name} is open after {self._failures} failures")
+
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
@@ -0,0 +1,37 @@
+import time
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of live traffic. Every
+    original request deposits `ratio` tokens, the bucket also refills at
+    `min_per_second`, and every retry withdraws one token.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, max_tokens: float):
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._max_tokens,
+            self._tokens + (now - self._last_refill) * self._min_per_second
+        )
+        self._last_refill = now
+
+    def deposit(self) -> None:
+        self._refill()
+        self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        self._refill()
+
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
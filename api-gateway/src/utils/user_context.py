@@ -0,0 +1,41 @@
+from src.globals import USER_CONTEXT_SECRET
+import logging
+import base64
+import hashlib
+import struct
+import hmac
+import uuid
+import os
+
+logger = logging.getLogger(__name__)
+
+USER_CONTEXT_VERSION = 1
+# Truncated HMAC-SHA256, 128 bits
+USER_CONTEXT_TAG_SIZE = 16
+# Version, user id bytes, expiry in unix seconds, then "role\x1fstatus\x1fname" in UTF-8
+USER_CONTEXT_PREFIX = struct.Struct("!B16sI")
+USER_CONTEXT_FIELD_SEPARATOR = "\x1f"
+
+
+class UserContextSigner:
+    """Packs the token claims services need into one signed header value."""
+
+    def __init__(self, secret: str):
+        if not secret:
+            # Services reject the context, only guest requests go through
+            logger.warning("USER_CONTEXT_SECRET is not set, user context is signed with a random key")
+            secret = os.urandom(32).hex()
+
+        # Keyed once, every signature starts from a copy of this state
+        self._mac = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+    def sign(self, user_id: str, name: str, role: str, status: str, expires_at: int) -> str:
+        payload = USER_CONTEXT_PREFIX.pack(USER_CONTEXT_VERSION, uuid.UUID(user_id).bytes, expires_at)
+        payload += USER_CONTEXT_FIELD_SEPARATOR.join((role, status, name)).encode()
+
+        mac = self._mac.copy()
+        mac.update(payload)
+        return base64.urlsafe_b64encode(payload + mac.digest()[:USER_CONTEXT_TAG_SIZE]).rstrip(b"=").decode()
+
+
+user_context_signer = UserContextSigner(USER_CONTEXT_SECRET)
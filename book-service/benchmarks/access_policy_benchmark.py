@@ -0,0 +1,116 @@
+"""
+Measures the cost of route access checks over consecutive windows of calls,
+with the previous per-call `AccessControl` and the route policies compiled
+at startup. The previous implementation built new role and status lists
+on every request and `check_resource_access` wrote into its shared default
+list; both variants must stay flat from the first window to the last.
+
+Usage (from book-service directory, service env as for the app):
+    python -m benchmarks.access_policy_benchmark --windows 10 --calls 100000
+"""
+from src.middlewares.access_control import AccessPolicy, check_resource_access
+from src.middlewares.auth_middleware import UserContext
+from src.models.enums import BookStatus, UserRole, UserStatus
+
+from typing import List
+import argparse
+import time
+import uuid
+
+
+class LegacyAccessControl:
+    def __init__(
+        self,
+        allowed_roles: List[UserRole] = None,
+        require_authentication: bool = True,
+        allowed_statuses: List[str] = None,
+        resource_owner_check: bool = False
+    ):
+        self.allowed_roles = allowed_roles or [UserRole.GUEST]
+        self.require_authentication = require_authentication
+        self.allowed_statuses = allowed_statuses or ["ACTIVE"]
+        self.resource_owner_check = resource_owner_check
+
+    def check_access(self, user_context, resource_owner_id: str = None) -> bool:
+        if self.require_authentication and not user_context.is_authenticated:
+            return False
+
+        if user_context.user_role not in self.allowed_roles:
+            return False
+
+        if user_context.user_status and user_context.user_status.value not in self.allowed_statuses:
+            return False
+
+        if self.resource_owner_check and resource_owner_id:
+            if user_context.user_id != resource_owner_id and not user_context.is_admin:
+                return False
+
+        return True
+
+
+def legacy_check_resource_access(
+    user_context,
+    resource_status: str,
+    resource_owner_id: uuid.UUID = None,
+    allowed_statuses: List[str] = list()
+) -> bool:
+    if len(allowed_statuses) == 0:
+        allowed_statuses.append("ACTIVE")
+
+    if user_context.is_admin:
+        return True
+
+    if resource_owner_id and user_context.user_id == resource_owner_id:
+        return True
+
+    return resource_status in allowed_statuses
+
+
+# The widest rule set used by the routes
+ROUTE_RULES = dict(
+    allowed_roles=[UserRole.USER, UserRole.ADMIN],
+    require_authentication=True,
+    allowed_statuses=[BookStatus.WAIT_FILE, BookStatus.ON_MODERATE, BookStatus.PRIVATE, BookStatus.ON_APILATION, BookStatus.ACTIVE],
+)
+
+OTHER_OWNER_ID = uuid.UUID(int=0)
+
+
+def _legacy_call(user_context: UserContext) -> bool:
+    allowed = LegacyAccessControl(**ROUTE_RULES).check_access(user_context)
+    return allowed and legacy_check_resource_access(user_context, "PRIVATE", OTHER_OWNER_ID)
+
+
+def _policy_call(policy: AccessPolicy, user_context: UserContext) -> bool:
+    allowed = policy.check_access(user_context)
+    return allowed and check_resource_access(user_context, "PRIVATE", OTHER_OWNER_ID)
+
+
+def _run_windows(name: str, call, windows: int, calls: int) -> None:
+    first = None
+    for window in range(1, windows + 1):
+        started = time.perf_counter()
+        for _ in range(calls):
+            call()
+        per_call = (time.perf_counter() - started) / calls * 1e9
+        first = first or per_call
+        print(f"{name:<8} window {window:>3} {per_call:10.0f} ns/call  x{per_call / first:.2f}")
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--windows", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    user_context = UserContext(uuid.uuid4(), "reader", UserRole.USER, UserStatus.ACTIVE)
+    policy = AccessPolicy(**ROUTE_RULES)
+
+    _run_windows("legacy", lambda: _legacy_call(user_context), args.windows, args.calls)
+    print(f"legacy shared default status list: {legacy_check_resource_access.__defaults__[1]}")
+
+    _run_windows("policy", lambda: _policy_call(policy, user_context), args.windows, args.calls)
+
+
+if __name__ == "__main__":
+    main()
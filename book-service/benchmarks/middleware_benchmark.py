@@ -0,0 +1,107 @@
+"""
+Measures requests/sec of book-service endpoints with the user context
+middleware written on BaseHTTPMiddleware (the previous implementation)
+and as plain ASGI. Requests go through the whole app in-process, so the
+numbers show framework overhead without network noise.
+
+Usage (from book-service directory, database env as for the service):
+    python -m benchmarks.middleware_benchmark --requests 5000 --concurrency 64
+    python -m benchmarks.middleware_benchmark --endpoints /ping    # no database needed
+"""
+from src.middlewares.auth_middleware import UserContextMiddleware, extract_user_context
+from src.exceptions.code_exceptions import CodeException
+from src.main import app
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware import Middleware
+from fastapi.responses import JSONResponse
+from typing import List
+import argparse
+import asyncio
+import httpx
+import time
+
+
+class BaseHTTPUserContextMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        try:
+            user_context = await extract_user_context(request)
+        except CodeException as e:
+            return JSONResponse(status_code=e.status_code, content={
+                "status": "Exception",
+                "message": e.message
+            })
+
+        request.state.user_context = user_context
+
+        response = await call_next(request)
+        return response
+
+
+VARIANTS = {
+    "base_http": BaseHTTPUserContextMiddleware,
+    "asgi": UserContextMiddleware,
+}
+
+
+def _use_middleware(middleware_class: type) -> None:
+    app.user_middleware = [
+        Middleware(middleware_class) if middleware.cls in VARIANTS.values() else middleware
+        for middleware in app.user_middleware
+    ]
+    # Rebuilt on the next request
+    app.middleware_stack = None
+
+
+async def _load(client: httpx.AsyncClient, path: str, requests: int, concurrency: int) -> float:
+    remaining = requests
+
+    async def _worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            response = await client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} returned {response.status_code}: {response.text[:200]}")
+
+    # Warm up caches and the middleware stack
+    await client.get(path)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+async def _run(endpoints: List[str], requests: int, concurrency: int) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://book-service") as client:
+        for path in endpoints:
+            baseline = None
+            for name, middleware_class in VARIANTS.items():
+                _use_middleware(middleware_class)
+                rps = await _load(client, path, requests, concurrency)
+                baseline = baseline or rps
+                print(f"{path:<20} {name:<10} {rps:10.0f} req/s  x{rps / baseline:.2f}")
+
+
+async def main_async(endpoints: List[str], requests: int, concurrency: int) -> None:
+    if all(path == "/ping" for path in endpoints):
+        await _run(endpoints, requests, concurrency)
+        return
+
+    async with app.router.lifespan_context(app):
+        await _run(endpoints, requests, concurrency)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--endpoints", nargs="+", default=["/ping", "/books/search?page_size=20"])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    asyncio.run(main_async(args.endpoints, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
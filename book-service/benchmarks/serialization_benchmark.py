@@ -0,0 +1,120 @@
+"""
+Measures the time to turn a page of books into response bytes, from ORM
+entities to the rendered body of `BookSearchResponseDTO`: validated DTO
+constructors with `jsonable_encoder` and `JSONResponse` (the previous path)
+against `model_construct` DTOs rendered by `FastJSONResponse`.
+
+Usage (from book-service directory, service env as for the app):
+    python -m benchmarks.serialization_benchmark --rows 20 100 1000
+"""
+from src.models.response_dtos import BookResponseDTO, BookSearchResponseDTO, CommonResponseModel
+from src.models.enums import BookStatus, ResponseDataType, ResponseStatus
+from src.models.entities import AuthorProfile, Book
+from src.utils.json_response import FastJSONResponse, orjson
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from datetime import datetime
+from typing import Callable, List
+import argparse
+import json
+import time
+import uuid
+
+
+def _make_books(rows: int) -> List[Book]:
+    author = AuthorProfile(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        name="Author name",
+        rating=4.25,
+        common_genres=["fantasy", "adventure"],
+        books_count=rows,
+        reviews_count=120,
+        likes_count=340,
+        status="ACTIVE"
+    )
+    return [
+        Book(
+            id=uuid.uuid4(),
+            author_id=author.id,
+            author=author,
+            title=f"Book title {i}",
+            description="Книга о том, как " * 10,
+            file_path=f"/books/{i}.pdf",
+            genres=["fantasy", "adventure"],
+            added_date=datetime(2025, 1, 1),
+            status=BookStatus.ACTIVE.value,
+            total_rating=3.75,
+            likes_count=i,
+            pages_count=320,
+            reviews_count=12
+        )
+        for i in range(rows)
+    ]
+
+
+def _search_response(books: List[BookResponseDTO]) -> CommonResponseModel:
+    return CommonResponseModel(
+        status=ResponseStatus.SUCCESS,
+        data_type=ResponseDataType.JSON,
+        data=BookSearchResponseDTO(
+            books=books,
+            total_count=len(books),
+            page_number=1,
+            page_size=len(books),
+            total_pages=1
+        )
+    )
+
+
+def _validated(books: List[Book]) -> bytes:
+    dtos = [BookResponseDTO(**dict(BookResponseDTO.from_entity(book, True))) for book in books]
+    return JSONResponse(jsonable_encoder(_search_response(dtos))).body
+
+
+def _constructed(books: List[Book]) -> bytes:
+    dtos = [BookResponseDTO.from_entity(book, True) for book in books]
+    return FastJSONResponse(_search_response(dtos)).body
+
+
+VARIANTS = {
+    "validated": _validated,
+    "fast": _constructed,
+}
+
+
+def _measure(variant: Callable[[List[Book]], bytes], books: List[Book], iterations: int) -> float:
+    # Warm up
+    variant(books)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        variant(books)
+    return (time.perf_counter() - started) / iterations
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", nargs="+", type=int, default=[20, 100, 1000])
+    parser.add_argument("--budget", type=int, default=20000, help="Rows serialised per variant and page size")
+    args = parser.parse_args(argv)
+
+    print(f"orjson: {'installed' if orjson is not None else 'not installed'}")
+
+    for rows in args.rows:
+        books = _make_books(rows)
+        iterations = max(1, args.budget // rows)
+
+        if json.loads(_validated(books)) != json.loads(_constructed(books)):
+            raise RuntimeError(f"Response bodies differ for {rows} rows")
+
+        baseline = None
+        for name, variant in VARIANTS.items():
+            elapsed = _measure(variant, books, iterations)
+            baseline = baseline or elapsed
+            print(f"{rows:>5} rows {name:<10} {elapsed * 1000:10.3f} ms  x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
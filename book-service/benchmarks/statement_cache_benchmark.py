@@ -0,0 +1,123 @@
+"""
+Measures client-side CPU per query for the hot book-service statements:
+statements built per call vs prebuilt ones, with and without asyncpg
+prepared statement reuse.
+
+Usage (from book-service directory, database env as for the service):
+    python -m benchmarks.statement_cache_benchmark --iterations 5000
+"""
+from src.services.user_book_status_service import STATUSED_BOOKS_COUNT_QUERY, STATUSED_BOOKS_QUERY
+from src.services.book_service import BOOK_BY_ID_QUERY
+from src.models.entities import Book, UserBookStatus
+from src.globals import DB_URL, DB_USER, DB_PASSWORD, DB_HOST, DB_NAME
+from src.models.enums import UserBookStatusEnum
+
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy import select, func, desc, and_
+from typing import Callable, List
+import argparse
+import asyncio
+import uuid
+import time
+
+
+def _fresh_book_by_id(book_id: uuid.UUID, user_id: uuid.UUID):
+    return [(select(Book).where(Book.id == book_id), None)]
+
+
+def _prebuilt_book_by_id(book_id: uuid.UUID, user_id: uuid.UUID):
+    return [(BOOK_BY_ID_QUERY, {"book_id": book_id})]
+
+
+def _fresh_statused_books(book_id: uuid.UUID, user_id: uuid.UUID):
+    query = select(UserBookStatus).where(
+        and_(
+            UserBookStatus.user_id == user_id,
+            UserBookStatus.status == UserBookStatusEnum.READING.value
+        )
+    ).order_by(desc(UserBookStatus.added_date))
+    return [
+        (select(func.count()).select_from(query.subquery()), None),
+        (query.offset(0).limit(20), None)
+    ]
+
+
+def _prebuilt_statused_books(book_id: uuid.UUID, user_id: uuid.UUID):
+    params = {"user_id": user_id, "status": UserBookStatusEnum.READING.value}
+    return [
+        (STATUSED_BOOKS_COUNT_QUERY, params),
+        (STATUSED_BOOKS_QUERY, {**params, "offset": 0, "limit": 20})
+    ]
+
+
+async def _measure(
+    connection: AsyncConnection,
+    build: Callable,
+    book_id: uuid.UUID,
+    user_id: uuid.UUID,
+    iterations: int
+) -> float:
+    async def _run_once():
+        for statement, params in build(book_id, user_id):
+            result = await connection.execute(statement, params)
+            result.all()
+
+    for _ in range(100):
+        await _run_once()
+
+    started = time.process_time()
+    for _ in range(iterations):
+        await _run_once()
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+async def _run(url: str, iterations: int) -> None:
+    cases = [
+        ("book by id", _fresh_book_by_id, _prebuilt_book_by_id),
+        ("statused books", _fresh_statused_books, _prebuilt_statused_books),
+    ]
+    modes = [
+        ("built per call, no prepared cache", 0, False),
+        ("built per call, prepared cache", 500, False),
+        ("prebuilt, prepared cache", 500, True),
+    ]
+
+    user_id = uuid.uuid4()
+    for name, fresh, prebuilt in cases:
+        baseline = None
+        for mode, prepared_cache_size, use_prebuilt in modes:
+            engine = create_async_engine(
+                url,
+                connect_args={"prepared_statement_cache_size": prepared_cache_size}
+            )
+            try:
+                async with engine.connect() as connection:
+                    book_id = (await connection.execute(select(Book.id).limit(1))).scalar() or uuid.uuid4()
+                    build = prebuilt if use_prebuilt else fresh
+                    cpu_us = await _measure(connection, build, book_id, user_id, iterations)
+            finally:
+                await engine.dispose()
+
+            baseline = baseline or cpu_us
+            print(f"{name:<16} {mode:<36} {cpu_us:8.1f} us CPU/request  x{baseline / cpu_us:.2f}")
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument(
+        "--db-url",
+        default=(DB_URL or "").format(
+            username=DB_USER,
+            password=DB_PASSWORD,
+            host=DB_HOST,
+            bd_name=DB_NAME
+        )
+    )
+    args = parser.parse_args(argv)
+
+    asyncio.run(_run(args.db_url, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
-from src.core.db_core import get_db_session
+from src.core.likes_counter_core import LikesCounterAggregator, get_likes_counter
+from src.core.db_core import get_db_session, get_read_db_session, get_query_db_session
+from src.core.db_pool_core import get_db_pool_metrics
+from src.core.book_import_core import BookImportJobRunner, get_book_import_jobs
 from src.middlewares.auth_middleware import extract_user_context
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import Depends, FastAPI, Query, Request
 
 DatabaseSession = Annotated[
@@ -10,11 +13,36 @@ DatabaseSession = Annotated[
     Depends(get_db_session)
 ]
 
+ReadDatabaseSession = Annotated[
+    AsyncSession,
+    Depends(get_read_db_session)
+]
+
+QueryDatabaseSession = Annotated[
+    AsyncSession,
+    Depends(get_query_db_session)
+]
+
+DatabasePoolMetrics = Annotated[
+    list,
+    Depends(get_db_pool_metrics)
+]
+
 UserContext = Annotated[
     object,
     Depends(extract_user_context)
 ]
 
+LikesCounter = Annotated[
+    Optional[LikesCounterAggregator],
+    Depends(get_likes_counter)
+]
+
+BookImportJobs = Annotated[
+    BookImportJobRunner,
+    Depends(get_book_import_jobs)
+]
+
 
 def get_common_params(
     page_number: int = Query(1, ge=0),
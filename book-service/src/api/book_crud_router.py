@@ -1,12 +1,12 @@
-from src.models.crud_request_dtos import BookCreateDTO, BookUpdateDTO
+from src.models.crud_request_dtos import BookCreateDTO, BookUpdateDTO, BookBatchRequestDTO
 from src.models.enums import ResponseDataType, ResponseStatus
 from src.middlewares.access_control import require_access
 from src.models.response_dtos import CommonResponseModel
-from src.annotations import DatabaseSession, UserContext
+from src.annotations import DatabaseSession, ReadDatabaseSession, QueryDatabaseSession, UserContext
 from src.services.book_service import BookService
 from src.models.enums import UserRole
+from src.utils.json_response import FastJSONResponse
 
-from fastapi.responses import JSONResponse
 from fastapi import APIRouter, Request
 import logging
 import uuid
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 book_crud_router = APIRouter(prefix="/books", tags=["Books CRUD"])
 
 
-@book_crud_router.post("/", response_class=JSONResponse, status_code=201)
+@book_crud_router.post("/", response_class=FastJSONResponse, status_code=201)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -31,14 +31,39 @@ async def create_book(
 ):
     book_service = BookService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await book_service.create_book(book_data, user_context)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await book_service.create_book(book_data, user_context)
+        ),
+        status_code=201
     )
 
 
-@book_crud_router.get("/{book_id}", response_class=JSONResponse, status_code=200)
+@book_crud_router.post("/batch", response_class=FastJSONResponse, status_code=200)
+@require_access(
+    allowed_roles=[UserRole.GUEST, UserRole.USER, UserRole.ADMIN],
+    require_authentication=False
+)
+async def get_books_batch(
+    request: Request,
+    db: QueryDatabaseSession,
+    user_context: UserContext,
+    batch_data: BookBatchRequestDTO
+):
+    book_service = BookService(db)
+
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await book_service.get_books_by_ids(batch_data.ids, user_context, batch_data.include_author)
+        )
+    )
+
+
+@book_crud_router.get("/{book_id}", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.GUEST, UserRole.USER, UserRole.ADMIN],
     require_authentication=False
@@ -46,19 +71,21 @@ async def create_book(
 async def get_book(
     request: Request,
     book_id: uuid.UUID,
-    db: DatabaseSession,
+    db: ReadDatabaseSession,
     user_context: UserContext
 ):  
     book_service = BookService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await book_service.get_book_by_id(book_id, user_context, include_author=True)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await book_service.get_book_by_id(book_id, user_context, include_author=True)
+        )
     )
 
 
-@book_crud_router.put("/{book_id}", response_class=JSONResponse, status_code=200)
+@book_crud_router.put("/{book_id}", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -72,14 +99,16 @@ async def update_book(
 ):
     book_service = BookService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await book_service.update_book(book_id, book_data, user_context)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await book_service.update_book(book_id, book_data, user_context)
+        )
     )
 
 
-@book_crud_router.delete("/{book_id}", response_class=JSONResponse, status_code=200)
+@book_crud_router.delete("/{book_id}", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -93,14 +122,16 @@ async def delete_book(
     book_service = BookService(db)
     await book_service.delete_book(book_id, user_context)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.STRING,
-        data="Book deleted successfully"
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data="Book deleted successfully"
+        )
     )
 
 
-@book_crud_router.get("/author/{author_id}", response_class=JSONResponse, status_code=200)
+@book_crud_router.get("/author/{author_id}", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.GUEST, UserRole.USER, UserRole.ADMIN],
     require_authentication=False
@@ -108,13 +139,15 @@ async def delete_book(
 async def get_books_by_author(
     request: Request,
     author_id: uuid.UUID,
-    db: DatabaseSession,
+    db: ReadDatabaseSession,
     user_context: UserContext
 ):
     book_service = BookService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await book_service.get_books_by_author(author_id, user_context, include_author=True)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await book_service.get_books_by_author(author_id, user_context, include_author=True)
+        )
     )
\ No newline at end of file
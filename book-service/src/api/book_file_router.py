@@ -2,11 +2,11 @@ from src.services.book_file_service import BookFileService
 from src.models.enums import ResponseDataType, ResponseStatus
 from src.middlewares.access_control import require_access
 from src.models.response_dtos import CommonResponseModel
-from src.annotations import DatabaseSession, UserContext
+from src.annotations import DatabaseSession, ReadDatabaseSession, UserContext
 from src.models.enums import BookStatus, UserRole
+from src.utils.json_response import FastJSONResponse
 
 from fastapi import APIRouter, Request, Query, Response, UploadFile, File
-from fastapi.responses import JSONResponse
 import logging
 import uuid
 
@@ -17,7 +17,7 @@ book_file_router = APIRouter(prefix="/books", tags=["Book Files"])
 
 
 
-@book_file_router.post("/{book_id}/content", response_class=JSONResponse, status_code=201)
+@book_file_router.post("/{book_id}/content", response_class=FastJSONResponse, status_code=201)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     allowed_statuses=[BookStatus.WAIT_FILE, BookStatus.ON_MODERATE, BookStatus.PRIVATE, BookStatus.ON_APILATION, BookStatus.ACTIVE],
@@ -32,14 +32,17 @@ async def add_book_content_file(
 ):
     book_file_service = BookFileService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await book_file_service.set_content_file(book_id, file, user_context)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await book_file_service.set_content_file(book_id, file, user_context)
+        ),
+        status_code=201
     )
 
 
-@book_file_router.post("/{book_id}/cover", response_class=JSONResponse, status_code=201)
+@book_file_router.post("/{book_id}/cover", response_class=FastJSONResponse, status_code=201)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -53,10 +56,13 @@ async def add_book_cover_file(
 ):
     book_file_service = BookFileService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await book_file_service.set_cover_file(book_id, file, user_context)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await book_file_service.set_cover_file(book_id, file, user_context)
+        ),
+        status_code=201
     )
 
 
@@ -69,7 +75,7 @@ async def add_book_cover_file(
 async def get_book_pages(
     request: Request,
     book_id: uuid.UUID,
-    db: DatabaseSession,
+    db: ReadDatabaseSession,
     user_context: UserContext,
     start_page: int = Query(..., ge=1),
     end_page: int = Query(..., ge=1)
@@ -93,7 +99,7 @@ async def get_book_page(
     request: Request,
     book_id: uuid.UUID,
     page_number: int,
-    db: DatabaseSession,
+    db: ReadDatabaseSession,
     user_context: UserContext
 ):
     book_file_service = BookFileService(db)
@@ -114,7 +120,7 @@ async def get_book_page(
 async def get_full_book_file(
     request: Request,
     book_id: uuid.UUID,
-    db: DatabaseSession,
+    db: ReadDatabaseSession,
     user_context: UserContext
 ):
     book_file_service = BookFileService(db)
@@ -135,7 +141,7 @@ async def get_full_book_file(
 async def get_cover(
     request: Request,
     book_id: uuid.UUID,
-    db: DatabaseSession,
+    db: ReadDatabaseSession,
     user_context: UserContext
 ):
     book_file_service = BookFileService(db)
@@ -0,0 +1,79 @@
+from src.models.enums import ResponseDataType, ResponseStatus
+from src.exceptions.code_exceptions import NotFoundException
+from src.middlewares.access_control import require_access
+from src.models.response_dtos import CommonResponseModel
+from src.annotations import BookImportJobs, UserContext
+from src.models.enums import UserRole
+from src.utils.json_response import FastJSONResponse
+
+from fastapi import APIRouter, Request, UploadFile, File
+from typing import Optional
+import tempfile
+import asyncio
+import logging
+import shutil
+import os
+
+logger = logging.getLogger(__name__)
+book_import_router = APIRouter(prefix="/books", tags=["Books import"])
+
+
+@book_import_router.post("/import", response_class=FastJSONResponse, status_code=202)
+@require_access(
+    allowed_roles=[UserRole.ADMIN],
+    require_authentication=True
+)
+async def import_books(
+    request: Request,
+    user_context: UserContext,
+    book_import_jobs: BookImportJobs,
+    manifest: UploadFile = File(...),
+    archive: Optional[UploadFile] = File(None)
+):
+    # The uploads are only readable during the request, the job runs on from the copies
+    work_dir = tempfile.mkdtemp(prefix="book-import-")
+    try:
+        archive_path = None
+        if archive:
+            archive_path = os.path.join(work_dir, "archive.zip")
+            with open(archive_path, "wb") as f:
+                await asyncio.to_thread(shutil.copyfileobj, archive.file, f)
+
+        manifest_lines = (await manifest.read()).decode().splitlines()
+        job = await book_import_jobs.start(manifest_lines, work_dir, archive_path)
+    except Exception:
+        await asyncio.to_thread(shutil.rmtree, work_dir, True)
+        raise
+
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=job
+        ),
+        status_code=202
+    )
+
+
+@book_import_router.get("/import/{job_id}", response_class=FastJSONResponse, status_code=200)
+@require_access(
+    allowed_roles=[UserRole.ADMIN],
+    require_authentication=True
+)
+async def get_import_job(
+    request: Request,
+    job_id: str,
+    user_context: UserContext,
+    book_import_jobs: BookImportJobs
+):
+    job = await book_import_jobs.get(job_id)
+    if job is None:
+        raise NotFoundException("Import job not found")
+
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=job
+        )
+    )
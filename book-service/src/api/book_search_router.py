@@ -1,12 +1,13 @@
-from src.annotations import DatabaseSession, UserContext, CommonParams
+from src.annotations import ReadDatabaseSession, UserContext, CommonParams
 from src.services.book_search_service import BookSearchService
+from src.services.author_search_service import AuthorSearchService
 from src.models.enums import ResponseDataType, ResponseStatus
 from src.middlewares.access_control import require_access
 from src.models.response_dtos import CommonResponseModel
 from src.models.enums import UserRole
+from src.utils.json_response import FastJSONResponse
 
 from fastapi import APIRouter, Request, Query
-from fastapi.responses import JSONResponse
 from typing import Optional
 from datetime import datetime
 import logging
@@ -17,14 +18,14 @@ logger = logging.getLogger(__name__)
 book_search_router = APIRouter(tags=["Book Search"])
 
 
-@book_search_router.get("/books/search", response_class=JSONResponse, status_code=200)
+@book_search_router.get("/books/search", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.GUEST, UserRole.USER, UserRole.ADMIN],
     require_authentication=False
 )
 async def search_books(
     request: Request,
-    db: DatabaseSession,
+    db: ReadDatabaseSession,
     user_context: UserContext,
     common_params: CommonParams,
     # Фильтры по книге
@@ -105,15 +106,56 @@ async def search_books(
     
     search_service = BookSearchService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await search_service.search_books(
-            user_context=user_context,
-            search_params=search_params,
-            page_number=common_params['page_number'],
-            page_size=common_params['page_size'],
-            sort_by=common_params['sort_by'],
-            sort_order=common_params['sort_order']
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await search_service.search_books(
+                user_context=user_context,
+                search_params=search_params,
+                page_number=common_params['page_number'],
+                page_size=common_params['page_size'],
+                sort_by=common_params['sort_by'],
+                sort_order=common_params['sort_order']
+            )
+        )
+    )
+
+
+@book_search_router.get("/authors/search", response_class=FastJSONResponse, status_code=200)
+@require_access(
+    allowed_roles=[UserRole.GUEST, UserRole.USER, UserRole.ADMIN],
+    require_authentication=False
+)
+async def search_authors(
+    request: Request,
+    db: ReadDatabaseSession,
+    user_context: UserContext,
+    common_params: CommonParams,
+    # Префикс или похожее имя автора
+    key: Optional[str] = Query(None),
+    # Курсор следующей страницы из предыдущего ответа
+    cursor: Optional[str] = Query(None)
+):
+    search_params = {}
+
+    if key:
+        search_params['key'] = key
+
+    search_service = AuthorSearchService(db)
+
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await search_service.search_authors(
+                user_context=user_context,
+                search_params=search_params,
+                page_number=common_params['page_number'],
+                page_size=common_params['page_size'],
+                sort_by=common_params['sort_by'],
+                sort_order=common_params['sort_order'],
+                cursor=cursor
+            )
         )
     )
@@ -0,0 +1,30 @@
+from src.models.enums import UserRole, ResponseStatus, ResponseDataType
+from src.annotations import DatabasePoolMetrics, UserContext
+from src.middlewares.access_control import require_access
+from src.models.response_dtos import CommonResponseModel
+from src.utils.json_response import FastJSONResponse
+
+from fastapi import APIRouter, Request
+import logging
+
+logger = logging.getLogger(__name__)
+metrics_router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@metrics_router.get("/db-pool", response_class=FastJSONResponse, status_code=200)
+@require_access(
+    allowed_roles=[UserRole.ADMIN],
+    require_authentication=True
+)
+async def get_db_pool_metrics(
+    request: Request,
+    user_context: UserContext,
+    pool_metrics: DatabasePoolMetrics
+):
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=pool_metrics
+        )
+    )
@@ -5,8 +5,8 @@ from src.middlewares.access_control import require_access
 from src.models.response_dtos import CommonResponseModel
 from src.annotations import DatabaseSession, UserContext
 from src.models.enums import UserRole
+from src.utils.json_response import FastJSONResponse
 
-from fastapi.responses import JSONResponse
 from fastapi import APIRouter, Request
 import logging
 import uuid
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 status_router = APIRouter(tags=["Status Management"])
 
 
-@status_router.put("/books/{book_id}/system-status", response_class=JSONResponse, status_code=200)
+@status_router.put("/books/{book_id}/system-status", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -31,14 +31,16 @@ async def update_book_status(
 ):
     status_service = StatusService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await status_service.update_book_status(book_id, status_data, user_context)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await status_service.update_book_status(book_id, status_data, user_context)
+        )
     )
 
 
-@status_router.put("/authors/{author_id}/system-status", response_class=JSONResponse, status_code=200)
+@status_router.put("/authors/{author_id}/system-status", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -52,8 +54,10 @@ async def update_author_profile_status(
 ):
     status_service = StatusService(db)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await status_service.update_author_profile_status(author_id, status_data, user_context)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await status_service.update_author_profile_status(author_id, status_data, user_context)
+        )
     )
@@ -1,12 +1,12 @@
 from src.models.crud_request_dtos import UserBookStatusCreateDTO, UserBookReadingStatusEndPageUpdateDTO, UserBookStatusUpdateDTO
 from src.services.user_book_status_service import UserBookStatusService
-from src.annotations import CommonParams, DatabaseSession, UserContext
+from src.annotations import CommonParams, DatabaseSession, ReadDatabaseSession, UserContext
 from src.models.enums import ResponseDataType, ResponseStatus
 from src.models.enums import UserBookStatusEnum, UserRole
 from src.middlewares.access_control import require_access
 from src.models.response_dtos import CommonResponseModel
+from src.utils.json_response import FastJSONResponse
 
-from fastapi.responses import JSONResponse
 from fastapi import APIRouter, Query, Request
 import logging
 import uuid
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 user_book_statuses_router = APIRouter(tags=["User Statuses Managment"])
 
 
-@user_book_statuses_router.post("/books/{book_id}/user-status", response_class=JSONResponse, status_code=201)
+@user_book_statuses_router.post("/books/{book_id}/user-status", response_class=FastJSONResponse, status_code=201)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -30,15 +30,18 @@ async def add_user_book_status(
     status_service = UserBookStatusService(db, user_context)
     await status_service.add_status(book_id, create_status_dto)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.STRING,
-        data="Status added successfully"
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data="Status added successfully"
+        ),
+        status_code=201
     )
 
 
 
-@user_book_statuses_router.put("/books/{book_id}/user-status/end-page", response_class=JSONResponse, status_code=200)
+@user_book_statuses_router.put("/books/{book_id}/user-status/end-page", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -53,14 +56,16 @@ async def update_end_page_status(
     status_service = UserBookStatusService(db, user_context)
     await status_service.update_end_page(book_id, update_end_page_dto)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.STRING,
-        data="End page updated successfully"
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data="End page updated successfully"
+        )
     )
 
 
-@user_book_statuses_router.put("/books/{book_id}/user-status", response_class=JSONResponse, status_code=200)
+@user_book_statuses_router.put("/books/{book_id}/user-status", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -75,14 +80,16 @@ async def update_user_book_status(
     status_service = UserBookStatusService(db, user_context)
     await status_service.update_status(book_id, update_status_dto)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.STRING,
-        data="Status updated successfully"
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data="Status updated successfully"
+        )
     )
 
 
-@user_book_statuses_router.delete("/books/{book_id}/user-status", response_class=JSONResponse, status_code=200)
+@user_book_statuses_router.delete("/books/{book_id}/user-status", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -96,14 +103,16 @@ async def delete_status(
     status_service = UserBookStatusService(db, user_context)
     await status_service.delete_status(book_id)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.STRING,
-        data="Status deleted successfully"
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data="Status deleted successfully"
+        )
     )
 
 
-@user_book_statuses_router.get("/books/user-status", response_class=JSONResponse, status_code=200)
+@user_book_statuses_router.get("/books/user-status", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -111,15 +120,17 @@ async def delete_status(
 async def get_statused_books(
     request: Request,
     pagination: CommonParams,
-    db: DatabaseSession,
+    db: ReadDatabaseSession,
     user_context: UserContext,
     status: UserBookStatusEnum = Query(None),
 ):
     status_service = UserBookStatusService(db, user_context)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await status_service.get_statused_books(status, pagination)
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await status_service.get_statused_books(status, pagination)
+        )
     )
 
@@ -0,0 +1,81 @@
+"""
+Imports books from a JSONL manifest.
+
+Every manifest line is a JSON object:
+    {"external_id": "...", "author_id": "...", "title": "...", "description": "...",
+     "genres": ["..."], "file": "relative/path.pdf", "cover": "relative/path.jpg"}
+
+Usage (from book-service directory):
+    python -m src.cli.book_import_cli --manifest books.jsonl --source files/ --report report.jsonl
+
+`--source` is a directory or a zip archive with the files. Rerunning with the
+same report skips items that are already imported.
+"""
+from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig
+from src.services.book_import_service import BookImportService, create_import_executor
+from src.core.logging_core import setup_logging
+from src.core.db_core import init_engine
+from src.globals import (
+    DB_HOST, DB_URL, DB_USER, DB_PASSWORD, DB_NAME, LOGS_FILENAME, LOGS_FORMAT, LOGS_LEVEL,
+    BOOK_IMPORT_WORKERS, BOOK_IMPORT_CHUNK_SIZE
+)
+
+from fastapi import FastAPI
+import tempfile
+import argparse
+import asyncio
+import os
+
+
+async def run_import(manifest: str, source: str, report: str, workers: int, chunk_size: int) -> None:
+    app = FastAPI()
+    await init_engine(
+        app=app,
+        db_config=DatabaseConfig(
+            db_url=DB_URL,
+            db_username=DB_USER,
+            db_password=DB_PASSWORD,
+            db_host=DB_HOST,
+            db_name=DB_NAME
+        ),
+        pool_config=PoolConfig(),
+        connection_config=ConnectionConfig()
+    )
+
+    executor = create_import_executor(workers)
+    try:
+        with tempfile.TemporaryDirectory() as extract_dir, open(manifest) as manifest_file:
+            async with app.state.db_session_maker() as session:
+                book_import_service = BookImportService(session, executor, chunk_size)
+
+                source_dir = source
+                if os.path.isfile(source):
+                    book_import_service.extract_archive(source, extract_dir)
+                    source_dir = extract_dir
+
+                result = await book_import_service.import_books(manifest_file, source_dir, report)
+    finally:
+        await asyncio.to_thread(executor.shutdown)
+        await app.state.db_engine.dispose()
+
+    print(
+        f"Imported: {result.imported_count}, skipped: {result.skipped_count}, "
+        f"failed: {result.failed_count}, report: {report}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk book import")
+    parser.add_argument("--manifest", required=True, help="JSONL manifest")
+    parser.add_argument("--source", required=True, help="Directory or zip archive with book files")
+    parser.add_argument("--report", required=True, help="JSONL report, also used to resume")
+    parser.add_argument("--workers", type=int, default=BOOK_IMPORT_WORKERS)
+    parser.add_argument("--chunk-size", type=int, default=BOOK_IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    setup_logging(logs_filename=LOGS_FILENAME, logs_format=LOGS_FORMAT, logs_level=LOGS_LEVEL)
+    asyncio.run(run_import(args.manifest, args.source, args.report, args.workers, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
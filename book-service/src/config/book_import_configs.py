@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+@dataclass
+class BookImportConfig:
+    workers: int = 1
+    chunk_size: int = 500
+    # Job states and reports are kept in Redis, so any replica can answer a poll
+    job_ttl: int = 24 * 60 * 60
+    job_key_prefix: str = "books:import:"
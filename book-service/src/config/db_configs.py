@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
 
 @dataclass
 class DatabaseConfig:
@@ -11,10 +12,10 @@ class DatabaseConfig:
 @dataclass
 class PoolConfig:
     pool_size: int = 10
-    max_overflows: int = 1
-    pool_timeout: int = 10
-    pool_recycle: int = 10
-    pool_pre_ping: int = 10
+    max_overflows: int = 10
+    pool_timeout: float = 10.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = False
     echo: bool = False
     echo_pool: bool = False
     hide_parameters: bool = True
@@ -22,4 +23,13 @@ class PoolConfig:
 @dataclass
 class ConnectionConfig:
     max_connections_retries: int = 5
-    retry_delay: int = 3
\ No newline at end of file
+    retry_delay: int = 3
+    prepared_statement_cache_size: int = 500
+    query_cache_size: int = 1200
+
+@dataclass
+class ReplicaConfig:
+    hosts: List[str] = field(default_factory=list)
+    max_lag: float = 5.0
+    sticky_seconds: float = 10.0
+    lag_check_interval: float = 2.0
@@ -0,0 +1,6 @@
+from dataclasses import dataclass
+
+@dataclass
+class LikesCounterConfig:
+    write_behind: bool = False
+    flush_interval: float = 1.0
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+@dataclass
+class ReviewEventsConfig:
+    stream: str = "review-events"
+    group: str = "book-service"
+    consumer_name: str = "book-service"
+    batch_size: int = 100
+    block_ms: int = 1000
+    retry_delay: float = 1.0
+    # Malformed entries and entries that failed max_deliveries times are moved here
+    dead_letter_stream: str = "review-events:dead"
+    max_deliveries: int = 5
+    # Entries another consumer read but did not acknowledge for this long are claimed
+    claim_idle_ms: int = 5 * 60 * 1000
+    claim_interval: float = 60.0
+    processed_retention: float = 24 * 60 * 60
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+@dataclass
+class AuthorStatisticsConfig:
+    reconcile_enabled: bool = True
+    reconcile_interval: float = 600.0
+    reconcile_batch_size: int = 500
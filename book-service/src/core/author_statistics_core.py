@@ -0,0 +1,56 @@
+from src.services.author_statistics_service import AuthorStatisticsService
+from src.config.statistics_configs import AuthorStatisticsConfig
+
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI
+import asyncio
+import logging
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def reconcile_author_statistics(session_maker, batch_size: int) -> None:
+    last_id = None
+    batches = 0
+
+    while True:
+        async with session_maker() as session:
+            last_id = await AuthorStatisticsService(session).reconcile_batch(last_id, batch_size)
+
+        if last_id is None:
+            break
+
+        batches += 1
+        # Let request handlers use the pool between batches
+        await asyncio.sleep(0)
+
+    logger.info(f"Author statistics reconciled in {batches} batches")
+
+
+async def _reconciliation_loop(session_maker, config: AuthorStatisticsConfig) -> None:
+    while True:
+        await asyncio.sleep(config.reconcile_interval)
+        try:
+            await reconcile_author_statistics(session_maker, config.reconcile_batch_size)
+        except Exception as e:
+            logger.error(f"Author statistics reconciliation failed: {e}")
+
+
+@asynccontextmanager
+async def author_statistics_init(app: FastAPI, config: AuthorStatisticsConfig) -> None:
+    if not config.reconcile_enabled:
+        yield
+        return
+
+    reconciliation_task = asyncio.create_task(
+        _reconciliation_loop(app.state.db_session_maker, config)
+    )
+    logger.info("Author statistics reconciliation started")
+
+    try:
+        yield
+    finally:
+        reconciliation_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await reconciliation_task
+        logger.info("Author statistics reconciliation stopped")
@@ -0,0 +1,117 @@
+from src.services.book_import_service import BookImportService, create_import_executor
+from src.models.response_dtos import BookImportJobDTO
+from src.config.book_import_configs import BookImportConfig
+from src.models.enums import BookImportJobStatus
+
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, List, Optional, Set
+from fastapi import FastAPI, Request
+from redis.asyncio import Redis
+import asyncio
+import logging
+import shutil
+import uuid
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class BookImportJobRunner:
+    """
+    Runs imports started over the API as background jobs on a process pool
+    shared by the service. Job states and reports are stored in Redis, so
+    any replica answers a poll. Jobs still running on shutdown are marked
+    failed, a rerun skips the books they already imported.
+    """
+
+    def __init__(self, redis_client: Redis, session_maker, config: BookImportConfig):
+        self._redis_client = redis_client
+        self._session_maker = session_maker
+        self._config = config
+        self._executor = create_import_executor(config.workers)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _key(self, job_id: str) -> str:
+        return self._config.job_key_prefix + job_id
+
+    async def _save(self, job: BookImportJobDTO) -> None:
+        await self._redis_client.set(self._key(job.job_id), job.model_dump_json(), ex=self._config.job_ttl)
+
+    async def _save_progress(self, job: BookImportJobDTO) -> None:
+        # A missed update only delays the progress seen by pollers
+        try:
+            await self._save(job)
+        except Exception as e:
+            logger.error(f"Failed to save book import job {job.job_id}: {e}")
+
+    async def get(self, job_id: str) -> Optional[BookImportJobDTO]:
+        raw = await self._redis_client.get(self._key(job_id))
+        if raw is None:
+            return None
+        return BookImportJobDTO.model_validate_json(raw)
+
+    async def start(self, manifest_lines: List[str], work_dir: str, archive_path: Optional[str]) -> BookImportJobDTO:
+        """Takes ownership of `work_dir`, it is removed when the job ends."""
+        job = BookImportJobDTO(job_id=str(uuid.uuid4()), status=BookImportJobStatus.RUNNING)
+        await self._save(job)
+
+        task = asyncio.create_task(self._run(job, manifest_lines, work_dir, archive_path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(
+        self,
+        job: BookImportJobDTO,
+        manifest_lines: List[str],
+        work_dir: str,
+        archive_path: Optional[str]
+    ) -> None:
+        async def _on_progress(processed_count: int, total_count: int) -> None:
+            job.processed_count = processed_count
+            job.total_count = total_count
+            await self._save_progress(job)
+
+        try:
+            if archive_path:
+                await asyncio.to_thread(BookImportService.extract_archive, archive_path, work_dir)
+
+            async with self._session_maker() as session:
+                book_import_service = BookImportService(session, self._executor, self._config.chunk_size)
+                job.report = await book_import_service.import_books(manifest_lines, work_dir, on_progress=_on_progress)
+            job.status = BookImportJobStatus.FINISHED
+        except asyncio.CancelledError:
+            job.status = BookImportJobStatus.FAILED
+            job.message = "Import was interrupted by a service shutdown"
+            raise
+        except Exception as e:
+            logger.exception(e)
+            job.status = BookImportJobStatus.FAILED
+            job.message = str(e)
+        finally:
+            await self._save_progress(job)
+            await asyncio.to_thread(shutil.rmtree, work_dir, True)
+            logger.info(f"Book import job {job.job_id} ended: {job.status.value}")
+
+    async def shutdown(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        # Joining the workers blocks, keep it off the event loop
+        await asyncio.to_thread(self._executor.shutdown, wait=True, cancel_futures=True)
+
+
+@asynccontextmanager
+async def book_import_init(app: FastAPI, config: BookImportConfig) -> None:
+    app.state.book_import_jobs = BookImportJobRunner(app.state.redis_client, app.state.db_session_maker, config)
+    logger.info(f"Book import pool started with {config.workers} workers")
+
+    try:
+        yield
+    finally:
+        await app.state.book_import_jobs.shutdown()
+        logger.info("Book import pool stopped")
+
+
+async def get_book_import_jobs(req: Request) -> AsyncGenerator[BookImportJobRunner, None]:
+    yield req.app.state.book_import_jobs
@@ -0,0 +1,117 @@
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy import event
+from fastapi import Request
+from typing import AsyncGenerator, Dict, List
+import time
+
+# Upper bounds of the checkout wait histogram, in milliseconds
+CHECKOUT_WAIT_BUCKETS_MS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.checkout_wait_buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+        self.overflow_peak = 0
+
+    def observe_checkout_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.checkout_wait_total += seconds
+        self.checkout_wait_max = max(self.checkout_wait_max, seconds)
+
+        wait_ms = seconds * 1000
+        for index, bound in enumerate(CHECKOUT_WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                self.checkout_wait_buckets[index] += 1
+                return
+        self.checkout_wait_buckets[-1] += 1
+
+    def observe_overflow(self, overflow: int) -> None:
+        self.overflow_peak = max(self.overflow_peak, overflow)
+
+    def snapshot(self, pool: Pool) -> dict:
+        buckets = {
+            f"le_{bound:g}ms": count
+            for bound, count in zip(CHECKOUT_WAIT_BUCKETS_MS, self.checkout_wait_buckets)
+        }
+        buckets["le_inf"] = self.checkout_wait_buckets[-1]
+
+        return {
+            "name": self.name,
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "overflow_peak": self.overflow_peak,
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "checkout_wait_avg_ms": (self.checkout_wait_total / self.checkouts * 1000) if self.checkouts else 0.0,
+            "checkout_wait_max_ms": self.checkout_wait_max * 1000,
+            "checkout_wait_buckets": buckets,
+            "connects": self.connects,
+            "closes": self.closes,
+            "invalidations": self.invalidations
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that times how long checkouts wait for a free connection.
+    Metrics survive `recreate()`, which the engine calls on dispose.
+    """
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.checkout_timeouts += 1
+            raise
+
+        self.metrics.observe_checkout_wait(time.perf_counter() - started_at)
+        self.metrics.observe_overflow(self.overflow())
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_pool(pool: InstrumentedQueuePool, name: str) -> PoolMetrics:
+    metrics = PoolMetrics(name)
+    pool.metrics = metrics
+
+    # Listeners registered on a pool are carried over by recreate()
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        metrics.connects += 1
+
+    @event.listens_for(pool, "close")
+    def _on_close(dbapi_connection, connection_record) -> None:
+        metrics.closes += 1
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+        metrics.invalidations += 1
+
+    return metrics
+
+
+async def get_db_pool_metrics(req: Request) -> AsyncGenerator[List[dict], None]:
+    engines: Dict[str, AsyncEngine] = req.app.state.db_engines
+    yield [
+        engine.sync_engine.pool.metrics.snapshot(engine.sync_engine.pool)
+        for engine in engines.values()
+    ]
@@ -0,0 +1,117 @@
+from src.models.entities import Base
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Optional, Tuple, Type, TypeVar
+from sqlalchemy import UUID, Select, any_, bindparam, inspect, select
+from sqlalchemy.dialects.postgresql import ARRAY
+import asyncio
+import logging
+import uuid
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+ENTITY_LOADER_SESSION_KEY = "entity_loader"
+
+EntityType = TypeVar("EntityType", bound=Base)
+
+# One prebuilt statement per entity type. The ids are sent as a single array
+# parameter so every batch size shares one prepared statement
+_BY_IDS_QUERIES: Dict[Type[Base], Select] = {}
+
+
+def _get_by_ids_query(entity_type: Type[Base]) -> Select:
+    query = _BY_IDS_QUERIES.get(entity_type)
+    if query is None:
+        query = select(entity_type).where(entity_type.id == any_(bindparam("ids", type_=ARRAY(UUID))))
+        _BY_IDS_QUERIES[entity_type] = query
+    return query
+
+
+class EntityLoader:
+    """
+    Per-session primary key loader. Lookups issued in the same event loop
+    tick are sent as one `WHERE id = ANY(...)` query per entity type and the
+    results are memoised until the session expires them.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self._db_session = db_session
+        self._pending: Dict[Type[Base], Dict[uuid.UUID, asyncio.Future]] = {}
+        self._cache: Dict[Tuple[Type[Base], uuid.UUID], Optional[Base]] = {}
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    async def load(self, entity_type: Type[EntityType], entity_id: uuid.UUID) -> Optional[EntityType]:
+        key = (entity_type, entity_id)
+        if key in self._cache:
+            entity = self._cache[key]
+            if entity is None or self._is_fresh(entity):
+                return entity
+            del self._cache[key]
+
+        pending = self._pending.setdefault(entity_type, {})
+        future = pending.get(entity_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            pending[entity_id] = future
+
+        # The task starts after the callbacks already queued in this tick,
+        # so sibling coroutines get to add their keys to the same batch
+        if self._dispatch_task is None:
+            self._dispatch_task = asyncio.create_task(self._dispatch())
+
+        return await future
+
+    def forget(self, entity_type: Type[Base], entity_id: uuid.UUID) -> None:
+        self._cache.pop((entity_type, entity_id), None)
+
+    @staticmethod
+    def _is_fresh(entity: Base) -> bool:
+        state = inspect(entity)
+        return not (state.expired_attributes or state.deleted or state.detached)
+
+    async def _dispatch(self) -> None:
+        try:
+            # A single session cannot run queries concurrently, keys that
+            # arrive while a batch is in flight are picked up by the next round
+            while self._pending:
+                batches, self._pending = self._pending, {}
+
+                for entity_type, futures in batches.items():
+                    await self._load_batch(entity_type, futures)
+        finally:
+            self._dispatch_task = None
+
+    async def _load_batch(
+        self,
+        entity_type: Type[Base],
+        futures: Dict[uuid.UUID, asyncio.Future]
+    ) -> None:
+        try:
+            result = await self._db_session.execute(
+                _get_by_ids_query(entity_type),
+                {"ids": list(futures)}
+            )
+            entities = {entity.id: entity for entity in result.scalars().all()}
+        except BaseException as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        logger.debug(f"Loaded {len(entities)}/{len(futures)} {entity_type.__name__} entities in one query")
+
+        for entity_id, future in futures.items():
+            entity = entities.get(entity_id)
+            self._cache[(entity_type, entity_id)] = entity
+            if not future.done():
+                future.set_result(entity)
+
+
+def get_entity_loader(db_session: AsyncSession) -> EntityLoader:
+    loader = db_session.info.get(ENTITY_LOADER_SESSION_KEY)
+    if loader is None:
+        loader = EntityLoader(db_session)
+        db_session.info[ENTITY_LOADER_SESSION_KEY] = loader
+    return loader
@@ -0,0 +1,101 @@
+from src.config.likes_configs import LikesCounterConfig
+from src.models.entities import AuthorProfile, Book
+
+from sqlalchemy import select, update, values, column, func, Integer, UUID
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, Dict, Optional
+from fastapi import FastAPI, Request
+from collections import defaultdict
+import asyncio
+import logging
+import uuid
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class LikesCounterAggregator:
+    """
+    Write-behind buffer for books and authors likes_count. Like and unlike
+    bursts are summed per book in memory and applied every flush interval.
+    """
+
+    def __init__(self, session_maker, flush_interval: float):
+        self._session_maker = session_maker
+        self._flush_interval = flush_interval
+        self._deltas: Dict[uuid.UUID, int] = defaultdict(int)
+
+    def add(self, book_id: uuid.UUID, delta: int) -> None:
+        self._deltas[book_id] += delta
+
+    async def flush(self) -> None:
+        deltas = {book_id: delta for book_id, delta in self._deltas.items() if delta}
+        self._deltas = defaultdict(int)
+
+        if not deltas:
+            return
+
+        deltas_table = values(
+            column("book_id", UUID),
+            column("delta", Integer),
+            name="deltas"
+        ).data(list(deltas.items()))
+
+        try:
+            async with self._session_maker() as session:
+                await session.execute(
+                    update(Book)
+                    .where(Book.id == deltas_table.c.book_id)
+                    .values(likes_count=Book.likes_count + deltas_table.c.delta)
+                )
+
+                author_deltas = (
+                    select(Book.author_id, func.sum(deltas_table.c.delta).label("delta"))
+                    .join(deltas_table, Book.id == deltas_table.c.book_id)
+                    .group_by(Book.author_id)
+                    .subquery()
+                )
+                await session.execute(
+                    update(AuthorProfile)
+                    .where(AuthorProfile.id == author_deltas.c.author_id)
+                    .values(likes_count=func.coalesce(AuthorProfile.likes_count, 0) + author_deltas.c.delta)
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to flush likes counters, retrying later: {e}")
+            for book_id, delta in deltas.items():
+                self._deltas[book_id] += delta
+            return
+
+        logger.debug(f"Flushed likes counters of {len(deltas)} books")
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+
+@asynccontextmanager
+async def likes_counter_init(app: FastAPI, config: LikesCounterConfig) -> None:
+    if not config.write_behind:
+        app.state.likes_counter = None
+        yield
+        return
+
+    aggregator = LikesCounterAggregator(app.state.db_session_maker, config.flush_interval)
+    app.state.likes_counter = aggregator
+
+    flush_task = asyncio.create_task(aggregator.run())
+    logger.info("Likes counter write-behind started")
+
+    try:
+        yield
+    finally:
+        flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await flush_task
+        await aggregator.flush()
+        logger.info("Likes counter write-behind stopped")
+
+
+async def get_likes_counter(req: Request) -> AsyncGenerator[Optional[LikesCounterAggregator], None]:
+    yield req.app.state.likes_counter
@@ -0,0 +1,184 @@
+from src.config.review_events_configs import ReviewEventsConfig
+from src.services.review_events_service import ReviewEventsService
+
+from contextlib import asynccontextmanager, suppress
+from redis.exceptions import ResponseError
+from redis.asyncio import Redis
+from fastapi import FastAPI
+import asyncio
+import logging
+import time
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ReviewEventsConsumer:
+    """
+    Reads review events with a consumer group and acknowledges them only
+    after they are committed. The consumer re-reads its own pending entries
+    after every failed batch, and on start and every claim_interval claims
+    entries idle for claim_idle_ms from any consumer of the group, such as
+    one whose container was recreated under another hostname. Malformed
+    entries, and pending entries delivered max_deliveries times, are moved
+    to the dead letter stream so they cannot block the entries behind them.
+    """
+
+    def __init__(self, redis_client: Redis, session_maker, config: ReviewEventsConfig):
+        self._redis_client = redis_client
+        self._session_maker = session_maker
+        self._config = config
+        self._read_pending = True
+        self._last_prune = 0.0
+        self._last_claim = 0.0
+
+    async def _ensure_group(self) -> None:
+        try:
+            await self._redis_client.xgroup_create(
+                self._config.stream, self._config.group, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _read_batch(self) -> list:
+        response = await self._redis_client.xreadgroup(
+            self._config.group,
+            self._config.consumer_name,
+            {self._config.stream: "0" if self._read_pending else ">"},
+            count=self._config.batch_size,
+            block=None if self._read_pending else self._config.block_ms
+        )
+        if not response:
+            return []
+
+        _, entries = response[0]
+        return entries
+
+    async def _get_exhausted_ids(self, entries: list) -> set:
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            for entry_id, _ in entries:
+                pipe.xpending_range(
+                    self._config.stream,
+                    self._config.group,
+                    min=entry_id,
+                    max=entry_id,
+                    count=1,
+                    consumername=self._config.consumer_name
+                )
+            pending = await pipe.execute()
+
+        return {
+            item["message_id"] for items in pending for item in items
+            if item["times_delivered"] > self._config.max_deliveries
+        }
+
+    async def _dead_letter(self, entry_id: bytes, fields: dict, reason: str) -> None:
+        logger.error(f"Review event {entry_id} is moved to {self._config.dead_letter_stream}: {reason}")
+        await self._redis_client.xadd(
+            self._config.dead_letter_stream,
+            {**fields, "entry_id": entry_id, "error": reason}
+        )
+        await self._redis_client.xack(self._config.stream, self._config.group, entry_id)
+
+    async def _handle_batch(self, entries: list, redelivered: bool) -> None:
+        exhausted_ids = await self._get_exhausted_ids(entries) if redelivered else set()
+
+        entry_ids = []
+        events = []
+        for entry_id, fields in entries:
+            if entry_id in exhausted_ids:
+                await self._dead_letter(entry_id, fields, f"not applied after {self._config.max_deliveries} deliveries")
+                continue
+            try:
+                events.append(ReviewEventsService.parse_event(fields))
+            except ValueError as e:
+                await self._dead_letter(entry_id, fields, str(e))
+                continue
+            entry_ids.append(entry_id)
+
+        if not entry_ids:
+            return
+
+        async with self._session_maker() as session:
+            applied = await ReviewEventsService(session).apply_events(events)
+
+        await self._redis_client.xack(self._config.stream, self._config.group, *entry_ids)
+        logger.debug(f"Applied {applied} of {len(entries)} review events")
+
+    async def _claim_idle(self) -> None:
+        if time.monotonic() - self._last_claim < self._config.claim_interval:
+            return
+
+        start_id = "0-0"
+        while True:
+            next_id, entries, *_ = await self._redis_client.xautoclaim(
+                self._config.stream,
+                self._config.group,
+                self._config.consumer_name,
+                min_idle_time=self._config.claim_idle_ms,
+                start_id=start_id,
+                count=self._config.batch_size
+            )
+            # Entries trimmed from the stream come back without fields
+            entries = [entry for entry in entries if entry and entry[1]]
+            if entries:
+                logger.warning(f"Claimed {len(entries)} idle review events")
+                await self._handle_batch(entries, redelivered=True)
+
+            if next_id in (b"0-0", "0-0"):
+                break
+            start_id = next_id
+
+        self._last_claim = time.monotonic()
+
+    async def _prune(self) -> None:
+        if time.monotonic() - self._last_prune < self._config.processed_retention / 24:
+            return
+
+        async with self._session_maker() as session:
+            await ReviewEventsService(session).prune_processed_events(self._config.processed_retention)
+        self._last_prune = time.monotonic()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self._ensure_group()
+                break
+            except Exception as e:
+                logger.error(f"Cannot create review events group: {e}")
+                await asyncio.sleep(self._config.retry_delay)
+
+        while True:
+            try:
+                await self._claim_idle()
+
+                entries = await self._read_batch()
+
+                if not entries:
+                    # Pending entries are drained, switch to new ones
+                    self._read_pending = False
+                else:
+                    await self._handle_batch(entries, redelivered=self._read_pending)
+
+                await self._prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to process review events: {e}")
+                self._read_pending = True
+                await asyncio.sleep(self._config.retry_delay)
+
+
+@asynccontextmanager
+async def review_events_consumer_init(app: FastAPI, config: ReviewEventsConfig) -> None:
+    consumer = ReviewEventsConsumer(app.state.redis_client, app.state.db_session_maker, config)
+    consumer_task = asyncio.create_task(consumer.run())
+    logger.info(f"Review events consumer started on {config.stream}")
+
+    try:
+        yield
+    finally:
+        consumer_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await consumer_task
+        logger.info("Review events consumer stopped")
@@ -19,6 +19,66 @@ DB_NAME: str = os.environ.get("DB_NAME")
 DB_HOST: str = os.environ.get("DB_HOST")
 DB_URL: str = os.environ.get("DB_URL")
 DB_ECHO_MODE: bool = False
+# Connections per worker process: pool_size + max_overflow
+DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE") or 10)
+DB_POOL_MAX_OVERFLOW: int = int(os.environ.get("DB_POOL_MAX_OVERFLOW") or 10)
+DB_POOL_TIMEOUT: float = float(os.environ.get("DB_POOL_TIMEOUT") or 10)
+DB_POOL_RECYCLE: int = int(os.environ.get("DB_POOL_RECYCLE") or 1800)
+DB_POOL_PRE_PING: bool = (os.environ.get("DB_POOL_PRE_PING") or "false").lower() == "true"
+# Prepared statements kept per connection, 0 when running behind pgbouncer in transaction mode
+DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(os.environ.get("DB_PREPARED_STATEMENT_CACHE_SIZE") or 500)
+# Compiled SQL kept per engine
+DB_QUERY_CACHE_SIZE: int = int(os.environ.get("DB_QUERY_CACHE_SIZE") or 1200)
+# Comma separated replica hosts, read-only endpoints use the primary when empty
+DB_REPLICA_HOSTS: list = [host.strip() for host in (os.environ.get("DB_REPLICA_HOSTS") or "").split(",") if host.strip()]
+DB_REPLICA_MAX_LAG: float = float(os.environ.get("DB_REPLICA_MAX_LAG") or 5)
+DB_REPLICA_STICKY_SECONDS: float = float(os.environ.get("DB_REPLICA_STICKY_SECONDS") or 10)
+DB_REPLICA_LAG_CHECK_INTERVAL: float = float(os.environ.get("DB_REPLICA_LAG_CHECK_INTERVAL") or 2)
+
+#
+# Likes configs
+#
+# Buffer likes_count changes in memory and flush them periodically
+LIKES_WRITE_BEHIND: bool = os.environ.get("LIKES_WRITE_BEHIND", "false").lower() == "true"
+LIKES_FLUSH_INTERVAL: float = float(os.environ.get("LIKES_FLUSH_INTERVAL") or 1.0)
+
+#
+# Author statistics configs
+#
+AUTHOR_STATISTICS_RECONCILE_ENABLED: bool = os.environ.get("AUTHOR_STATISTICS_RECONCILE_ENABLED", "true").lower() == "true"
+AUTHOR_STATISTICS_RECONCILE_INTERVAL: float = float(os.environ.get("AUTHOR_STATISTICS_RECONCILE_INTERVAL") or 600)
+AUTHOR_STATISTICS_RECONCILE_BATCH_SIZE: int = 500
+
+#
+# User context configs
+#
+USER_CONTEXT_HEADER_NAME: str = "x-user-context"
+# Shared with the gateway, which signs the header
+USER_CONTEXT_SECRET: str = os.environ.get("USER_CONTEXT_SECRET")
+# Verified header values kept per worker
+USER_CONTEXT_CACHE_SIZE: int = int(os.environ.get("USER_CONTEXT_CACHE_SIZE") or 10000)
+
+#
+# Redis configs
+#
+REDIS_HOST: str = os.environ.get("REDIS_HOST")
+REDIS_PORT: int = int(os.environ.get("REDIS_PORT") or 6379)
+
+#
+# Review events configs
+#
+REVIEW_EVENTS_STREAM: str = "review-events"
+REVIEW_EVENTS_GROUP: str = "book-service"
+# Every replica reads the stream under its own consumer name
+REVIEW_EVENTS_CONSUMER_NAME: str = os.environ.get("HOSTNAME") or "book-service"
+REVIEW_EVENTS_BATCH_SIZE: int = 100
+REVIEW_EVENTS_DEAD_LETTER_STREAM: str = "review-events:dead"
+# Deliveries of a pending entry before it is dead-lettered
+REVIEW_EVENTS_MAX_DELIVERIES: int = int(os.environ.get("REVIEW_EVENTS_MAX_DELIVERIES") or 5)
+# Consumer names change with the container, entries left unacknowledged
+# by a gone consumer are claimed once idle this long
+REVIEW_EVENTS_CLAIM_IDLE_MS: int = int(os.environ.get("REVIEW_EVENTS_CLAIM_IDLE_MS") or 5 * 60 * 1000)
+REVIEW_EVENTS_CLAIM_INTERVAL: float = float(os.environ.get("REVIEW_EVENTS_CLAIM_INTERVAL") or 60)
 
 #
 # Logging config
@@ -45,12 +105,23 @@ UPLOAD_DIR: str = "uploads/books"
 BOOK_FILES_PATH_DIRECTORY: str = "./books_files/"
 BOOK_COVERS_PATH_DIRECTORY: str = "./covers_files/"
 
+#
+# Book import configs
+#
+BOOK_IMPORT_WORKERS: int = int(os.environ.get("BOOK_IMPORT_WORKERS") or os.cpu_count() or 1)
+BOOK_IMPORT_CHUNK_SIZE: int = 500
+# Import jobs started over the API can be polled this long
+BOOK_IMPORT_JOB_TTL: int = 24 * 60 * 60
+# Book ids are derived from (author_id, external_id), so a rerun finds already imported rows
+BOOK_IMPORT_ID_NAMESPACE: str = "6f1c3a4e-2b8d-4f5a-9c7e-0d2b1a3c4e5f"
+
 #
 # Pagination configs
 #
 DEFAULT_PAGE_SIZE: int = 10
 MAX_PAGE_SIZE: int = 100
 MAX_PAGE_SIZE_NON_ADMIN: int = 20
+MAX_BATCH_BOOK_IDS: int = 200
 
 #
 # Search configs
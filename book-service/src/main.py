@@ -1,15 +1,26 @@
-from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig
+from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig, ReplicaConfig
 from src.api.user_book_statuses_router import user_book_statuses_router
+from src.api.metrics_router import metrics_router
 from src.middlewares.auth_middleware import UserContextMiddleware
 from src.api.author_crud_router import author_crud_router
 from src.api.book_search_router import book_search_router
 from src.exceptions.code_exceptions import CodeException
 from src.api.book_crud_router import book_crud_router
+from src.api.book_import_router import book_import_router
 from src.api.book_file_router import book_file_router
 from src.api.status_router import status_router
 from src.core.logging_core import setup_logging
 from src.api.likes_router import likes_router
-from src.core.db_core import init_engine
+from src.core.author_statistics_core import author_statistics_init
+from src.config.statistics_configs import AuthorStatisticsConfig
+from src.core.review_events_core import review_events_consumer_init
+from src.config.review_events_configs import ReviewEventsConfig
+from src.core.likes_counter_core import likes_counter_init
+from src.core.redis_core import redis_client_init
+from src.config.likes_configs import LikesCounterConfig
+from src.core.book_import_core import book_import_init
+from src.config.book_import_configs import BookImportConfig
+from src.core.db_core import init_engine, replicas_init
 from src.exceptions.exception_handlers import (
     pydantic_validation_exception_handler,
     code_exception_handler,
@@ -18,7 +29,16 @@ from src.exceptions.exception_handlers import (
 from src.globals import (
     APP_HOST, APP_PORT,
     LOGS_LEVEL, LOGS_FILENAME, LOGS_FORMAT,
-    DB_HOST, DB_URL, DB_USER, DB_PASSWORD, DB_NAME, DB_ECHO_MODE
+    DB_HOST, DB_URL, DB_USER, DB_PASSWORD, DB_NAME, DB_ECHO_MODE,
+    DB_POOL_SIZE, DB_POOL_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING,
+    DB_PREPARED_STATEMENT_CACHE_SIZE, DB_QUERY_CACHE_SIZE,
+    DB_REPLICA_HOSTS, DB_REPLICA_MAX_LAG, DB_REPLICA_STICKY_SECONDS, DB_REPLICA_LAG_CHECK_INTERVAL,
+    LIKES_WRITE_BEHIND, LIKES_FLUSH_INTERVAL, AUTHOR_STATISTICS_RECONCILE_ENABLED,
+    AUTHOR_STATISTICS_RECONCILE_INTERVAL, AUTHOR_STATISTICS_RECONCILE_BATCH_SIZE, REDIS_HOST, REDIS_PORT,
+    REVIEW_EVENTS_STREAM, REVIEW_EVENTS_GROUP, REVIEW_EVENTS_CONSUMER_NAME, REVIEW_EVENTS_BATCH_SIZE,
+    REVIEW_EVENTS_DEAD_LETTER_STREAM, REVIEW_EVENTS_MAX_DELIVERIES,
+    REVIEW_EVENTS_CLAIM_IDLE_MS, REVIEW_EVENTS_CLAIM_INTERVAL,
+    BOOK_IMPORT_WORKERS, BOOK_IMPORT_CHUNK_SIZE, BOOK_IMPORT_JOB_TTL
 )
 
 from fastapi.exceptions import RequestValidationError
@@ -40,25 +60,88 @@ async def app_lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     logger: logging.Logger = logging.getLogger(__name__)
 
+    database_config = DatabaseConfig(
+        db_url=DB_URL,
+        db_username=DB_USER,
+        db_password=DB_PASSWORD,
+        db_host=DB_HOST,
+        db_name=DB_NAME
+    )
+    connection_config = ConnectionConfig(
+        prepared_statement_cache_size=DB_PREPARED_STATEMENT_CACHE_SIZE,
+        query_cache_size=DB_QUERY_CACHE_SIZE
+    )
+    pool_config = PoolConfig(
+        pool_size=DB_POOL_SIZE,
+        max_overflows=DB_POOL_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        echo=DB_ECHO_MODE,
+        hide_parameters=not DB_ECHO_MODE
+    )
+
     await init_engine(
         app=app,
-        db_config=DatabaseConfig(
-            db_url=DB_URL,
-            db_username=DB_USER,
-            db_password=DB_PASSWORD,
-            db_host=DB_HOST,
-            db_name=DB_NAME
-        ),
-        pool_config=PoolConfig(
-            echo=DB_ECHO_MODE,
-            hide_parameters=not DB_ECHO_MODE
-        ),
-        connection_config=ConnectionConfig()
+        db_config=database_config,
+        pool_config=pool_config,
+        connection_config=connection_config
     )
 
-    logger.info(f"Server is started on {APP_HOST}:{APP_PORT}")
-    yield
-    logger.error("Server shutdown...")
+    async with (
+        redis_client_init(app, REDIS_HOST, REDIS_PORT),
+        replicas_init(
+            app=app,
+            db_config=database_config,
+            pool_config=pool_config,
+            connection_config=connection_config,
+            replica_config=ReplicaConfig(
+                hosts=DB_REPLICA_HOSTS,
+                max_lag=DB_REPLICA_MAX_LAG,
+                sticky_seconds=DB_REPLICA_STICKY_SECONDS,
+                lag_check_interval=DB_REPLICA_LAG_CHECK_INTERVAL
+            )
+        ),
+        review_events_consumer_init(
+            app=app,
+            config=ReviewEventsConfig(
+                stream=REVIEW_EVENTS_STREAM,
+                group=REVIEW_EVENTS_GROUP,
+                consumer_name=REVIEW_EVENTS_CONSUMER_NAME,
+                batch_size=REVIEW_EVENTS_BATCH_SIZE,
+                dead_letter_stream=REVIEW_EVENTS_DEAD_LETTER_STREAM,
+                max_deliveries=REVIEW_EVENTS_MAX_DELIVERIES,
+                claim_idle_ms=REVIEW_EVENTS_CLAIM_IDLE_MS,
+                claim_interval=REVIEW_EVENTS_CLAIM_INTERVAL
+            )
+        ),
+        likes_counter_init(
+            app=app,
+            config=LikesCounterConfig(
+                write_behind=LIKES_WRITE_BEHIND,
+                flush_interval=LIKES_FLUSH_INTERVAL
+            )
+        ),
+        author_statistics_init(
+            app=app,
+            config=AuthorStatisticsConfig(
+                reconcile_enabled=AUTHOR_STATISTICS_RECONCILE_ENABLED,
+                reconcile_interval=AUTHOR_STATISTICS_RECONCILE_INTERVAL,
+                reconcile_batch_size=AUTHOR_STATISTICS_RECONCILE_BATCH_SIZE
+            )
+        ),
+        book_import_init(
+            app=app,
+            config=BookImportConfig(
+                workers=BOOK_IMPORT_WORKERS,
+                chunk_size=BOOK_IMPORT_CHUNK_SIZE,
+                job_ttl=BOOK_IMPORT_JOB_TTL
+            )
+        )
+    ):
+        logger.info(f"Server is started on {APP_HOST}:{APP_PORT}")
+        yield
+        logger.error("Server shutdown...")
 
 
 app = FastAPI(lifespan=app_lifespan)
@@ -69,9 +152,15 @@ app.include_router(user_book_statuses_router)
 app.include_router(likes_router)
 app.include_router(status_router)
 app.include_router(book_search_router)
+app.include_router(book_import_router)
 app.include_router(book_crud_router)
 app.include_router(author_crud_router)
 app.include_router(book_file_router)
+app.include_router(metrics_router)
+
+@app.get("/ping")
+async def ping():
+    return "pong"
 
 app.add_exception_handler(RequestValidationError, pydantic_validation_exception_handler)
 app.add_exception_handler(CodeException, code_exception_handler)
@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field, validator
 from typing import Optional, List
 from datetime import date
 from src.models.enums import BookStatus, AuthorProfileStatus, UserBookStatusEnum
+from src.globals import MAX_BATCH_BOOK_IDS
 
 
 class BookCreateDTO(BaseModel):
@@ -19,6 +20,18 @@ class BookCreateDTO(BaseModel):
         return [genre.strip() for genre in v if genre.strip()]
 
 
+class BookImportItemDTO(BookCreateDTO):
+    external_id: str = Field(..., min_length=1, max_length=255)
+    author_id: UUID = Field(...)
+    file: Optional[str] = Field(None)
+    cover: Optional[str] = Field(None)
+
+
+class BookBatchRequestDTO(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_BOOK_IDS)
+    include_author: bool = Field(False)
+
+
 class BookUpdateDTO(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=50)
     description: Optional[str] = Field(None, max_length=2000)
@@ -12,11 +12,11 @@ class AuthorProfile(Base):
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID, nullable=False)
     name = Column(String, nullable=False)
-    rating = Column(Float, default=0.0)
+    rating = Column(Float, nullable=False, default=0.0)
     common_genres = Column(ARRAY(String))
-    books_count = Column(Integer, default=0)
+    books_count = Column(Integer, nullable=False, default=0)
     reviews_count = Column(Integer, default=0)
-    likes_count = Column(Integer, default=0)
+    likes_count = Column(Integer, nullable=False, default=0)
     status = Column(String, nullable=False, default='ACTIVE')
 
     books = relationship("Book", back_populates="author")
@@ -37,6 +37,7 @@ class Book(Base):
     likes_count = Column(Integer, default=0)
     pages_count = Column(Integer, default=0)
     reviews_count = Column(Integer, default=0)
+    ratings_sum = Column(Integer, nullable=False, default=0)
 
     author = relationship("AuthorProfile", back_populates="books")
     likers = relationship("BookLike", back_populates="book", cascade="all, delete-orphan")
@@ -60,3 +61,9 @@ class BookLike(Base):
     user_id = Column(UUID, primary_key=True)
 
     book = relationship("Book", back_populates="likers", uselist=False)
+
+class ProcessedReviewEvent(Base):
+    __tablename__ = 'processed_review_events'
+
+    event_id = Column(UUID, primary_key=True)
+    processed_at = Column(DateTime, nullable=False, server_default=text('now()'))
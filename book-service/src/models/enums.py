@@ -29,6 +29,17 @@ class UserBookStatusEnum(str, Enum):
     DROP = "DROP"
     LIKED = "LIKED"
 
+class BookImportItemStatus(str, Enum):
+    IMPORTED = "IMPORTED"
+    SKIPPED = "SKIPPED"
+    INVALID = "INVALID"
+    FAILED = "FAILED"
+
+class BookImportJobStatus(str, Enum):
+    RUNNING = "RUNNING"
+    FINISHED = "FINISHED"
+    FAILED = "FAILED"
+
 class ResponseStatus(str, Enum):
     SUCCESS = "success"
     EXCEPTION = "exception"
@@ -1,6 +1,7 @@
-from src.models.enums import BookStatus, AuthorProfileStatus, ResponseStatus, ResponseDataType
+from src.models.enums import BookStatus, AuthorProfileStatus, ResponseStatus, ResponseDataType, BookImportItemStatus, BookImportJobStatus
 from src.models.entities import Book, AuthorProfile, UserBookStatus
 from pydantic import BaseModel, Field
+from sqlalchemy import Row
 from typing import Optional, List, Any
 from datetime import date
 import logging
@@ -26,7 +27,7 @@ class AuthorProfileResponseDTO(BaseModel):
     
     @classmethod
     def from_entity(cls, entity: AuthorProfile) -> 'AuthorProfileResponseDTO':
-        return cls(
+        return cls.model_construct(
             id=str(entity.id),
             name=entity.name,
             rating=entity.rating,
@@ -37,6 +38,20 @@ class AuthorProfileResponseDTO(BaseModel):
             status=entity.status if hasattr(entity, 'status') else AuthorProfileStatus.ACTIVE.value
         )
 
+    @classmethod
+    def from_row(cls, row: Row, prefix: str = "") -> 'AuthorProfileResponseDTO':
+        values = row._mapping
+        return cls.model_construct(
+            id=str(values[prefix + "id"]),
+            name=values[prefix + "name"],
+            rating=values[prefix + "rating"],
+            common_genres=values[prefix + "common_genres"] or [],
+            books_count=values[prefix + "books_count"],
+            reviews_count=values[prefix + "reviews_count"],
+            likes_count=values[prefix + "likes_count"],
+            status=values[prefix + "status"]
+        )
+
 
 class BookResponseDTO(BaseModel):
     id: str
@@ -56,21 +71,9 @@ class BookResponseDTO(BaseModel):
     author: Optional[AuthorProfileResponseDTO] = None
     
     @classmethod
-    def from_entity(cls, entity: Book, include_author: bool = False, count_likes: bool = None, current_user_id: str = None) -> 'BookResponseDTO':
-        is_liked_by_me = None
-        likes_count = 0
-
-        if count_likes == True and current_user_id != None:
-            is_liked_by_me = False
-
-            for like in entity.likers:
-                if like.user_id == current_user_id:
-                    is_liked_by_me = True
-                    break
-
-            likes_count = len(entity.likers)
-
-        return cls(
+    def from_entity(cls, entity: Book, include_author: bool = False, is_liked_by_me: Optional[bool] = None) -> 'BookResponseDTO':
+        # Columns are already typed by the ORM, validating them again only copies the values
+        return cls.model_construct(
             id=str(entity.id),
             author_id=str(entity.author_id),
             title=entity.title,
@@ -78,7 +81,7 @@ class BookResponseDTO(BaseModel):
             file_path=entity.file_path,
             cover_path="/api/book-service/books/" + str(entity.id) + "/cover",
             genres=entity.genres or [],
-            added_date=entity.added_date,
+            added_date=entity.added_date.date() if entity.added_date else None,
             status=entity.status,
             total_rating=entity.total_rating,
             likes_count=entity.likes_count,
@@ -88,6 +91,32 @@ class BookResponseDTO(BaseModel):
             author=AuthorProfileResponseDTO.from_entity(entity.author) if include_author and entity.author else None
         )
 
+    @classmethod
+    def from_row(cls, row: Row, include_author: bool = False, is_liked_by_me: Optional[bool] = None) -> 'BookResponseDTO':
+        # List rows are selected without the description and the file path
+        return cls.model_construct(
+            id=str(row.id),
+            author_id=str(row.author_id),
+            title=row.title,
+            description=None,
+            file_path=None,
+            cover_path="/api/book-service/books/" + str(row.id) + "/cover",
+            genres=row.genres or [],
+            added_date=row.added_date.date() if row.added_date else None,
+            status=row.status,
+            total_rating=row.total_rating,
+            likes_count=row.likes_count,
+            pages_count=row.pages_count,
+            reviews_count=row.reviews_count,
+            is_liked_by_me=is_liked_by_me,
+            author=AuthorProfileResponseDTO.from_row(row, "author_") if include_author else None
+        )
+
+
+class BookBatchResponseDTO(BaseModel):
+    books: List[BookResponseDTO]
+    missing_ids: List[str]
+
 
 class BookSearchResponseDTO(BaseModel):
     books: List[BookResponseDTO]
@@ -103,6 +132,31 @@ class AuthorProfileSearchResponseDTO(BaseModel):
     page_number: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
+
+
+class BookImportItemResultDTO(BaseModel):
+    line: int
+    external_id: Optional[str]
+    book_id: Optional[str]
+    status: BookImportItemStatus
+    message: Optional[str] = None
+
+
+class BookImportReportDTO(BaseModel):
+    items: List[BookImportItemResultDTO]
+    imported_count: int
+    skipped_count: int
+    failed_count: int
+
+
+class BookImportJobDTO(BaseModel):
+    job_id: str
+    status: BookImportJobStatus
+    processed_count: int = 0
+    total_count: Optional[int] = None
+    report: Optional[BookImportReportDTO] = None
+    message: Optional[str] = None
 
 
 class BookPagesResponseDTO(BaseModel):
@@ -139,7 +193,7 @@ class UserBookStatusResponseDTO(BaseModel):
     
     @classmethod
     def from_entity(cls, status: UserBookStatus) -> 'StatusedBookResponseDTO':
-        return cls(
+        return cls.model_construct(
             status=status.status,
             book_id=str(status.book_id),
             author_id=str(status.book.author.id),
@@ -0,0 +1,144 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, or_, asc, desc, tuple_
+from typing import Optional, Dict, Any, Tuple
+import logging
+import base64
+import json
+import uuid
+
+from src.models.entities import AuthorProfile
+from src.models.response_dtos import AuthorProfileSearchResponseDTO, AuthorProfileResponseDTO
+from src.models.enums import AuthorProfileStatus
+from src.exceptions.code_exceptions import BadRequestException
+from src.middlewares.auth_middleware import UserContext
+from src.services.author_service import AUTHOR_PROFILE_LIST_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+SORT_COLUMNS = {
+    'rating': AuthorProfile.rating,
+    'likes': AuthorProfile.likes_count,
+    'books': AuthorProfile.books_count
+}
+DEFAULT_SORT_BY = 'rating'
+
+
+class AuthorSearchService:
+    """
+    Author listing filtered, sorted and paged in SQL. Pages are continued
+    with an opaque cursor holding the sort value and id of the last row,
+    so deep pages cost the same as the first one.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def search_authors(
+        self,
+        user_context: UserContext,
+        search_params: Dict[str, Any],
+        page_number: int = 1,
+        page_size: int = 10,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> AuthorProfileSearchResponseDTO:
+        if not user_context.is_admin and page_size > 20:
+            raise BadRequestException("Maximum 20 pages allowed for non-admin users")
+
+        sort_by =sort_by if sort_by in SORT_COLUMNS else DEFAULT_SORT_BY
+        descending = sort_order != 'asc'
+        sort_column = SORT_COLUMNS[sort_by]
+
+        conditions = []
+
+        access_condition = self._get_access_condition(user_context)
+        if access_condition is not None:
+            conditions.append(access_condition)
+
+        if 'key' in search_params and search_params['key']:
+            key = search_params['key'].strip().lower()
+            if key:
+                name = func.lower(AuthorProfile.name)
+                conditions.append(or_(
+                    name.like(self._escape_like(key) + '%', escape='\\'),
+                    # pg_trgm similarity, served by the trigram index on lower(name)
+                    name.op('%')(key)
+                ))
+
+        count_query = select(func.count()).select_from(AuthorProfile)
+        if conditions:
+            count_query = count_query.where(and_(*conditions))
+        count_result = await self.db_session.execute(count_query)
+        total_count = count_result.scalar()
+
+        query = select(*AUTHOR_PROFILE_LIST_COLUMNS)
+
+        if cursor:
+            last_value, last_id = self._decode_cursor(cursor, sort_by, descending)
+            position = tuple_(sort_column, AuthorProfile.id)
+            conditions.append(position < (last_value, last_id) if descending else position > (last_value, last_id))
+        elif page_number > 1:
+            query = query.offset((page_number - 1) * page_size)
+
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        order = desc if descending else asc
+        # One row past the page tells whether there is a next one
+        query = query.order_by(order(sort_column), order(AuthorProfile.id)).limit(page_size + 1)
+
+        result = await self.db_session.execute(query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last_row = rows[-1]
+            next_cursor = self._encode_cursor(sort_by, descending, last_row._mapping[sort_column.key], last_row.id)
+
+        total_pages = (total_count + page_size - 1) // page_size
+
+        return AuthorProfileSearchResponseDTO(
+            authors=[AuthorProfileResponseDTO.from_row(row) for row in rows],
+            total_count=total_count,
+            page_number=page_number,
+            page_size=page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor
+        )
+
+    def _get_access_condition(self, user_context: UserContext):
+        # Same rule as check_resource_access, evaluated by the database
+        if user_context.is_admin:
+            return None
+
+        is_active = AuthorProfile.status == AuthorProfileStatus.ACTIVE.value
+        if user_context.is_authenticated:
+            return or_(is_active, AuthorProfile.user_id == user_context.user_id)
+        return is_active
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+    @staticmethod
+    def _encode_cursor(sort_by: str, descending: bool, value: Any, author_id: uuid.UUID) -> str:
+        payload = json.dumps([sort_by, descending, value, str(author_id)], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort_by: str, descending: bool) -> Tuple[Any, uuid.UUID]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            cursor_sort_by, cursor_descending, value, author_id = payload
+            author_id = uuid.UUID(author_id)
+        except (ValueError, TypeError):
+            raise BadRequestException("Invalid cursor")
+
+        if cursor_sort_by != sort_by or cursor_descending != descending:
+            raise BadRequestException("Cursor belongs to a different sort order")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise BadRequestException("Invalid cursor")
+
+        return value, author_id
@@ -13,9 +13,24 @@ from src.models.enums import AuthorProfileStatus
 from src.exceptions.code_exceptions import ForbiddenException, NotFoundException, ConflictException, BadRequestException
 from src.middlewares.access_control import check_resource_access, get_resource_access_response
 from src.middlewares.auth_middleware import UserContext
+from src.core.entity_loader_core import get_entity_loader
+from src.services.author_statistics_service import AuthorStatisticsService
 
 logger = logging.getLogger(__name__)
 
+# Columns of AuthorProfileResponseDTO.from_row plus the owner for the access check
+AUTHOR_PROFILE_LIST_COLUMNS = (
+    AuthorProfile.id,
+    AuthorProfile.user_id,
+    AuthorProfile.name,
+    AuthorProfile.rating,
+    AuthorProfile.common_genres,
+    AuthorProfile.books_count,
+    AuthorProfile.reviews_count,
+    AuthorProfile.likes_count,
+    AuthorProfile.status
+)
+
 
 class AuthorProfileService:
     def __init__(self, db_session: AsyncSession):
@@ -85,9 +100,7 @@ class AuthorProfileService:
         author_data: AuthorProfileUpdateDTO,
         user_context: UserContext
     ) -> AuthorProfileResponseDTO:
-        query = select(AuthorProfile).where(AuthorProfile.id == author_id)
-        result = await self.db_session.execute(query)
-        author_profile = result.scalar_one_or_none()
+        author_profile = await get_entity_loader(self.db_session).load(AuthorProfile, author_id)
         
         if not author_profile:
             raise NotFoundException("Author profile not found")
@@ -117,9 +130,7 @@ class AuthorProfileService:
         author_id: uuid.UUID, 
         user_context: UserContext
     ) -> None:
-        query = select(AuthorProfile).where(AuthorProfile.id == author_id)
-        result = await self.db_session.execute(query)
-        author_profile = result.scalar_one_or_none()
+        author_profile = await get_entity_loader(self.db_session).load(AuthorProfile, author_id)
         
         if not author_profile:
             raise NotFoundException("Author profile not found")
@@ -144,22 +155,18 @@ class AuthorProfileService:
         user_context: UserContext,
         include_books: bool = False
     ) -> List[AuthorProfileResponseDTO]:
-        query = select(AuthorProfile)
-        
-        if include_books:
-            query = query.options(selectinload(AuthorProfile.books))
-        
-        result = await self.db_session.execute(query)
-        author_profiles = result.scalars().all()
+        # The list DTO has no books, include_books does not change the query
+        result = await self.db_session.execute(select(*AUTHOR_PROFILE_LIST_COLUMNS))
+        rows = result.all()
         
         accessible_profiles = []
-        for profile in author_profiles:
+        for row in rows:
             if check_resource_access(
                 user_context, 
-                profile.status, 
-                profile.user_id
+                row.status, 
+                row.user_id
             ):
-                accessible_profiles.append(AuthorProfileResponseDTO.from_entity(profile))
+                accessible_profiles.append(AuthorProfileResponseDTO.from_row(row))
         
         return accessible_profiles
     
@@ -184,30 +191,7 @@ class AuthorProfileService:
         return AuthorProfileResponseDTO.from_entity(author_profile)
     
     async def update_author_statistics(self, author_id: uuid.UUID) -> None:
-        books_query = select(Book).where(Book.author_id == author_id)
-        books_result = await self.db_session.execute(books_query)
-        books = books_result.scalars().all()
-        
-        if not books:
-            return
-        
-        total_rating = sum(book.total_rating for book in books)
-        books_count = len(books)
-        reviews_count = sum(book.reviews_count for book in books)
-        likes_count = sum(book.likes_count for book in books)
-        
-        average_rating = total_rating / books_count if books_count > 0 else 0.0
-        
-        await self.db_session.execute(
-            update(AuthorProfile)
-            .where(AuthorProfile.id == author_id)
-            .values(
-                rating=average_rating,
-                books_count=books_count,
-                reviews_count=reviews_count,
-                likes_count=likes_count
-            )
-        )
+        await AuthorStatisticsService(self.db_session).recalculate([author_id])
         await self.db_session.commit()
     
     def _can_modify_author_profile(
@@ -0,0 +1,118 @@
+from src.models.entities import AuthorProfile, Book
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, case
+from typing import List, Optional
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class AuthorStatisticsService:
+    """
+    Keeps AuthorProfile aggregates in step with delta updates. Nothing is
+    committed here, the changes belong to the caller's transaction.
+    Author rating is the average of the total_rating of all the author's books.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def on_book_added(self, author_id: uuid.UUID, added_count: int = 1) -> None:
+        books_count = func.coalesce(AuthorProfile.books_count, 0)
+
+        await self.db_session.execute(
+            update(AuthorProfile)
+            .where(AuthorProfile.id == author_id)
+            .values(
+                books_count=books_count + added_count,
+                rating=func.coalesce(AuthorProfile.rating, 0.0) * books_count / (books_count + added_count)
+            )
+        )
+
+    async def on_book_removed(self, book: Book) -> None:
+        books_count = func.coalesce(AuthorProfile.books_count, 0)
+        rating_sum = func.coalesce(AuthorProfile.rating, 0.0) * books_count
+
+        await self.db_session.execute(
+            update(AuthorProfile)
+            .where(AuthorProfile.id == book.author_id)
+            .values(
+                books_count=func.greatest(books_count - 1, 0),
+                likes_count=func.coalesce(AuthorProfile.likes_count, 0) - (book.likes_count or 0),
+                reviews_count=func.coalesce(AuthorProfile.reviews_count, 0) - (book.reviews_count or 0),
+                rating=case(
+                    (books_count > 1, (rating_sum - (book.total_rating or 0.0)) / (books_count - 1)),
+                    else_=0.0
+                )
+            )
+        )
+
+    async def on_book_changed(
+        self,
+        author_id: uuid.UUID,
+        likes_delta: int = 0,
+        reviews_delta: int = 0,
+        total_rating_delta: float = 0.0
+    ) -> None:
+        books_count = func.coalesce(AuthorProfile.books_count, 0)
+
+        await self.db_session.execute(
+            update(AuthorProfile)
+            .where(AuthorProfile.id == author_id)
+            .values(
+                likes_count=func.coalesce(AuthorProfile.likes_count, 0) + likes_delta,
+                reviews_count=func.coalesce(AuthorProfile.reviews_count, 0) + reviews_delta,
+                rating=case(
+                    (books_count > 0, func.coalesce(AuthorProfile.rating, 0.0) + total_rating_delta / books_count),
+                    else_=0.0
+                )
+            )
+        )
+
+    async def recalculate(self, author_ids: List[uuid.UUID]) -> None:
+        stats = (
+            select(
+                AuthorProfile.id.label("author_id"),
+                func.count(Book.id).label("books_count"),
+                func.coalesce(func.avg(Book.total_rating), 0.0).label("rating"),
+                func.coalesce(func.sum(Book.reviews_count), 0).label("reviews_count"),
+                func.coalesce(func.sum(Book.likes_count), 0).label("likes_count")
+            )
+            .outerjoin(Book, Book.author_id == AuthorProfile.id)
+            .where(AuthorProfile.id.in_(author_ids))
+            .group_by(AuthorProfile.id)
+            .subquery()
+        )
+
+        await self.db_session.execute(
+            update(AuthorProfile)
+            .where(AuthorProfile.id == stats.c.author_id)
+            .values(
+                books_count=stats.c.books_count,
+                rating=stats.c.rating,
+                reviews_count=stats.c.reviews_count,
+                likes_count=stats.c.likes_count
+            )
+        )
+
+    async def reconcile_batch(self, after_id: Optional[uuid.UUID], batch_size: int) -> Optional[uuid.UUID]:
+        """
+        Recalculates the next batch of authors ordered by id and commits it.
+        Returns the last processed id or None when all authors are processed.
+        """
+        ids_query = select(AuthorProfile.id).order_by(AuthorProfile.id).limit(batch_size)
+        if after_id is not None:
+            ids_query = ids_query.where(AuthorProfile.id > after_id)
+
+        ids_result = await self.db_session.execute(ids_query)
+        author_ids = ids_result.scalars().all()
+
+        if not author_ids:
+            return None
+
+        await self.recalculate(author_ids)
+        await self.db_session.commit()
+
+        return author_ids[-1]
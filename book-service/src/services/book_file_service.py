@@ -3,13 +3,13 @@ from src.models.response_dtos import BookPagesResponseDTO, BookPageResponseDTO,
 from src.globals import BOOK_FILES_PATH_DIRECTORY, BOOK_COVERS_PATH_DIRECTORY
 from src.middlewares.access_control import check_resource_access
 from src.middlewares.auth_middleware import UserContext
+from src.core.entity_loader_core import get_entity_loader
 from src.models.enums import BookStatus
 from src.models.entities import Book
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from pdf2image import convert_from_bytes, convert_from_path
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import select
 from typing import Optional
 from PIL import Image
 import aiofiles
@@ -233,9 +233,7 @@ class BookFileService:
         book_id: uuid.UUID, 
         user_context:UserContext
     ) -> Book:
-        query = select(Book).where(Book.id == book_id)
-        result = await self.db_session.execute(query)
-        book = result.scalar_one_or_none()
+        book = await get_entity_loader(self.db_session).load(Book, book_id)
         
         if not book:
             raise NotFoundException("Book not found")
@@ -0,0 +1,292 @@
+from src.models.response_dtos import BookImportItemResultDTO, BookImportReportDTO
+from src.services.author_statistics_service import AuthorStatisticsService
+from src.models.enums import BookImportItemStatus, BookStatus
+from src.models.crud_request_dtos import BookImportItemDTO
+from src.models.entities import Book, AuthorProfile
+from src.globals import BOOK_FILES_PATH_DIRECTORY, BOOK_COVERS_PATH_DIRECTORY, BOOK_IMPORT_ID_NAMESPACE
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from collections import Counter
+from pydantic import ValidationError
+from sqlalchemy import select
+from datetime import datetime
+import multiprocessing
+import zipfile
+import asyncio
+import logging
+import PyPDF2
+import shutil
+import json
+import uuid
+import os
+
+logger = logging.getLogger(__name__)
+
+COVER_FORMATS = {".png": "png", ".jpg": "jpg", ".jpeg": "jpg"}
+
+
+def _resolve_source_path(source_dir: str, relative_path: str) -> str:
+    full_path = os.path.realpath(os.path.join(source_dir, relative_path))
+    if not full_path.startswith(os.path.realpath(source_dir) + os.sep):
+        raise ValueError(f"File {relative_path} is outside of the import directory")
+    if not os.path.isfile(full_path):
+        raise ValueError(f"File {relative_path} not found")
+    return full_path
+
+
+def _copy_file(source_path: str, save_dir: str, file_path: str) -> None:
+    os.makedirs(save_dir, exist_ok=True)
+    full_path = save_dir + "/" + file_path
+
+    # Copy under a temporary name so an interrupted import never leaves a partial file
+    shutil.copyfile(source_path, full_path + ".part")
+    os.replace(full_path + ".part", full_path)
+
+
+def prepare_import_files(
+    book_id: str,
+    source_dir: str,
+    file: Optional[str],
+    cover: Optional[str]
+) -> Tuple[Optional[str], Optional[str], int]:
+    """
+    Copies the book files into storage and counts PDF pages. Runs in a worker process.
+    """
+    file_path, cover_path, pages_count = None, None, 0
+
+    if file:
+        source_path = _resolve_source_path(source_dir, file)
+        if not source_path.lower().endswith(".pdf"):
+            raise ValueError("Content files are only allowed in PDF format")
+
+        with open(source_path, "rb") as f:
+            pages_count = len(PyPDF2.PdfReader(f).pages)
+
+        file_path = f"{book_id}.pdf"
+        _copy_file(source_path, BOOK_FILES_PATH_DIRECTORY, file_path)
+
+    if cover:
+        source_path = _resolve_source_path(source_dir, cover)
+        cover_format = COVER_FORMATS.get(os.path.splitext(source_path)[1].lower())
+        if not cover_format:
+            raise ValueError("Cover files are only allowed in PNG or JPG format")
+
+        cover_path = f"{book_id}.{cover_format}"
+        _copy_file(source_path, BOOK_COVERS_PATH_DIRECTORY, cover_path)
+
+    return file_path, cover_path, pages_count
+
+
+def create_import_executor(workers: int) -> ProcessPoolExecutor:
+    # Spawned workers start from a fresh interpreter, forked ones would copy
+    # the running event loop and the open database and Redis sockets
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class BookImportService:
+    def __init__(self, db_session: AsyncSession, executor: Executor, chunk_size: int):
+        self.db_session = db_session
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def extract_archive(archive_path: str, target_dir: str) -> None:
+        with zipfile.ZipFile(archive_path) as archive:
+            archive.extractall(target_dir)
+
+    @staticmethod
+    def _load_finished(report_path: Optional[str]) -> Dict[str, BookImportItemResultDTO]:
+        """Finished items of a previous run, by book id."""
+        finished = {}
+        if not report_path or not os.path.exists(report_path):
+            return finished
+
+        with open(report_path) as report:
+            for line in report:
+                if not line.strip():
+                    continue
+                result = BookImportItemResultDTO.model_validate_json(line)
+                if result.status in (BookImportItemStatus.IMPORTED, BookImportItemStatus.SKIPPED):
+                    finished[result.book_id] = result
+        return finished
+
+    @staticmethod
+    def _write_report(report_path: Optional[str], results: List[BookImportItemResultDTO]) -> None:
+        if not report_path:
+            return
+        with open(report_path, "a") as report:
+            for result in results:
+                report.write(result.model_dump_json() + "\n")
+
+    def _parse_manifest(
+        self,
+        manifest_lines: Iterable[str],
+        finished: Dict[str, BookImportItemResultDTO],
+        results: List[BookImportItemResultDTO]
+    ) -> List[Tuple[int, BookImportItemDTO]]:
+        items = []
+        seen_ids = set()
+
+        for line_number, line in enumerate(manifest_lines, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                item = BookImportItemDTO.model_validate(json.loads(line))
+            except (ValueError, ValidationError) as e:
+                results.append(BookImportItemResultDTO(
+                    line=line_number, external_id=None, book_id=None,
+                    status=BookImportItemStatus.INVALID, message=str(e)
+                ))
+                continue
+
+            # Books are identified by author and external_id, other authors may reuse the id
+            book_id = str(self._get_book_id(item))
+            if book_id in seen_ids:
+                results.append(BookImportItemResultDTO(
+                    line=line_number, external_id=item.external_id, book_id=None,
+                    status=BookImportItemStatus.INVALID, message="Duplicate external_id for this author in manifest"
+                ))
+                continue
+            seen_ids.add(book_id)
+
+            if book_id in finished:
+                continue
+
+            items.append((line_number, item))
+
+        return items
+
+    def _get_book_id(self, item: BookImportItemDTO) -> uuid.UUID:
+        return uuid.uuid5(uuid.UUID(BOOK_IMPORT_ID_NAMESPACE), f"{item.author_id}:{item.external_id}")
+
+    async def import_books(
+        self,
+        manifest_lines: Iterable[str],
+        source_dir: str,
+        report_path: Optional[str] = None,
+        on_progress: Optional[Callable[[int, int], Awaitable[None]]] = None
+    ) -> BookImportReportDTO:
+        """
+        Imports manifest items in chunks, every chunk is committed and appended
+        to the report, so a rerun with the same report skips finished items.
+        `on_progress` is awaited after every chunk with processed and total counts.
+        """
+        finished = self._load_finished(report_path)
+        results: List[BookImportItemResultDTO] = []
+        invalid_results: List[BookImportItemResultDTO] = []
+
+        items = self._parse_manifest(manifest_lines, finished, invalid_results)
+        self._write_report(report_path, invalid_results)
+        results.extend(invalid_results)
+
+        for start in range(0, len(items), self.chunk_size):
+            chunk = items[start:start + self.chunk_size]
+            chunk_results = await self._import_chunk(chunk, source_dir)
+            self._write_report(report_path, chunk_results)
+            results.extend(chunk_results)
+            logger.info(f"Book import: {start + len(chunk)} of {len(items)} items processed")
+
+            if on_progress is not None:
+                await on_progress(start + len(chunk), len(items))
+
+        results.extend(finished.values())
+        results.sort(key=lambda result: result.line)
+        statuses = Counter(result.status for result in results)
+
+        return BookImportReportDTO(
+            items=results,
+            imported_count=statuses[BookImportItemStatus.IMPORTED],
+            skipped_count=statuses[BookImportItemStatus.SKIPPED],
+            failed_count=statuses[BookImportItemStatus.FAILED] + statuses[BookImportItemStatus.INVALID]
+        )
+
+    async def _import_chunk(
+        self,
+        items: List[Tuple[int, BookImportItemDTO]],
+        source_dir: str
+    ) -> List[BookImportItemResultDTO]:
+        results = []
+
+        def add_result(line_number: int, item: BookImportItemDTO, status: BookImportItemStatus, message: str = None):
+            results.append(BookImportItemResultDTO(
+                line=line_number,
+                external_id=item.external_id,
+                book_id=str(self._get_book_id(item)),
+                status=status,
+                message=message
+            ))
+
+        authors_result = await self.db_session.execute(
+            select(AuthorProfile.id).where(AuthorProfile.id.in_({item.author_id for _, item in items}))
+        )
+        author_ids = set(authors_result.scalars().all())
+
+        existing_result = await self.db_session.execute(
+            select(Book.id).where(Book.id.in_([self._get_book_id(item) for _, item in items]))
+        )
+        existing_ids = set(existing_result.scalars().all())
+
+        pending = []
+        for line_number, item in items:
+            if item.author_id not in author_ids:
+                add_result(line_number, item, BookImportItemStatus.FAILED, "Author not found")
+            elif self._get_book_id(item) in existing_ids:
+                add_result(line_number, item, BookImportItemStatus.SKIPPED, "Book already exists")
+            else:
+                pending.append((line_number, item))
+
+        loop = asyncio.get_running_loop()
+        prepared = await asyncio.gather(*(
+            loop.run_in_executor(
+                self.executor, prepare_import_files,
+                str(self._get_book_id(item)), source_dir, item.file, item.cover
+            )
+            for _, item in pending
+        ), return_exceptions=True)
+
+        rows = []
+        imported = []
+        for (line_number, item), files in zip(pending, prepared):
+            if isinstance(files, Exception):
+                add_result(line_number, item, BookImportItemStatus.FAILED, str(files))
+                continue
+
+            file_path, cover_path, pages_count = files
+            rows.append({
+                "id": self._get_book_id(item),
+                "author_id": item.author_id,
+                "title": item.title,
+                "description": item.description,
+                "genres": item.genres,
+                "file_path": file_path,
+                "cover_path": cover_path,
+                "pages_count": pages_count,
+                "added_date": datetime.now(),
+                "status": BookStatus.ON_MODERATE.value if file_path else BookStatus.WAIT_FILE.value,
+            })
+            imported.append((line_number, item))
+
+        if rows:
+            inserted_result = await self.db_session.execute(
+                insert(Book).values(rows).on_conflict_do_nothing().returning(Book.id, Book.author_id)
+            )
+            inserted = inserted_result.all()
+
+            author_statistics = AuthorStatisticsService(self.db_session)
+            for author_id, added_count in Counter(author_id for _, author_id in inserted).items():
+                await author_statistics.on_book_added(author_id, added_count)
+
+            await self.db_session.commit()
+
+            inserted_ids = {book_id for book_id, _ in inserted}
+            for line_number, item in imported:
+                if self._get_book_id(item) in inserted_ids:
+                    add_result(line_number, item, BookImportItemStatus.IMPORTED)
+                else:
+                    add_result(line_number, item, BookImportItemStatus.SKIPPED, "Book already exists")
+
+        return results
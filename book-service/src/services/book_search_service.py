@@ -1,11 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from sqlalchemy import select, func, and_, or_, desc, asc, literal
 from typing import Optional, List, Dict, Any
 import logging
 
 from src.models.entities import Book, AuthorProfile
 from src.models.response_dtos import BookSearchResponseDTO, BookResponseDTO
+from src.services.book_service import BOOK_LIST_COLUMNS, BOOK_AUTHOR_LIST_COLUMNS
 from src.models.enums import BookStatus
 from src.exceptions.code_exceptions import BadRequestException
 from src.middlewares.access_control import check_resource_access, get_resource_access_response
@@ -30,7 +30,7 @@ class BookSearchService:
         if not user_context.is_admin and page_size > 20:
             raise BadRequestException("Maximum 20 pages allowed for non-admin users")
         
-        query = select(Book).options(selectinload(Book.author))
+        query = select(*BOOK_LIST_COLUMNS, *BOOK_AUTHOR_LIST_COLUMNS)
         query = query.join(AuthorProfile, Book.author_id == AuthorProfile.id)
 
         conditions = []
@@ -111,16 +111,16 @@ class BookSearchService:
         query = query.offset(offset).limit(page_size)
         
         result = await self.db_session.execute(query)
-        books = result.scalars().all()
+        rows = result.all()
         
         accessible_books = []
-        for book in books:
+        for row in rows:
             if check_resource_access(
                 user_context, 
-                book.status, 
-                book.author_id
+                row.status, 
+                row.author_id
             ):
-                accessible_books.append(BookResponseDTO.from_entity(book, include_author=True))
+                accessible_books.append(BookResponseDTO.from_row(row, include_author=True))
     
         total_pages = (total_count + page_size - 1) // page_size
         
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, exists, bindparam, any_, UUID
+from sqlalchemy.dialects.postgresql import ARRAY
 from typing import Optional, List
 from datetime import datetime
 import uuid
@@ -12,17 +13,57 @@ import aiofiles
 import aiofiles.os
 import asyncio
 
-from src.models.entities import Book, AuthorProfile
+from src.models.entities import Book, AuthorProfile, BookLike
 from src.models.crud_request_dtos import BookCreateDTO, BookUpdateDTO
-from src.models.response_dtos import BookResponseDTO
+from src.models.response_dtos import BookResponseDTO, BookBatchResponseDTO
 from src.models.enums import BookStatus
 from src.exceptions.code_exceptions import ForbiddenException, InternalServerErrorException, NotFoundException, ConflictException, BadRequestException
 from src.middlewares.access_control import check_resource_access, get_resource_access_response
 from src.middlewares.auth_middleware import UserContext
+from src.core.entity_loader_core import get_entity_loader
+from src.services.author_statistics_service import AuthorStatisticsService
 from src.globals import BOOK_FILES_PATH_DIRECTORY, BOOK_COVERS_PATH_DIRECTORY
 
 logger = logging.getLogger(__name__)
 
+# Prebuilt hot statements, executed with bound parameters
+BOOK_BY_ID_QUERY = select(Book).where(Book.id == bindparam("book_id"))
+BOOK_WITH_AUTHOR_BY_ID_QUERY = BOOK_BY_ID_QUERY.options(selectinload(Book.author))
+BOOK_LIKED_QUERY = select(exists().where(
+    BookLike.book_id == bindparam("book_id"),
+    BookLike.user_id == bindparam("user_id")
+))
+BOOKS_BY_IDS_QUERY = select(Book).where(Book.id == any_(bindparam("book_ids", type_=ARRAY(UUID))))
+BOOKS_WITH_AUTHOR_BY_IDS_QUERY = BOOKS_BY_IDS_QUERY.options(selectinload(Book.author))
+LIKED_BOOK_IDS_QUERY = select(BookLike.book_id).where(
+    BookLike.user_id == bindparam("user_id"),
+    BookLike.book_id == any_(bindparam("book_ids", type_=ARRAY(UUID)))
+)
+
+# List endpoints select plain rows with the columns of BookResponseDTO.from_row,
+# author columns are joined in under an "author_" prefix
+BOOK_LIST_COLUMNS = (
+    Book.id,
+    Book.author_id,
+    Book.title,
+    Book.genres,
+    Book.added_date,
+    Book.status,
+    Book.total_rating,
+    Book.likes_count,
+    Book.pages_count,
+    Book.reviews_count
+)
+BOOK_AUTHOR_LIST_COLUMNS = (
+    AuthorProfile.name.label("author_name"),
+    AuthorProfile.rating.label("author_rating"),
+    AuthorProfile.common_genres.label("author_common_genres"),
+    AuthorProfile.books_count.label("author_books_count"),
+    AuthorProfile.reviews_count.label("author_reviews_count"),
+    AuthorProfile.likes_count.label("author_likes_count"),
+    AuthorProfile.status.label("author_status")
+)
+
 
 class BookService:
     def __init__(self, db_session: AsyncSession):
@@ -52,7 +93,7 @@ class BookService:
         
         try:
             self.db_session.add(book)
-            await self._update_author_books_count(user_context.user_id)
+            await AuthorStatisticsService(self.db_session).on_book_added(user_context.user_id)
             await self.db_session.commit()
             await self.db_session.refresh(book) 
         except Exception as e:
@@ -71,13 +112,9 @@ class BookService:
         user_context: UserContext,
         include_author: bool = True
     ) -> BookResponseDTO:
-        query = select(Book).where(Book.id == book_id)
-        
-        if include_author:
-            query = query.options(selectinload(Book.author))
+        query = BOOK_WITH_AUTHOR_BY_ID_QUERY if include_author else BOOK_BY_ID_QUERY
         
-        query = query.options(selectinload(Book.likers))
-        result = await self.db_session.execute(query)
+        result = await self.db_session.execute(query, {"book_id": book_id})
         book = result.scalar_one_or_none()
         
         if not book:
@@ -90,7 +127,55 @@ class BookService:
         ):
             raise HTTPException(status_code=403, detail=get_resource_access_response(book.status))
         
-        return BookResponseDTO.from_entity(book, include_author, True, user_context.user_id)
+        is_liked_by_me = None
+        if user_context.is_authenticated:
+            liked_result = await self.db_session.execute(
+                BOOK_LIKED_QUERY,
+                {"book_id": book_id, "user_id": user_context.user_id}
+            )
+            is_liked_by_me = liked_result.scalar()
+        
+        return BookResponseDTO.from_entity(book, include_author, is_liked_by_me)
+    
+    async def get_books_by_ids(
+        self,
+        book_ids: List[uuid.UUID],
+        user_context: UserContext,
+        include_author: bool = False
+    ) -> BookBatchResponseDTO:
+        book_ids = list(dict.fromkeys(book_ids))
+        query = BOOKS_WITH_AUTHOR_BY_IDS_QUERY if include_author else BOOKS_BY_IDS_QUERY
+
+        result = await self.db_session.execute(query, {"book_ids": book_ids})
+        books_by_id = {
+            book.id: book
+            for book in result.scalars().all()
+            if check_resource_access(user_context, book.status, book.author_id)
+        }
+
+        liked_ids = None
+        if user_context.is_authenticated and books_by_id:
+            liked_result = await self.db_session.execute(
+                LIKED_BOOK_IDS_QUERY,
+                {"user_id": user_context.user_id, "book_ids": list(books_by_id)}
+            )
+            liked_ids = set(liked_result.scalars().all())
+
+        books = []
+        missing_ids = []
+        for book_id in book_ids:
+            book = books_by_id.get(book_id)
+            if book is None:
+                missing_ids.append(str(book_id))
+                continue
+
+            books.append(BookResponseDTO.from_entity(
+                book,
+                include_author,
+                book_id in liked_ids if liked_ids is not None else None
+            ))
+
+        return BookBatchResponseDTO(books=books, missing_ids=missing_ids)
     
     async def update_book(
         self, 
@@ -98,9 +183,7 @@ class BookService:
         book_data: BookUpdateDTO,
         user_context: UserContext
     ) -> BookResponseDTO:
-        query = select(Book).where(Book.id == book_id)
-        result = await self.db_session.execute(query)
-        book = result.scalar_one_or_none()
+        book = await get_entity_loader(self.db_session).load(Book, book_id)
         
         if not book:
             raise NotFoundException("Book not found")
@@ -132,9 +215,7 @@ class BookService:
         book_id: uuid.UUID, 
         user_context: UserContext
     ) -> None:
-        query = select(Book).where(Book.id == book_id)
-        result = await self.db_session.execute(query)
-        book = result.scalar_one_or_none()
+        book = await get_entity_loader(self.db_session).load(Book, book_id)
         
         if not book:
             raise NotFoundException("Book not found")
@@ -150,8 +231,8 @@ class BookService:
         await self.db_session.execute(
             delete(Book).where(Book.id == book_id)
         )
+        await AuthorStatisticsService(self.db_session).on_book_removed(book)
         await self.db_session.commit()
-        await self._update_author_books_count(book.author_id)
     
     async def get_books_by_author(
         self, 
@@ -159,22 +240,26 @@ class BookService:
         user_context: UserContext,
         include_author: bool = False
     ) -> List[BookResponseDTO]:
-        query = select(Book).where(Book.author_id == author_id)
-        
         if include_author:
-            query = query.options(selectinload(Book.author))
+            query = select(*BOOK_LIST_COLUMNS, *BOOK_AUTHOR_LIST_COLUMNS).join(
+                AuthorProfile,
+                Book.author_id == AuthorProfile.id
+            )
+        else:
+            query = select(*BOOK_LIST_COLUMNS)
+        query = query.where(Book.author_id == author_id)
         
         result = await self.db_session.execute(query)
-        books = result.scalars().all()
+        rows = result.all()
         
         accessible_books = []
-        for book in books:
+        for row in rows:
             if check_resource_access(
                 user_context, 
-                book.status, 
-                book.author_id
+                row.status, 
+                row.author_id
             ):
-                accessible_books.append(BookResponseDTO.from_entity(book, include_author))
+                accessible_books.append(BookResponseDTO.from_row(row, include_author))
         
         return accessible_books
     
@@ -190,16 +275,3 @@ class BookService:
             return True
         
         return False
-    
-    async def _update_author_books_count(
-        self, author_id: uuid.UUID
-    ) -> None:
-        count_query = select(Book).where(Book.author_id == author_id)
-        count_result = await self.db_session.execute(count_query)
-        books_count = len(count_result.scalars().all())
-        
-        await self.db_session.execute(
-            update(AuthorProfile)
-            .where(AuthorProfile.id == author_id)
-            .values(books_count=books_count)
-        )
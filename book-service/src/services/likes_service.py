@@ -1,9 +1,13 @@
-from src.exceptions.code_exceptions import ForbiddenException, NotFoundException, ConflictException
+from src.exceptions.code_exceptions import NotFoundException, ConflictException
+from src.core.likes_counter_core import LikesCounterAggregator
 from src.middlewares.auth_middleware import UserContext
-from src.models.entities import Book, BookLike
+from src.models.entities import AuthorProfile, Book, BookLike
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update, delete, func
+from typing import Optional
 import logging
 import uuid
 
@@ -11,50 +15,71 @@ logger = logging.getLogger(__name__)
 
 
 class LikesService:
-    def __init__(self, db_session: AsyncSession, user_context: UserContext):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        user_context: UserContext,
+        likes_counter: Optional[LikesCounterAggregator] = None
+    ):
         self._db_session = db_session
         self._user_context = user_context
-    
+        self._likes_counter = likes_counter
+
+    async def _apply_like_change(self, book_id: uuid.UUID, like_statement, delta: int) -> bool:
+        """
+        Runs the like INSERT/DELETE and the book and author counter UPDATEs in one statement.
+        Returns False when the like statement did not touch a row.
+        """
+        changed = like_statement.returning(BookLike.book_id).cte("changed_like")
+
+        if self._likes_counter is not None:
+            statement = select(changed.c.book_id)
+        else:
+            updated_book = (
+                update(Book)
+                .where(Book.id.in_(select(changed.c.book_id)))
+                .values(likes_count=Book.likes_count + delta)
+                .returning(Book.author_id)
+                .cte("updated_book")
+            )
+            statement = (
+                update(AuthorProfile)
+                .where(AuthorProfile.id.in_(select(updated_book.c.author_id)))
+                .values(likes_count=func.coalesce(AuthorProfile.likes_count, 0) + delta)
+                .returning(AuthorProfile.id)
+            )
+
+        result = await self._db_session.execute(statement)
+        is_changed = result.scalar_one_or_none() is not None
+        await self._db_session.commit()
+
+        if is_changed and self._likes_counter is not None:
+            self._likes_counter.add(book_id, delta)
+        return is_changed
+
     async def add_like(self, book_id: uuid.UUID) -> None:
-        book_query = select(Book).where(Book.id == book_id)
-        book_result = await self._db_session.execute(book_query)
-        book = book_result.scalar_one_or_none()
-        
-        if not book:
-            raise NotFoundException("Book not found")
-        
-        book_like = BookLike(
-            book_id=book_id,
-            user_id=self._user_context.user_id
+        like_statement = (
+            insert(BookLike)
+            .values(book_id=book_id, user_id=self._user_context.user_id)
+            .on_conflict_do_nothing()
         )
-        book.likes_count += 1
-        
+
         try:
-            self._db_session.add(book_like)
-            await self._db_session.commit()
-        except Exception as e:
-            logger.exception(e)
+            is_added = await self._apply_like_change(book_id, like_statement, 1)
+        except IntegrityError as e:
+            # book_likes.book_id references books.id
+            await self._db_session.rollback()
+            logger.debug(e)
+            raise NotFoundException("Book not found")
+
+        if not is_added:
             raise ConflictException("Cannot add like cause of some conflicts or ruins of rules")
-    
+
     async def delete_like(self, book_id: uuid.UUID) -> None:
-        like_query = select(BookLike).where(BookLike.book_id == book_id, BookLike.user_id == self._user_context.user_id)
-        like_result = await self._db_session.execute(like_query)
-        like = like_result.scalar_one_or_none()
-        
-        book_query = select(Book).where(Book.id == book_id)
-        book_result = await self._db_session.execute(book_query)
-        book = book_result.scalar_one_or_none()
-
-        if not like:
+        like_statement = delete(BookLike).where(
+            BookLike.book_id == book_id,
+            BookLike.user_id == self._user_context.user_id
+        )
+
+        if not await self._apply_like_change(book_id, like_statement, -1):
             raise NotFoundException("Like or review not found")
-        
-        if (
-            not self._user_context.is_admin
-            and self._user_context.user_id != like.user_id
-        ):
-            raise ForbiddenException("You don't have permission to delete this like")
-        
-        book.likes_count -= 1
-        await self._db_session.delete(like)
-        await self._db_session.commit()
-    
\ No newline at end of file
@@ -0,0 +1,135 @@
+from src.services.author_statistics_service import AuthorStatisticsService
+from src.models.entities import Book, ProcessedReviewEvent
+
+from sqlalchemy import select, update, delete, values, column, Integer, Float, UUID
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+from collections import defaultdict
+from typing import Any, Dict, List
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Bounds of the Integer columns the deltas are added to
+MAX_DELTA = 2 ** 31 - 1
+
+
+class ReviewEventsService:
+    """
+    Applies review-service events to books.ratings_sum, reviews_count and
+    total_rating. Every event id is recorded in the same transaction, so
+    redelivered events are skipped.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    @staticmethod
+    def parse_event(fields: Dict[bytes, bytes]) -> Dict[str, Any]:
+        """Raises ValueError for an entry that can never be applied."""
+        try:
+            event = {key.decode(): value.decode() for key, value in fields.items()}
+            parsed = {
+                "event_id": uuid.UUID(event["event_id"]),
+                "book_id": uuid.UUID(event["book_id"]),
+                "reviews_delta": int(event["reviews_delta"]),
+                "rating_delta": int(event["rating_delta"]),
+            }
+        except (KeyError, ValueError, AttributeError) as e:
+            raise ValueError(f"Malformed review event: {e!r}")
+
+        if abs(parsed["reviews_delta"]) > MAX_DELTA or abs(parsed["rating_delta"]) > MAX_DELTA:
+            raise ValueError("Review event delta is out of range")
+        return parsed
+
+    async def apply_events(self, events: List[Dict[str, Any]]) -> int:
+        """Applies events returned by parse_event."""
+        events_by_id = {event["event_id"]: event for event in events}
+        if not events_by_id:
+            return 0
+
+        new_ids_result = await self.db_session.execute(
+            insert(ProcessedReviewEvent)
+            .values([{"event_id": event_id} for event_id in events_by_id])
+            .on_conflict_do_nothing()
+            .returning(ProcessedReviewEvent.event_id)
+        )
+        new_ids = new_ids_result.scalars().all()
+
+        reviews_deltas: Dict[uuid.UUID, int] = defaultdict(int)
+        rating_deltas: Dict[uuid.UUID, int] = defaultdict(int)
+        for event_id in new_ids:
+            event = events_by_id[event_id]
+            reviews_deltas[event["book_id"]] += event["reviews_delta"]
+            rating_deltas[event["book_id"]] += event["rating_delta"]
+
+        if reviews_deltas:
+            await self._apply_book_deltas(reviews_deltas, rating_deltas)
+
+        await self.db_session.commit()
+        return len(new_ids)
+
+    async def _apply_book_deltas(
+        self,
+        reviews_deltas: Dict[uuid.UUID, int],
+        rating_deltas: Dict[uuid.UUID, int]
+    ) -> None:
+        books_query = (
+            select(Book.id, Book.author_id, Book.total_rating, Book.ratings_sum, Book.reviews_count)
+            .where(Book.id.in_(list(reviews_deltas)))
+            .order_by(Book.id)
+            .with_for_update()
+        )
+        books_result = await self.db_session.execute(books_query)
+
+        rows = []
+        author_reviews_deltas: Dict[uuid.UUID, int] = defaultdict(int)
+        author_total_rating_deltas: Dict[uuid.UUID, float] = defaultdict(float)
+
+        for book_id, author_id, total_rating, ratings_sum, reviews_count in books_result.all():
+            new_ratings_sum = (ratings_sum or 0) + rating_deltas[book_id]
+            new_reviews_count = max((reviews_count or 0) + reviews_deltas[book_id], 0)
+            new_total_rating = new_ratings_sum / new_reviews_count if new_reviews_count > 0 else 0.0
+
+            rows.append((book_id, new_ratings_sum, new_reviews_count, new_total_rating))
+            author_reviews_deltas[author_id] += reviews_deltas[book_id]
+            author_total_rating_deltas[author_id] += new_total_rating - (total_rating or 0.0)
+
+        if not rows:
+            logger.warning(f"Review events reference unknown books: {list(reviews_deltas)}")
+            return
+
+        new_values = values(
+            column("book_id", UUID),
+            column("ratings_sum", Integer),
+            column("reviews_count", Integer),
+            column("total_rating", Float),
+            name="new_values"
+        ).data(rows)
+
+        await self.db_session.execute(
+            update(Book)
+            .where(Book.id == new_values.c.book_id)
+            .values(
+                ratings_sum=new_values.c.ratings_sum,
+                reviews_count=new_values.c.reviews_count,
+                total_rating=new_values.c.total_rating
+            )
+        )
+
+        author_statistics = AuthorStatisticsService(self.db_session)
+        for author_id in author_reviews_deltas:
+            await author_statistics.on_book_changed(
+                author_id,
+                reviews_delta=author_reviews_deltas[author_id],
+                total_rating_delta=author_total_rating_deltas[author_id]
+            )
+
+    async def prune_processed_events(self, retention_seconds: float) -> None:
+        await self.db_session.execute(
+            delete(ProcessedReviewEvent)
+            .where(ProcessedReviewEvent.processed_at < datetime.now() - timedelta(seconds=retention_seconds))
+        )
+        await self.db_session.commit()
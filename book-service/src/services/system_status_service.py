@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import update
 from typing import Optional
 import uuid
 import logging
@@ -11,6 +11,7 @@ from src.models.enums import BookStatus, AuthorProfileStatus
 from src.exceptions.code_exceptions import NotFoundException, ConflictException, BadRequestException
 from src.middlewares.access_control import check_resource_access
 from src.middlewares.auth_middleware import UserContext
+from src.core.entity_loader_core import get_entity_loader
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +26,7 @@ class StatusService:
         status_data: BookStatusUpdateDTO,
         user_context: UserContext
     ) -> StatusUpdateResponseDTO:
-        query = select(Book).where(Book.id == book_id)
-        result = await self.db_session.execute(query)
-        book = result.scalar_one_or_none()
+        book = await get_entity_loader(self.db_session).load(Book, book_id)
         
         if not book:
             raise NotFoundException("Book not found")
@@ -61,9 +60,7 @@ class StatusService:
         status_data: AuthorProfileStatusUpdateDTO,
         user_context: UserContext
     ) -> StatusUpdateResponseDTO:
-        query = select(AuthorProfile).where(AuthorProfile.id == author_id)
-        result = await self.db_session.execute(query)
-        author_profile = result.scalar_one_or_none()
+        author_profile = await get_entity_loader(self.db_session).load(AuthorProfile, author_id)
         
         if not author_profile:
             raise NotFoundException("Author profile not found")
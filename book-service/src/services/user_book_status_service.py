@@ -2,18 +2,33 @@ from src.models.crud_request_dtos import UserBookStatusCreateDTO, UserBookReadin
 from src.models.response_dtos import UserBookStatusListResponseDTO, UserBookStatusResponseDTO
 from src.exceptions.code_exceptions import BadRequestException, ForbiddenException, NoContentException, NotFoundException, ConflictException
 from src.middlewares.auth_middleware import UserContext
+from src.core.entity_loader_core import get_entity_loader
 from src.models.entities import Book, UserBookStatus
 from src.models.enums import UserBookStatusEnum
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import select, and_, desc, func, bindparam
 from datetime import datetime
 import logging
 import uuid
 
 logger = logging.getLogger(__name__)
 
+STATUSED_BOOKS_FILTER = and_(
+    UserBookStatus.user_id == bindparam("user_id"),
+    UserBookStatus.status == bindparam("status")
+)
+STATUSED_BOOKS_COUNT_QUERY = select(func.count()).select_from(UserBookStatus).where(STATUSED_BOOKS_FILTER)
+STATUSED_BOOKS_QUERY = (
+    select(UserBookStatus)
+    .where(STATUSED_BOOKS_FILTER)
+    .order_by(desc(UserBookStatus.added_date))
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+    .options(selectinload(UserBookStatus.book).selectinload(Book.author))
+)
+
 
 class UserBookStatusService:
     def __init__(self, db_session: AsyncSession, user_context: UserContext):
@@ -22,9 +37,7 @@ class UserBookStatusService:
     
     
     async def add_status(self, book_id: uuid.UUID, create_status_dto: UserBookStatusCreateDTO) -> None:
-        book_query = select(Book).where(Book.id == book_id)
-        book_result = await self._db_session.execute(book_query)
-        book = book_result.scalar_one_or_none()
+        book = await get_entity_loader(self._db_session).load(Book, book_id)
         
         if not book:
             raise NotFoundException("Book not found")
@@ -115,24 +128,20 @@ class UserBookStatusService:
         if not self._user_context.is_admin and pagination["page_size"] > 20:
             raise BadRequestException("Maximum 20 pages allowed for non-admin users")
 
-        query = select(UserBookStatus).where(
-            and_(
-                UserBookStatus.user_id == self._user_context.user_id,
-                UserBookStatus.status == status.value
-            )
-        )
-        query = query.order_by(desc(UserBookStatus.added_date))
+        params = {"user_id": self._user_context.user_id, "status": status.value}
 
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self._db_session.execute(count_query)
+        count_result = await self._db_session.execute(STATUSED_BOOKS_COUNT_QUERY, params)
         total_count = count_result.scalar()
         total_pages = (total_count + pagination["page_size"] - 1) // pagination["page_size"]
 
-        offset = (pagination["page_number"] - 1) * pagination["page_size"]
-        query = query.offset(offset).limit(pagination["page_size"])
-        query = query.options(selectinload(UserBookStatus.book).selectinload(Book.author))
-
-        result = await self._db_session.execute(query)
+        result = await self._db_session.execute(
+            STATUSED_BOOKS_QUERY,
+            {
+                **params,
+                "offset": (pagination["page_number"] - 1) * pagination["page_size"],
+                "limit": pagination["page_size"]
+            }
+        )
         books = result.scalars().all()
 
         return UserBookStatusListResponseDTO(
@@ -31,6 +31,8 @@ export async function fetch_with_refresh<T>(url: string, options?: RequestInit):
             if (refreshResponse.ok) {
                 const refreshData = await refreshResponse.json();
                 const access_token = refreshData.data.access_token;
+                // Refresh tokens are single use, the rotated one replaces the stored token
+                localStorage.setItem("refresh_token", refreshData.data.refresh_token);
                 console.log(`REFRESH: new token ${access_token}`);
                
                 response = await fetch(url, options);
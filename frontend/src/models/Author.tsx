@@ -16,4 +16,5 @@ export interface AuthorSearch {
     page_number: number;
     page_size: number;
     total_pages: number;
+    next_cursor?: string | null;
 }
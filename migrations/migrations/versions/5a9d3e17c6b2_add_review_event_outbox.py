@@ -0,0 +1,40 @@
+"""Add review event outbox
+
+Revision ID: 5a9d3e17c6b2
+Revises: e2b7c4d91f58
+Create Date: 2026-10-19 17:12:05.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9d3e17c6b2'
+down_revision: Union[str, Sequence[str], None] = 'e2b7c4d91f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'review_event_outbox',
+        sa.Column('event_id', sa.UUID(), nullable=False),
+        sa.Column('event_type', sa.String(), nullable=False),
+        sa.Column('review_id', sa.UUID(), nullable=False),
+        sa.Column('book_id', sa.UUID(), nullable=False),
+        sa.Column('reviews_delta', sa.Integer(), nullable=False),
+        sa.Column('rating_delta', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+        sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index(op.f('ix_review_event_outbox_created_at'), 'review_event_outbox', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_review_event_outbox_created_at'), table_name='review_event_outbox')
+    op.drop_table('review_event_outbox')
@@ -0,0 +1,39 @@
+"""Add likes_count to review
+
+Revision ID: a41c9e27d5b8
+Revises: 78ff73355714
+Create Date: 2026-10-19 12:04:37.512904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c9e27d5b8'
+down_revision: Union[str, Sequence[str], None] = '78ff73355714'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reviews', sa.Column('likes_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.execute(
+        """
+        UPDATE reviews SET likes_count = counts.likes_count
+        FROM (
+            SELECT review_id, count(*) AS likes_count
+            FROM review_likes
+            GROUP BY review_id
+        ) AS counts
+        WHERE reviews.id = counts.review_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('reviews', 'likes_count')
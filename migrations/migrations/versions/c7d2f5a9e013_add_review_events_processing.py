@@ -0,0 +1,47 @@
+"""Add ratings_sum to book and processed review events
+
+Revision ID: c7d2f5a9e013
+Revises: a41c9e27d5b8
+Create Date: 2026-10-19 14:21:08.337190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2f5a9e013'
+down_revision: Union[str, Sequence[str], None] = 'a41c9e27d5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('books', sa.Column('ratings_sum', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.create_table(
+        'processed_review_events',
+        sa.Column('event_id', sa.UUID(), nullable=False),
+        sa.Column('processed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index(op.f('ix_processed_review_events_processed_at'), 'processed_review_events', ['processed_at'], unique=False)
+
+    # Start the incremental counters from the actual reviews
+    op.execute(
+        """
+        UPDATE books SET
+            ratings_sum = COALESCE((SELECT SUM(rating) FROM reviews WHERE reviews.book_id = books.id), 0),
+            reviews_count = (SELECT COUNT(*) FROM reviews WHERE reviews.book_id = books.id),
+            total_rating = COALESCE((SELECT AVG(rating) FROM reviews WHERE reviews.book_id = books.id), 0.0)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_processed_review_events_processed_at'), table_name='processed_review_events')
+    op.drop_table('processed_review_events')
+    op.drop_column('books', 'ratings_sum')
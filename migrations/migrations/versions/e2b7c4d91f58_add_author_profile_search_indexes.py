@@ -0,0 +1,54 @@
+"""Add author profile search indexes
+
+Revision ID: e2b7c4d91f58
+Revises: c7d2f5a9e013
+Create Date: 2026-10-19 16:02:41.518304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c4d91f58'
+down_revision: Union[str, Sequence[str], None] = 'c7d2f5a9e013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pagination compares (sort column, id), NULLs would drop rows from every page
+    op.execute("UPDATE author_profiles SET rating = 0.0 WHERE rating IS NULL")
+    op.execute("UPDATE author_profiles SET books_count = 0 WHERE books_count IS NULL")
+    op.execute("UPDATE author_profiles SET likes_count = 0 WHERE likes_count IS NULL")
+    op.alter_column('author_profiles', 'rating', existing_type=sa.Float(), nullable=False)
+    op.alter_column('author_profiles', 'books_count', existing_type=sa.Integer(), nullable=False)
+    op.alter_column('author_profiles', 'likes_count', existing_type=sa.Integer(), nullable=False)
+
+    op.create_index('ix_author_profiles_rating_id', 'author_profiles', ['rating', 'id'], unique=False)
+    op.create_index('ix_author_profiles_likes_count_id', 'author_profiles', ['likes_count', 'id'], unique=False)
+    op.create_index('ix_author_profiles_books_count_id', 'author_profiles', ['books_count', 'id'], unique=False)
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_author_profiles_name_trgm',
+        'author_profiles',
+        [sa.text('lower(name) gin_trgm_ops')],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_author_profiles_name_trgm', table_name='author_profiles')
+    op.drop_index('ix_author_profiles_books_count_id', table_name='author_profiles')
+    op.drop_index('ix_author_profiles_likes_count_id', table_name='author_profiles')
+    op.drop_index('ix_author_profiles_rating_id', table_name='author_profiles')
+
+    op.alter_column('author_profiles', 'likes_count', existing_type=sa.Integer(), nullable=True)
+    op.alter_column('author_profiles', 'books_count', existing_type=sa.Integer(), nullable=True)
+    op.alter_column('author_profiles', 'rating', existing_type=sa.Float(), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, UUID, DateTime, String, Float, Integer, Date, ARRAY, ForeignKey, text
+from sqlalchemy import Column, UUID, DateTime, String, Float, Integer, Date, ARRAY, ForeignKey, Index, func, text
 from sqlalchemy.orm import DeclarativeBase, relationship
 from datetime import datetime
 import uuid
@@ -33,16 +33,29 @@ class AuthorProfile(Base):
     id = Column(UUID, primary_key=True, default=uuid.uuid4, server_default=text('gen_random_uuid()'))
     user_id = Column(UUID, ForeignKey('users.id'), nullable=False)
     name = Column(String, nullable=False)
-    rating = Column(Float, default=0.0, server_default=text('0.0'))
+    rating = Column(Float, nullable=False, default=0.0, server_default=text('0.0'))
     common_genres = Column(ARRAY(String))
-    books_count = Column(Integer, default=0, server_default=text('0'))
+    books_count = Column(Integer, nullable=False, default=0, server_default=text('0'))
     reviews_count = Column(Integer, default=0, server_default=text('0'))
-    likes_count = Column(Integer, default=0, server_default=text('0'))
+    likes_count = Column(Integer, nullable=False, default=0, server_default=text('0'))
     status = Column(String, nullable=False, default='ACTIVE', server_default=text("'ACTIVE'"))
 
     user = relationship("User", back_populates="author_profile")
     books = relationship("Book", back_populates="author")
 
+    # Author search: keyset pagination per sort column and name matching with pg_trgm
+    __table_args__ = (
+        Index('ix_author_profiles_rating_id', 'rating', 'id'),
+        Index('ix_author_profiles_likes_count_id', 'likes_count', 'id'),
+        Index('ix_author_profiles_books_count_id', 'books_count', 'id'),
+        Index(
+            'ix_author_profiles_name_trgm',
+            func.lower(name).label('lower_name'),
+            postgresql_using='gin',
+            postgresql_ops={'lower_name': 'gin_trgm_ops'}
+        ),
+    )
+
 class Book(Base):
     __tablename__ = 'books'
 
@@ -59,6 +72,7 @@ class Book(Base):
     likes_count = Column(Integer, default=0, server_default=text('0'))
     pages_count = Column(Integer, default=0, server_default=text('0'))
     reviews_count = Column(Integer, default=0, server_default=text('0'))
+    ratings_sum = Column(Integer, nullable=False, default=0, server_default=text('0'))
 
     author = relationship("AuthorProfile", back_populates="books")
     reviews = relationship("Review", back_populates="book")
@@ -75,6 +89,7 @@ class Review(Base):
     text = Column(String, nullable=False)
     rating = Column(Integer, nullable=False, default=0)
     added_date = Column(DateTime, nullable=False)
+    likes_count = Column(Integer, nullable=False, default=0, server_default='0')
 
     book = relationship("Book", back_populates="reviews")
     user = relationship("User", back_populates="reviews")
@@ -103,3 +118,20 @@ class ReviewLike(Base):
 
     review_id = Column(UUID, ForeignKey('reviews.id'), primary_key=True)
     user_id = Column(UUID, ForeignKey('users.id'), primary_key=True)
+
+class ProcessedReviewEvent(Base):
+    __tablename__ = 'processed_review_events'
+
+    event_id = Column(UUID, primary_key=True)
+    processed_at = Column(DateTime, nullable=False, default=datetime.now, server_default=text('NOW()'), index=True)
+
+class ReviewEventOutbox(Base):
+    __tablename__ = 'review_event_outbox'
+
+    event_id = Column(UUID, primary_key=True)
+    event_type = Column(String, nullable=False)
+    review_id = Column(UUID, nullable=False)
+    book_id = Column(UUID, nullable=False)
+    reviews_delta = Column(Integer, nullable=False)
+    rating_delta = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.now, server_default=text('NOW()'), index=True)
@@ -0,0 +1,5 @@
+#!/bin/bash
+set -e
+
+# Allows the local stand-in replica to stream WAL from this server
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
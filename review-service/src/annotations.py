@@ -1,4 +1,7 @@
-from src.core.db_core import get_db_session
+from src.services.review_events_service import ReviewEventsService
+from src.core.review_events_core import get_review_events
+from src.core.db_core import get_db_session, get_read_db_session
+from src.core.db_pool_core import get_db_pool_metrics
 from src.middlewares.auth_middleware import extract_user_context
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,11 +13,26 @@ DatabaseSession = Annotated[
     Depends(get_db_session)
 ]
 
+ReadDatabaseSession = Annotated[
+    AsyncSession,
+    Depends(get_read_db_session)
+]
+
+DatabasePoolMetrics = Annotated[
+    list,
+    Depends(get_db_pool_metrics)
+]
+
 UserContext = Annotated[
     object,
     Depends(extract_user_context)
 ]
 
+ReviewEvents = Annotated[
+    ReviewEventsService,
+    Depends(get_review_events)
+]
+
 
 def get_common_params(
     page_number: int = Query(1, ge=0),
@@ -3,7 +3,7 @@ from src.middlewares.access_control import require_access
 from src.models.response_dtos import CommonResponseModel
 from src.annotations import DatabaseSession, UserContext
 from src.services.like_service import LikeService
-from fastapi.responses import JSONResponse
+from src.utils.json_response import FastJSONResponse
 
 from fastapi import APIRouter, Request
 import logging
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 likes_router = APIRouter(prefix="/reviews/likes", tags=["Likes CRUD"])
 
 
-@likes_router.post("/{review_id}", response_class=JSONResponse, status_code=201)
+@likes_router.post("/{review_id}", response_class=FastJSONResponse, status_code=201)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -27,14 +27,17 @@ async def add_like(
     like_service = LikeService(db, user_context)
     await like_service.add_like(review_id)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.STRING,
-        data="Like added successfully"
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data="Like added successfully"
+        ),
+        status_code=201
     )
 
 
-@likes_router.delete("/{review_id}", response_class=JSONResponse, status_code=200)
+@likes_router.delete("/{review_id}", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True
@@ -48,8 +51,10 @@ async def delete_like(
     like_service = LikeService(db, user_context)
     await like_service.delete_like(review_id)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.STRING,
-        data="Like deleted successfully"
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data="Like deleted successfully"
+        )
     )
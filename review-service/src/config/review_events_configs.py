@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ReviewEventsConfig:
+    stream: str = "review-events"
+    stream_max_length: Optional[int] = 100_000
+    relay_batch_size: int = 100
+    # Outbox poll interval, commits of this process wake the relay at once
+    relay_interval: float = 1.0
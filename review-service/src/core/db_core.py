@@ -1,16 +1,98 @@
-from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig
+from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig, ReplicaConfig
+from src.core.db_pool_core import InstrumentedQueuePool, instrument_pool
 from src.globals import DB_ECHO_MODE
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional
 from sqlalchemy.orm import sessionmaker
 from fastapi import Request, FastAPI
-from typing import AsyncGenerator
-from sqlalchemy import text
+from sqlalchemy import event, text
+from redis.asyncio import Redis
 
+import asyncio
 import logging
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+# Session info keys: awaited before a commit with changes, and set once
+# the session flushed or executed an INSERT/UPDATE/DELETE
+BEFORE_WRITE_COMMIT_SESSION_KEY = "before_write_commit"
+HAS_WRITES_SESSION_KEY = "has_writes"
+
+# Shared by every process of the service, so a write served by one
+# process keeps the next reads of that user on the primary in all of them
+REPLICA_STICKY_KEY = "db:sticky:{user_key}"
+
+# A standalone server (no recovery) reports zero lag
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+def _create_engine(
+    app: FastAPI,
+    name: str,
+    connection_url: str,
+    pool_config: PoolConfig,
+    connection_config: ConnectionConfig
+) -> AsyncEngine:
+    engine = create_async_engine(
+        connection_url,
+        # asyncpg statements are prepared once per connection and reused
+        # while they stay in this LRU, 0 turns preparing off (pgbouncer)
+        connect_args={
+            "prepared_statement_cache_size": connection_config.prepared_statement_cache_size
+        },
+        query_cache_size=connection_config.query_cache_size,
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_config.pool_size,
+        max_overflow=pool_config.max_overflows,
+        pool_timeout=pool_config.pool_timeout,
+        pool_recycle=pool_config.pool_recycle,
+        pool_pre_ping=pool_config.pool_pre_ping,
+        echo=pool_config.echo,
+        echo_pool=pool_config.echo_pool,
+        hide_parameters=pool_config.hide_parameters,
+    )
+    instrument_pool(engine.sync_engine.pool, name)
+    app.state.db_engines[name] = engine
+    return engine
+
+
+def _build_connection_url(db_config: DatabaseConfig, host: str) -> str:
+    return db_config.db_url.format(
+        username=db_config.db_username,
+        password=db_config.db_password,
+        host=host,
+        bd_name=db_config.db_name
+    )
+
+
+class PrimaryAsyncSession(AsyncSession):
+    """
+    Session of the primary that awaits the request's before-write-commit
+    hook, so a user's read-your-writes mark exists before their commit is
+    visible. Commits without changes do not call it.
+    """
+
+    def _has_writes(self) -> bool:
+        return bool(self.info.get(HAS_WRITES_SESSION_KEY) or self.new or self.dirty or self.deleted)
+
+    async def commit(self) -> None:
+        before_write_commit: Optional[Callable[[], Awaitable[None]]] = self.info.get(BEFORE_WRITE_COMMIT_SESSION_KEY)
+        if before_write_commit is not None and self._has_writes():
+            await before_write_commit()
+        await super().commit()
+        self.info.pop(HAS_WRITES_SESSION_KEY, None)
+
+
 async def init_engine(
     app: FastAPI,
     db_config: DatabaseConfig,
@@ -28,28 +110,14 @@ async def init_engine(
     ):
         raise ValueError("Invalid database configuration")
 
-    connection_url = db_config.db_url.format(
-        username=db_config.db_username,
-        password=db_config.db_password,
-        host=db_config.db_host,
-        bd_name=db_config.db_name
-    )
+    connection_url = _build_connection_url(db_config, db_config.db_host)
 
-    app.state.db_engine = create_async_engine(
-        connection_url,
-        pool_size=pool_config.pool_size,
-        max_overflow=pool_config.max_overflows,
-        pool_timeout=pool_config.pool_timeout,
-        pool_recycle=pool_config.pool_recycle,
-        pool_pre_ping=pool_config.pool_pre_ping,
-        echo=pool_config.echo,
-        echo_pool=pool_config.echo_pool,
-        hide_parameters=pool_config.hide_parameters,
-    )
+    app.state.db_engines = {}
+    app.state.db_engine = _create_engine(app, "primary", connection_url, pool_config, connection_config)
 
     app.state.db_session_maker = sessionmaker(
         app.state.db_engine,
-        class_=AsyncSession
+        class_=PrimaryAsyncSession
     )
 
     logger.info(f"Database engine initialized")
@@ -66,7 +134,164 @@ async def init_engine(
     logger.info("Database is initialized")
 
 
+class DatabaseReplica:
+    def __init__(self, host: str, engine: AsyncEngine, session_maker: sessionmaker):
+        self.host = host
+        self.engine = engine
+        self.session_maker = session_maker
+        # Seconds behind the primary, None while the replica is unreachable
+        self.lag: Optional[float] = None
+
+
+class ReplicaRouter:
+    """
+    Picks a replica for read-only requests. Users who wrote recently stay on
+    the primary for `sticky_seconds` so that they read their own writes, and
+    replicas lagging more than `max_lag` seconds are skipped.
+    """
+
+    def __init__(self, replicas: List[DatabaseReplica], config: ReplicaConfig, redis_client: Redis):
+        self.replicas = replicas
+        self._config = config
+        self._redis_client = redis_client
+        self._sticky_ms = max(int(config.sticky_seconds * 1000), 1)
+        self._next = 0
+
+    async def mark_write(self, user_key: str) -> None:
+        try:
+            await self._redis_client.set(REPLICA_STICKY_KEY.format(user_key=user_key), 1, px=self._sticky_ms)
+        except Exception as e:
+            logger.warning(f"Failed to mark database write of {user_key}: {e}")
+
+    async def is_sticky(self, user_key: str) -> bool:
+        try:
+            return bool(await self._redis_client.exists(REPLICA_STICKY_KEY.format(user_key=user_key)))
+        except Exception as e:
+            # Without the mark the user may have just written, read from the primary
+            logger.warning(f"Failed to check database writes of {user_key}: {e}")
+            return True
+
+    def pick(self) -> Optional[DatabaseReplica]:
+        candidates = [
+            replica for replica in self.replicas
+            if replica.lag is not None and replica.lag <= self._config.max_lag
+        ]
+
+        if not candidates:
+            return None
+
+        self._next = (self._next + 1) % len(candidates)
+        return candidates[self._next]
+
+
+async def _check_replica_lag(replica: DatabaseReplica) -> None:
+    try:
+        async with replica.engine.connect() as connection:
+            result = await connection.execute(REPLICA_LAG_QUERY)
+            replica.lag = float(result.scalar())
+    except Exception as e:
+        if replica.lag is not None:
+            logger.warning(f"Database replica {replica.host} is unavailable: {e}")
+        replica.lag = None
+
+
+async def _replica_lag_loop(router: ReplicaRouter, interval: float) -> None:
+    while True:
+        await asyncio.gather(*(_check_replica_lag(replica) for replica in router.replicas))
+        await asyncio.sleep(interval)
+
+
+@asynccontextmanager
+async def replicas_init(
+    app: FastAPI,
+    db_config: DatabaseConfig,
+    pool_config: PoolConfig,
+    connection_config: ConnectionConfig,
+    replica_config: ReplicaConfig
+) -> None:
+    if not replica_config.hosts:
+        app.state.db_replica_router = None
+        yield
+        return
+
+    replicas = []
+    for host in replica_config.hosts:
+        engine = _create_engine(app, f"replica:{host}", _build_connection_url(db_config, host), pool_config, connection_config)
+        replicas.append(DatabaseReplica(host, engine, sessionmaker(engine, class_=AsyncSession)))
+
+    router = ReplicaRouter(replicas, replica_config, app.state.redis_client)
+    await asyncio.gather(*(_check_replica_lag(replica) for replica in replicas))
+    app.state.db_replica_router = router
+
+    lag_task = asyncio.create_task(_replica_lag_loop(router, replica_config.lag_check_interval))
+    logger.info(f"Database replicas initialized: {', '.join(replica_config.hosts)}")
+
+    try:
+        yield
+    finally:
+        lag_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await lag_task
+        for replica in replicas:
+            app.state.db_engines.pop(f"replica:{replica.host}", None)
+            await replica.engine.dispose()
+        logger.info("Database replicas disposed")
+
+
+def _get_user_key(req: Request) -> Optional[str]:
+    user_context = getattr(req.state, "user_context", None)
+    if user_context is None or user_context.user_id is None:
+        return None
+    return str(user_context.user_id)
+
+
+def _mark_user_writes(req: Request, session: AsyncSession) -> None:
+    router: Optional[ReplicaRouter] = getattr(req.app.state, "db_replica_router", None)
+    user_key = _get_user_key(req)
+
+    if router is None or not user_key:
+        return
+
+    @event.listens_for(session.sync_session, "after_flush")
+    def _after_flush(*_) -> None:
+        session.info[HAS_WRITES_SESSION_KEY] = True
+
+    @event.listens_for(session.sync_session, "do_orm_execute")
+    def _on_execute(orm_execute_state) -> None:
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            session.info[HAS_WRITES_SESSION_KEY] = True
+
+    # Awaited inside commit, the response may be sent before the code
+    # after the dependency's yield runs
+    async def _before_write_commit() -> None:
+        await router.mark_write(user_key)
+
+    session.info[BEFORE_WRITE_COMMIT_SESSION_KEY] = _before_write_commit
+
+
 async def get_db_session(req: Request) -> AsyncGenerator[AsyncSession, None]:
     async with req.app.state.db_session_maker() as session:
+        _mark_user_writes(req, session)
         yield session
 
+
+async def get_read_db_session(req: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for read-only handlers, served by a replica when one is in sync
+    and the user has not written recently. Falls back to the primary otherwise.
+    """
+    session_maker = req.app.state.db_session_maker
+    router: Optional[ReplicaRouter] = getattr(req.app.state, "db_replica_router", None)
+    user_key = _get_user_key(req)
+
+    if (
+        router is not None
+        and req.method in READ_ONLY_METHODS
+        and not (user_key and await router.is_sticky(user_key))
+    ):
+        replica = router.pick()
+        if replica is not None:
+            session_maker = replica.session_maker
+
+    async with session_maker() as session:
+        yield session
@@ -0,0 +1,30 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from typing import AsyncGenerator
+from redis.asyncio import Redis
+import logging
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def redis_client_init(
+    app: FastAPI,
+    redis_host: str, 
+    redis_port: int
+) -> None:
+    app.state.redis_client = Redis(
+        host=redis_host,
+        port=redis_port
+    )
+    logger.info("Redis client created")
+
+    try:
+        yield
+    finally:
+        await app.state.redis_client.aclose()
+        logger.info("Redis client closed")
+
+
+async def get_redis_client(req: Request) -> AsyncGenerator[Redis, None]:
+    yield req.app.state.redis_client
@@ -0,0 +1,50 @@
+from src.services.review_events_service import ReviewEventsService
+from src.config.review_events_configs import ReviewEventsConfig
+
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI, Request
+from typing import AsyncGenerator
+import asyncio
+import logging
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def _relay_loop(review_events: ReviewEventsService, config: ReviewEventsConfig) -> None:
+    while True:
+        try:
+            relayed = await review_events.relay_pending()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Events stay in the outbox until the stream is reachable again
+            logger.error(f"Failed to relay review events: {e}")
+            relayed = 0
+
+        if relayed < config.relay_batch_size:
+            await review_events.wait(config.relay_interval)
+
+
+@asynccontextmanager
+async def review_events_init(app: FastAPI, config: ReviewEventsConfig) -> None:
+    app.state.review_events = ReviewEventsService(
+        redis_client=app.state.redis_client,
+        session_maker=app.state.db_session_maker,
+        stream=config.stream,
+        stream_max_length=config.stream_max_length,
+        relay_batch_size=config.relay_batch_size
+    )
+    relay_task = asyncio.create_task(_relay_loop(app.state.review_events, config))
+    logger.info(f"Review events are relayed to {config.stream}")
+
+    try:
+        yield
+    finally:
+        relay_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await relay_task
+        logger.info("Review events relay stopped")
+
+
+async def get_review_events(req: Request) -> AsyncGenerator[ReviewEventsService, None]:
+    yield req.app.state.review_events
@@ -19,6 +19,45 @@ DB_NAME: str = os.environ.get("DB_NAME")
 DB_HOST: str = os.environ.get("DB_HOST")
 DB_URL: str = os.environ.get("DB_URL")
 DB_ECHO_MODE: bool = False
+# Connections per worker process: pool_size + max_overflow
+DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE") or 10)
+DB_POOL_MAX_OVERFLOW: int = int(os.environ.get("DB_POOL_MAX_OVERFLOW") or 10)
+DB_POOL_TIMEOUT: float = float(os.environ.get("DB_POOL_TIMEOUT") or 10)
+DB_POOL_RECYCLE: int = int(os.environ.get("DB_POOL_RECYCLE") or 1800)
+DB_POOL_PRE_PING: bool = (os.environ.get("DB_POOL_PRE_PING") or "false").lower() == "true"
+# Prepared statements kept per connection, 0 when running behind pgbouncer in transaction mode
+DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(os.environ.get("DB_PREPARED_STATEMENT_CACHE_SIZE") or 500)
+# Compiled SQL kept per engine
+DB_QUERY_CACHE_SIZE: int = int(os.environ.get("DB_QUERY_CACHE_SIZE") or 1200)
+# Comma separated replica hosts, read-only endpoints use the primary when empty
+DB_REPLICA_HOSTS: list = [host.strip() for host in (os.environ.get("DB_REPLICA_HOSTS") or "").split(",") if host.strip()]
+DB_REPLICA_MAX_LAG: float = float(os.environ.get("DB_REPLICA_MAX_LAG") or 5)
+DB_REPLICA_STICKY_SECONDS: float = float(os.environ.get("DB_REPLICA_STICKY_SECONDS") or 10)
+DB_REPLICA_LAG_CHECK_INTERVAL: float = float(os.environ.get("DB_REPLICA_LAG_CHECK_INTERVAL") or 2)
+
+#
+# User context configs
+#
+USER_CONTEXT_HEADER_NAME: str = "x-user-context"
+# Shared with the gateway, which signs the header
+USER_CONTEXT_SECRET: str = os.environ.get("USER_CONTEXT_SECRET")
+# Verified header values kept per worker
+USER_CONTEXT_CACHE_SIZE: int = int(os.environ.get("USER_CONTEXT_CACHE_SIZE") or 10000)
+
+#
+# Redis configs
+#
+REDIS_HOST: str = os.environ.get("REDIS_HOST")
+REDIS_PORT: int = int(os.environ.get("REDIS_PORT") or 6379)
+
+#
+# Review events configs
+#
+REVIEW_EVENTS_STREAM: str = "review-events"
+# Approximate length the stream is trimmed to
+REVIEW_EVENTS_STREAM_MAX_LENGTH: int = 100_000
+REVIEW_EVENTS_RELAY_BATCH_SIZE: int = 100
+REVIEW_EVENTS_RELAY_INTERVAL: float = float(os.environ.get("REVIEW_EVENTS_RELAY_INTERVAL") or 1.0)
 
 #
 # Logging config
@@ -1,8 +1,12 @@
-from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig
+from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig, ReplicaConfig
 from src.api.review_crud_router import review_crud_router
+from src.api.metrics_router import metrics_router
 from src.api.likes_router import likes_router
 from src.core.logging_core import setup_logging
-from src.core.db_core import init_engine
+from src.config.review_events_configs import ReviewEventsConfig
+from src.core.review_events_core import review_events_init
+from src.core.redis_core import redis_client_init
+from src.core.db_core import init_engine, replicas_init
 from src.exceptions.code_exceptions import CodeException
 from src.exceptions.exception_handlers import (
     pydantic_validation_exception_handler,
@@ -13,7 +17,12 @@ from src.middlewares.auth_middleware import UserContextMiddleware
 from src.globals import (
     APP_HOST, APP_PORT,
     LOGS_LEVEL, LOGS_FILENAME, LOGS_FORMAT,
-    DB_HOST, DB_URL, DB_USER, DB_PASSWORD, DB_NAME, DB_ECHO_MODE
+    DB_HOST, DB_URL, DB_USER, DB_PASSWORD, DB_NAME, DB_ECHO_MODE,
+    DB_POOL_SIZE, DB_POOL_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING,
+    DB_PREPARED_STATEMENT_CACHE_SIZE, DB_QUERY_CACHE_SIZE,
+    DB_REPLICA_HOSTS, DB_REPLICA_MAX_LAG, DB_REPLICA_STICKY_SECONDS, DB_REPLICA_LAG_CHECK_INTERVAL,
+    REDIS_HOST, REDIS_PORT, REVIEW_EVENTS_STREAM, REVIEW_EVENTS_STREAM_MAX_LENGTH,
+    REVIEW_EVENTS_RELAY_BATCH_SIZE, REVIEW_EVENTS_RELAY_INTERVAL
 )
 
 from fastapi.exceptions import RequestValidationError
@@ -43,10 +52,18 @@ async def app_lifespan(app: FastAPI) -> AsyncIterator[None]:
         db_name=DB_NAME
     )
     pool_config = PoolConfig(
+        pool_size=DB_POOL_SIZE,
+        max_overflows=DB_POOL_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
         echo=DB_ECHO_MODE,
         hide_parameters=not DB_ECHO_MODE
     )
-    connection_config = ConnectionConfig()
+    connection_config = ConnectionConfig(
+        prepared_statement_cache_size=DB_PREPARED_STATEMENT_CACHE_SIZE,
+        query_cache_size=DB_QUERY_CACHE_SIZE
+    )
 
     await init_engine(
         app=app,
@@ -55,9 +72,33 @@ async def app_lifespan(app: FastAPI) -> AsyncIterator[None]:
         connection_config=connection_config
     )
 
-    logger.info(f"Server is started on {APP_HOST}:{APP_PORT}")
-    yield
-    logger.error("Server shutdown...")
+    async with (
+        redis_client_init(app, REDIS_HOST, REDIS_PORT),
+        replicas_init(
+            app=app,
+            db_config=database_config,
+            pool_config=pool_config,
+            connection_config=connection_config,
+            replica_config=ReplicaConfig(
+                hosts=DB_REPLICA_HOSTS,
+                max_lag=DB_REPLICA_MAX_LAG,
+                sticky_seconds=DB_REPLICA_STICKY_SECONDS,
+                lag_check_interval=DB_REPLICA_LAG_CHECK_INTERVAL
+            )
+        ),
+        review_events_init(
+            app=app,
+            config=ReviewEventsConfig(
+                stream=REVIEW_EVENTS_STREAM,
+                stream_max_length=REVIEW_EVENTS_STREAM_MAX_LENGTH,
+                relay_batch_size=REVIEW_EVENTS_RELAY_BATCH_SIZE,
+                relay_interval=REVIEW_EVENTS_RELAY_INTERVAL
+            )
+        )
+    ):
+        logger.info(f"Server is started on {APP_HOST}:{APP_PORT}")
+        yield
+        logger.error("Server shutdown...")
 
 
 app = FastAPI(lifespan=app_lifespan)
@@ -66,6 +107,11 @@ app.add_middleware(UserContextMiddleware)
 
 app.include_router(likes_router)
 app.include_router(review_crud_router)
+app.include_router(metrics_router)
+
+@app.get("/ping")
+async def ping():
+    return "pong"
 
 app.add_exception_handler(RequestValidationError, pydantic_validation_exception_handler)
 app.add_exception_handler(CodeException, code_exception_handler)
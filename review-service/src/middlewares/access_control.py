@@ -1,17 +1,35 @@
 from src.exceptions.code_exceptions import ForbiddenException
 from src.middlewares.auth_middleware import get_user_context
-from fastapi import Request, HTTPException
+from fastapi import Depends, Request
 from src.models.enums import UserRole
-from typing import List, Callable
+from typing import Collection, FrozenSet, Iterable, List, Callable, Optional
 from functools import wraps
 
+import inspect
 import logging
 import uuid
 
 logger = logging.getLogger(__name__)
 
 
-class AccessControl:   
+DEFAULT_ALLOWED_STATUSES: FrozenSet[str] = frozenset({"ACTIVE"})
+
+# Keyword the policy dependency is injected under, dropped before the endpoint is called
+ACCESS_POLICY_PARAMETER = "_access_policy"
+
+
+def _status_values(statuses: Iterable) -> FrozenSet[str]:
+    return frozenset(getattr(status, "value", status) for status in statuses)
+
+
+class AccessPolicy:
+    """
+    Route access rules, built once when the route is declared and checked
+    as a FastAPI dependency before the endpoint runs.
+    """
+
+    __slots__ = ("allowed_roles", "require_authentication", "allowed_statuses", "resource_owner_check")
+
     def __init__(
         self,
         allowed_roles: List[UserRole] = None,
@@ -19,12 +37,12 @@ class AccessControl:
         allowed_statuses: List[str] = None,
         resource_owner_check: bool = False
     ):
-        self.allowed_roles = allowed_roles or [UserRole.GUEST]
+        self.allowed_roles = frozenset(allowed_roles or [UserRole.GUEST])
         self.require_authentication = require_authentication
-        self.allowed_statuses = allowed_statuses or ["ACTIVE"]
+        self.allowed_statuses = _status_values(allowed_statuses) if allowed_statuses else DEFAULT_ALLOWED_STATUSES
         self.resource_owner_check = resource_owner_check
     
-    def check_access(self, user_context, resource_owner_id: str = None) -> bool:
+    def check_access(self, user_context, resource_owner_id: uuid.UUID = None) -> bool:
         if self.require_authentication and not user_context.is_authenticated:
             return False
         
@@ -40,6 +58,26 @@ class AccessControl:
         
         return True
 
+    async def __call__(self, request: Request) -> None:
+        resource_owner_id = None
+        if self.resource_owner_check:
+            resource_owner_id = _get_path_user_id(request)
+
+        if not self.check_access(get_user_context(request), resource_owner_id):
+            raise ForbiddenException("Access denied")
+
+
+def _get_path_user_id(request: Request) -> Optional[uuid.UUID]:
+    user_id = request.path_params.get("user_id")
+    if user_id is None:
+        return None
+
+    try:
+        return uuid.UUID(str(user_id))
+    except ValueError:
+        # Rejected by the path parameter validation right after
+        return None
+
 
 def require_access(
     allowed_roles: List[UserRole] = None,
@@ -47,34 +85,32 @@ def require_access(
     allowed_statuses: List[str] = None,
     resource_owner_check: bool = False
 ):
+    policy = AccessPolicy(
+        allowed_roles=allowed_roles,
+        require_authentication=require_authentication,
+        allowed_statuses=allowed_statuses,
+        resource_owner_check=resource_owner_check
+    )
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            request = None
-            for arg in kwargs.values():
-                if isinstance(arg, Request):
-                    request = arg
-                    break
-            
-            if not request:
-                raise HTTPException(status_code=500, detail="Request not found")
-            
-            user_context = get_user_context(request)
-            access_control = AccessControl(
-                allowed_roles=allowed_roles,
-                require_authentication=require_authentication,
-                allowed_statuses=allowed_statuses,
-                resource_owner_check=resource_owner_check
-            )
-            
-            resource_owner_id = None
-            if resource_owner_check and 'user_id' in kwargs:
-                resource_owner_id = kwargs['user_id']
-            
-            if not access_control.check_access(user_context, resource_owner_id):
-                raise ForbiddenException("Access denied")
-            
+            kwargs.pop(ACCESS_POLICY_PARAMETER, None)
             return await func(*args, **kwargs)
+
+        # FastAPI reads the endpoint signature and resolves dependencies in
+        # its order, the policy goes first so a denied request is rejected
+        # before sessions and other dependencies are opened
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            inspect.Parameter(ACCESS_POLICY_PARAMETER, inspect.Parameter.KEYWORD_ONLY, default=Depends(policy)),
+            *(
+                parameter.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+                if parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD else parameter
+                for parameter in signature.parameters.values()
+            )
+        ])
+        wrapper.access_policy = policy
         
         return wrapper
     return decorator
@@ -84,11 +120,8 @@ def check_resource_access(
     user_context,
     resource_status: str,
     resource_owner_id: uuid.UUID = None,
-    allowed_statuses: List[str] = list()
+    allowed_statuses: Collection[str] = DEFAULT_ALLOWED_STATUSES
 ) -> bool: 
-    if len(allowed_statuses) == 0:
-        allowed_statuses.append("ACTIVE")
-    
     if user_context.is_admin:
         return True
     
@@ -1,15 +1,32 @@
 from fastapi import Request, HTTPException
-from typing import Optional
+from typing import Optional, Tuple
 
 from fastapi.responses import JSONResponse
-from src.exceptions.code_exceptions import BadRequestException
-from starlette.middleware.base import BaseHTTPMiddleware
+from src.exceptions.code_exceptions import BadRequestException, CodeException, UnauthorizedException
+from starlette.types import ASGIApp, Receive, Scope, Send
 from src.models.enums import UserRole, UserStatus
+from src.globals import USER_CONTEXT_HEADER_NAME, USER_CONTEXT_SECRET, USER_CONTEXT_CACHE_SIZE
+from collections import OrderedDict
 import logging
+import binascii
+import hashlib
+import base64
+import struct
+import hmac
+import time
 import uuid
+import os
 
 logger = logging.getLogger(__name__)
 
+# Layout produced by the gateway, see api-gateway/src/utils/user_context.py
+USER_CONTEXT_VERSION = 1
+USER_CONTEXT_TAG_SIZE = 16
+USER_CONTEXT_PREFIX = struct.Struct("!B16sI")
+USER_CONTEXT_FIELD_SEPARATOR = "\x1f"
+# ASGI header names are lowercase bytes
+USER_CONTEXT_HEADER_KEY = USER_CONTEXT_HEADER_NAME.encode()
+
 
 class UserContext:
     def __init__(
@@ -36,41 +53,106 @@ class UserContext:
     def is_active(self) -> bool:
         return self.user_status == UserStatus.ACTIVE
 
-    
-async def extract_user_context(request: Request) -> UserContext:
-    user_id_str = request.headers.get("X-User-Id")
-    user_name_str = request.headers.get("X-User-Name")
-    user_role_str = request.headers.get("X-User-Role", UserRole.GUEST.value)
-    user_status_str = request.headers.get("X-User-Status")
-    
-    try:
-        user_role = UserRole(user_role_str)
-    except ValueError:
-        logger.warning(f"Invalid user role: {user_role_str}")
-        raise BadRequestException(f"Invalid user role")
-    
-    user_status = None
-    if user_status_str:
+
+GUEST_USER_CONTEXT = UserContext()
+
+
+class UserContextVerifier:
+    """
+    Checks the signed user context header of the gateway. Verified values
+    are kept in an LRU until they expire, the gateway sends the same value
+    for the whole lifetime of an access token.
+    """
+
+    def __init__(self, secret: Optional[str], cache_size: int):
+        if not secret:
+            logger.warning("USER_CONTEXT_SECRET is not set, only guest requests are accepted")
+            secret = os.urandom(32).hex()
+
+        self._mac = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[int, UserContext]]" = OrderedDict()
+
+    def verify(self, header_value: str) -> UserContext:
+        cached = self._cache.get(header_value)
+        if cached is not None:
+            expires_at, user_context = cached
+            if expires_at < time.time():
+                del self._cache[header_value]
+                raise UnauthorizedException("User context has expired")
+
+            self._cache.move_to_end(header_value)
+            return user_context
+
+        expires_at, user_context = self._decode(header_value)
+
+        self._cache[header_value] = (expires_at, user_context)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return user_context
+
+    def _decode(self, header_value: str) -> Tuple[int, UserContext]:
+        try:
+            raw = base64.urlsafe_b64decode(header_value + "=" * (-len(header_value) % 4))
+        except (binascii.Error, ValueError):
+            raise BadRequestException("Invalid user context")
+
+        payload, tag = raw[:-USER_CONTEXT_TAG_SIZE], raw[-USER_CONTEXT_TAG_SIZE:]
+        mac = self._mac.copy()
+        mac.update(payload)
+        if len(payload) < USER_CONTEXT_PREFIX.size or not hmac.compare_digest(mac.digest()[:USER_CONTEXT_TAG_SIZE], tag):
+            logger.warning("User context with invalid signature")
+            raise UnauthorizedException("Invalid user context signature")
+
+        version, user_id_bytes, expires_at = USER_CONTEXT_PREFIX.unpack_from(payload)
+        if version != USER_CONTEXT_VERSION:
+            raise BadRequestException("Unsupported user context version")
+        if expires_at < time.time():
+            raise UnauthorizedException("User context has expired")
+
         try:
-            user_status = UserStatus(user_status_str)
+            role, status, name = payload[USER_CONTEXT_PREFIX.size:].decode().split(USER_CONTEXT_FIELD_SEPARATOR, 2)
+        except (UnicodeDecodeError, ValueError):
+            raise BadRequestException("Invalid user context")
+
+        try:
+            user_role = UserRole(role)
         except ValueError:
-            logger.warning(f"Invalid user status: {user_status_str}")
-            raise BadRequestException(f"Invalid user status")
-    
-    user_id = None
-    if user_id_str:
+            logger.warning(f"Invalid user role: {role}")
+            raise BadRequestException(f"Invalid user role")
+
         try:
-            user_id = uuid.UUID(user_id_str)
+            user_status = UserStatus(status)
         except ValueError:
-            logger.exception(f"Invalid uuid format: {user_id_str}")
-            raise BadRequestException(f"Invalid uuid format")
+            logger.warning(f"Invalid user status: {status}")
+            raise BadRequestException(f"Invalid user status")
+
+        return expires_at, UserContext(
+            user_id=uuid.UUID(bytes=user_id_bytes),
+            user_name=name,
+            user_role=user_role,
+            user_status=user_status
+        )
+
+
+user_context_verifier = UserContextVerifier(USER_CONTEXT_SECRET, USER_CONTEXT_CACHE_SIZE)
+
+    
+async def extract_user_context(request: Request) -> UserContext:
+    # Already verified by UserContextMiddleware
+    user_context = getattr(request.state, "user_context", None)
+    if user_context is not None:
+        return user_context
+
+    return _verify_user_context(request.headers.get(USER_CONTEXT_HEADER_NAME))
+
+
+def _verify_user_context(header_value: Optional[str]) -> UserContext:
+    if not header_value:
+        return GUEST_USER_CONTEXT
 
-    return UserContext(
-        user_id=user_id,
-        user_name=user_name_str,
-        user_role=user_role,
-        user_status=user_status
-    )
+    return user_context_verifier.verify(header_value)
 
 
 def get_user_context(request: Request) -> UserContext:
@@ -79,17 +161,36 @@ def get_user_context(request: Request) -> UserContext:
     return request.state.user_context
 
 
-class UserContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
+class UserContextMiddleware:
+    """
+    Verifies the user context header and stores the result in
+    `request.state.user_context`. Plain ASGI, so the response is passed
+    through untouched and streaming bodies are not buffered.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_value = None
+        for name, value in scope["headers"]:
+            if name == USER_CONTEXT_HEADER_KEY:
+                header_value = value.decode("latin-1")
+                break
+
         try:
-            user_context = await extract_user_context(request)
-        except BadRequestException as e:
-            return JSONResponse(status_code=400, content={
+            user_context = _verify_user_context(header_value)
+        except CodeException as e:
+            response = JSONResponse(status_code=e.status_code, content={
                 "status": "Exception",
                 "message": e.message
             })
+            await response(scope, receive, send)
+            return
 
-        request.state.user_context = user_context
-
-        response = await call_next(request)
-        return response
+        scope.setdefault("state", {})["user_context"] = user_context
+        await self.app(scope, receive, send)
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, UUID, String, Integer, DateTime, ForeignKey
 from sqlalchemy.orm import DeclarativeBase, relationship
+from datetime import datetime
 import uuid
 
 class Base(DeclarativeBase):
@@ -15,6 +16,7 @@ class Review(Base):
     text = Column(String, nullable=False)
     rating = Column(Integer, nullable=False, default=0)
     added_date = Column(DateTime, nullable=False)
+    likes_count = Column(Integer, nullable=False, default=0)
 
     likers = relationship("ReviewLike", back_populates="review", cascade="all, delete-orphan")
 
@@ -25,3 +27,14 @@ class ReviewLike(Base):
     user_id = Column(UUID, primary_key=True)
 
     review = relationship("Review", back_populates="likers", uselist=False)
+
+class ReviewEventOutbox(Base):
+    __tablename__ = 'review_event_outbox'
+
+    event_id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    event_type = Column(String, nullable=False)
+    review_id = Column(UUID, nullable=False)
+    book_id = Column(UUID, nullable=False)
+    reviews_delta = Column(Integer, nullable=False)
+    rating_delta = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
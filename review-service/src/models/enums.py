@@ -16,3 +16,8 @@ class ResponseStatus(str, Enum):
 class ResponseDataType(str, Enum):
     STRING = "str"
     JSON = "json"
+
+class ReviewEventType(str, Enum):
+    CREATED = "CREATED"
+    UPDATED = "UPDATED"
+    DELETED = "DELETED"
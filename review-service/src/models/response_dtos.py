@@ -21,21 +21,8 @@ class ReviewResponseDTO(BaseModel):
     likes_count: Optional[int]
     
     @classmethod
-    def from_entity(cls, entity: Review, count_likes: bool = None, current_user_id: str = None) -> 'ReviewResponseDTO':
-        is_liked_by_me = None
-        likes_count = None
-
-        if count_likes == True and current_user_id != None:
-            is_liked_by_me = False
-
-            for like in entity.likers:
-                if like.user_id == current_user_id:
-                    is_liked_by_me = True
-                    break
-
-            likes_count = len(entity.likers)
-
-        return cls(
+    def from_entity(cls, entity: Review, is_liked_by_me: Optional[bool] = None) -> 'ReviewResponseDTO':
+        return cls.model_construct(
             id=str(entity.id),
             book_id=str(entity.book_id),
             user_id=str(entity.user_id),
@@ -44,7 +31,7 @@ class ReviewResponseDTO(BaseModel):
             rating=entity.rating,
             added_date=entity.added_date,
             is_liked_by_me=is_liked_by_me,
-            likes_count=likes_count,
+            likes_count=entity.likes_count,
         )
 
 class ReviewsListResponseDTO(BaseModel):
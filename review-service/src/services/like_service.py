@@ -1,10 +1,11 @@
-from src.exceptions.code_exceptions import ForbiddenException, NotFoundException, ConflictException
+from src.exceptions.code_exceptions import NotFoundException, ConflictException
 from src.middlewares.auth_middleware import UserContext
 from src.models.entities import Review, ReviewLike
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update, delete
 import logging
 import uuid
 
@@ -15,41 +16,49 @@ class LikeService:
     def __init__(self, db_session: AsyncSession, user_context: UserContext):
         self._db_session = db_session
         self._user_context = user_context
+
+    async def _apply_like_change(self, like_statement, delta: int) -> bool:
+        """
+        Runs the like INSERT/DELETE and the counter UPDATE in one statement.
+        Returns False when the like statement did not touch a row.
+        """
+        changed = like_statement.returning(ReviewLike.review_id).cte("changed_like")
+        statement = (
+            update(Review)
+            .where(Review.id.in_(select(changed.c.review_id)))
+            .values(likes_count=Review.likes_count + delta)
+            .returning(Review.id)
+        )
+
+        result = await self._db_session.execute(statement)
+        review_id = result.scalar_one_or_none()
+        await self._db_session.commit()
+
+        return review_id is not None
     
     async def add_like(self, review_id: uuid.UUID) -> None:
-        review_query = select(Review).where(Review.id == review_id)
-        review_result = await self._db_session.execute(review_query)
-        review = review_result.scalar_one_or_none()
-        
-        if not review:
-            raise NotFoundException("Review not found")
-        
-        review_like = ReviewLike(
-            review_id=review_id,
-            user_id=self._user_context.user_id
+        like_statement = (
+            insert(ReviewLike)
+            .values(review_id=review_id, user_id=self._user_context.user_id)
+            .on_conflict_do_nothing()
         )
-        
+
         try:
-            self._db_session.add(review_like)
-            await self._db_session.commit()
-        except Exception as e:
-            logger.exception(e)
+            is_added = await self._apply_like_change(like_statement, 1)
+        except IntegrityError as e:
+            # review_likes.review_id references reviews.id
+            await self._db_session.rollback()
+            logger.debug(e)
+            raise NotFoundException("Review not found")
+
+        if not is_added:
             raise ConflictException("Cannot add like cause of some conflicts or ruins of rules")
     
     async def delete_like(self, review_id: uuid.UUID) -> None:
-        like_query = select(ReviewLike).where(ReviewLike.review_id == review_id, ReviewLike.user_id == self._user_context.user_id)
-        like_result = await self._db_session.execute(like_query)
-        like = like_result.scalar_one_or_none()
-        
-        if not like:
+        like_statement = delete(ReviewLike).where(
+            ReviewLike.review_id == review_id,
+            ReviewLike.user_id == self._user_context.user_id
+        )
+
+        if not await self._apply_like_change(like_statement, -1):
             raise NotFoundException("Like or review not found")
-        
-        if (
-            not self._user_context.is_admin
-            and self._user_context.user_id != like.user_id
-        ):
-            raise ForbiddenException("You don't have permission to delete this like")
-        
-        await self._db_session.delete(like)
-        await self._db_session.commit()
-    
\ No newline at end of file
@@ -0,0 +1,112 @@
+from src.models.entities import ReviewEventOutbox
+from src.models.enums import ReviewEventType
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, bindparam, any_, UUID
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import sessionmaker
+from contextlib import suppress
+from redis.asyncio import Redis
+from typing import Dict, Optional
+import asyncio
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Concurrent relays of other replicas skip the rows locked by this one
+PENDING_EVENTS_QUERY = (
+    select(ReviewEventOutbox)
+    .order_by(ReviewEventOutbox.created_at)
+    .limit(bindparam("limit"))
+    .with_for_update(skip_locked=True)
+)
+DELETE_EVENTS_QUERY = delete(ReviewEventOutbox).where(
+    ReviewEventOutbox.event_id == any_(bindparam("event_ids", type_=ARRAY(UUID)))
+)
+
+
+class ReviewEventsService:
+    """
+    Publishes review changes to a Redis stream, book-service applies them
+    to books.total_rating and books.reviews_count. Events are written to an
+    outbox table in the transaction of the review change and relayed to the
+    stream after commit, so a Redis outage delays them instead of losing them.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        session_maker: sessionmaker,
+        stream: str,
+        stream_max_length: Optional[int] = None,
+        relay_batch_size: int = 100
+    ):
+        self._redis_client = redis_client
+        self._session_maker = session_maker
+        self._stream = stream
+        self._stream_max_length = stream_max_length
+        self._relay_batch_size = relay_batch_size
+        self._wakeup = asyncio.Event()
+
+    def add(
+        self,
+        db_session: AsyncSession,
+        event_type: ReviewEventType,
+        review_id: uuid.UUID,
+        book_id: uuid.UUID,
+        reviews_delta: int,
+        rating_delta: int
+    ) -> None:
+        db_session.add(ReviewEventOutbox(
+            event_id=uuid.uuid4(),
+            event_type=event_type.value,
+            review_id=review_id,
+            book_id=book_id,
+            reviews_delta=reviews_delta,
+            rating_delta=rating_delta
+        ))
+
+    def notify(self) -> None:
+        """Wakes the relay after a commit that added events."""
+        self._wakeup.set()
+
+    async def wait(self, timeout: float) -> None:
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        self._wakeup.clear()
+
+    async def relay_pending(self) -> int:
+        async with self._session_maker() as session:
+            result = await session.execute(PENDING_EVENTS_QUERY, {"limit": self._relay_batch_size})
+            events = result.scalars().all()
+            if not events:
+                return 0
+
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                for event in events:
+                    pipe.xadd(
+                        self._stream,
+                        self._to_fields(event),
+                        maxlen=self._stream_max_length,
+                        approximate=True
+                    )
+                await pipe.execute()
+
+            # A failure past this point publishes the batch again,
+            # book-service skips event ids it has already applied
+            await session.execute(DELETE_EVENTS_QUERY, {"event_ids": [event.event_id for event in events]})
+            await session.commit()
+
+        return len(events)
+
+    @staticmethod
+    def _to_fields(event: ReviewEventOutbox) -> Dict[str, str]:
+        return {
+            "event_id": str(event.event_id),
+            "event_type": event.event_type,
+            "review_id": str(event.review_id),
+            "book_id": str(event.book_id),
+            "reviews_delta": event.reviews_delta,
+            "rating_delta": event.rating_delta,
+        }
@@ -2,80 +2,143 @@ from src.exceptions.code_exceptions import ForbiddenException, NoContentExceptio
 from src.models.response_dtos import ReviewResponseDTO, ReviewsListResponseDTO
 from src.models.crud_request_dtos import ReviewCreateDTO, ReviewUpdateDTO
 from src.middlewares.auth_middleware import UserContext
+from src.services.review_events_service import ReviewEventsService
 from src.models.entities import Review, ReviewLike
+from src.models.enums import ReviewEventType
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy import select, func, desc, asc, and_
+from sqlalchemy import select, func, desc, asc, and_, bindparam, any_, UUID
+from sqlalchemy.dialects.postgresql import ARRAY
+from typing import List, Optional, Set
 from datetime import datetime
 import logging
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# Prebuilt hot statements, executed with bound parameters
+MY_REVIEW_QUERY = select(Review).where(
+    Review.book_id == bindparam("book_id"),
+    Review.user_id == bindparam("user_id")
+)
+BOOK_REVIEWS_COUNT_QUERY = select(func.count()).select_from(Review).where(Review.book_id == bindparam("book_id"))
+BOOK_REVIEWS_SORT_COLUMNS = {
+    'rating': Review.rating,
+    'added_date': Review.added_date,
+}
+BOOK_REVIEWS_QUERIES = {
+    (sort_by, sort_order): (
+        select(Review)
+        .where(Review.book_id == bindparam("book_id"))
+        .order_by(order(column))
+        .offset(bindparam("offset"))
+        .limit(bindparam("limit"))
+    )
+    for sort_by, column in BOOK_REVIEWS_SORT_COLUMNS.items()
+    for sort_order, order in (('desc', desc), ('asc', asc))
+}
+LIKED_REVIEW_IDS_QUERY = select(ReviewLike.review_id).where(
+    ReviewLike.user_id == bindparam("user_id"),
+    ReviewLike.review_id == any_(bindparam("review_ids", type_=ARRAY(UUID)))
+)
+
 
 class ReviewService:
-    def __init__(self, db_session: AsyncSession, user_context: UserContext):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        user_context: UserContext,
+        review_events: Optional[ReviewEventsService] = None
+    ):
         self._db_session = db_session
         self._user_context = user_context
+        self._review_events = review_events
+
+    def _add_event(
+        self,
+        event_type: ReviewEventType,
+        review_id: uuid.UUID,
+        book_id: uuid.UUID,
+        reviews_delta: int,
+        rating_delta: int
+    ) -> None:
+        # Written to the outbox, committed together with the review change
+        if self._review_events is None:
+            return
+        self._review_events.add(self._db_session, event_type, review_id, book_id, reviews_delta, rating_delta)
+
+    def _notify_events(self) -> None:
+        if self._review_events is not None:
+            self._review_events.notify()
     
 
-    def _get_sort_column(self, sort_by: str | None):
-        sort_columns = {
-            'rating': Review.rating,
-            'added_date': Review.added_date,
-        }
+    def _get_book_reviews_query(self, sort_by: str | None, sort_order: str | None):
+        sort_by = sort_by or 'added_date'
+        sort_order = sort_order or 'desc'
 
-        if not sort_by:
-            return Review.added_date
-        elif sort_by in sort_columns:
-            return sort_columns.get(sort_columns[sort_by])
-        else:
+        if sort_by not in BOOK_REVIEWS_SORT_COLUMNS:
             raise BadRequestException("Invalid parametr for sort field")
+        if sort_order not in ('desc', 'asc'):
+            raise BadRequestException("Invalid parametr for sort order")
+
+        return BOOK_REVIEWS_QUERIES[(sort_by, sort_order)]
+
+    async def _get_liked_review_ids(self, review_ids: List[uuid.UUID]) -> Optional[Set[uuid.UUID]]:
+        if not self._user_context.is_authenticated:
+            return None
+        if not review_ids:
+            return set()
+
+        liked_result = await self._db_session.execute(
+            LIKED_REVIEW_IDS_QUERY,
+            {"user_id": self._user_context.user_id, "review_ids": review_ids}
+        )
+        return set(liked_result.scalars().all())
 
     async def get_reviews_by_book_id(self, book_id: uuid.UUID, pagination: dict) -> ReviewsListResponseDTO:
         if not self._user_context.is_admin and pagination["page_size"] > 20:
             raise BadRequestException("Maximum 20 pages allowed for non-admin users")
         
-        my_review_query = select(Review).where(
-            and_(
-                Review.book_id == book_id,
-                Review.user_id == self._user_context.user_id
-            )
-        )
-        my_review_query = my_review_query.options(selectinload(Review.likers))
-        my_review_result = await self._db_session.execute(my_review_query)
-        my_review = my_review_result.scalar_one_or_none()
+        query = self._get_book_reviews_query(pagination["sort_by"], pagination["sort_order"])
 
-        query = select(Review).where(Review.book_id == book_id)
+        my_review = None
+        if self._user_context.is_authenticated:
+            my_review_result = await self._db_session.execute(
+                MY_REVIEW_QUERY,
+                {"book_id": book_id, "user_id": self._user_context.user_id}
+            )
+            my_review = my_review_result.scalar_one_or_none()
 
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self._db_session.execute(count_query)
+        count_result = await self._db_session.execute(BOOK_REVIEWS_COUNT_QUERY, {"book_id": book_id})
         total_count = count_result.scalar()
         total_pages = (total_count + pagination["page_size"] - 1) // pagination["page_size"]
 
-        sort_column = self._get_sort_column(pagination["sort_by"])
-
-        if pagination["sort_order"] == None or pagination["sort_order"] == 'desc':
-            query = query.order_by(desc(sort_column))
-        elif pagination["sort_order"] == 'asc':
-            query = query.order_by(asc(sort_column))
-        else:
-            raise BadRequestException("Invalid parametr for sort order")
-
-        offset = (pagination["page_number"] - 1) * pagination["page_size"]
-        query = query.offset(offset).limit(pagination["page_size"])
-        query = query.options(selectinload(Review.likers))
-
-        result = await self._db_session.execute(query)
+        result = await self._db_session.execute(
+            query,
+            {
+                "book_id": book_id,
+                "offset": (pagination["page_number"] - 1) * pagination["page_size"],
+                "limit": pagination["page_size"]
+            }
+        )
         reviews = result.scalars().all()
         
-        found_reviews = []
+        shown_reviews = []
         if my_review and pagination["page_number"] == 1: 
-            found_reviews.append(ReviewResponseDTO.from_entity(my_review, True, self._user_context.user_id))
+            shown_reviews.append(my_review)
         for i in reviews: 
             if i.user_id == self._user_context.user_id: continue
-            found_reviews.append(ReviewResponseDTO.from_entity(i, True, self._user_context.user_id))
+            shown_reviews.append(i)
+
+        liked_review_ids = await self._get_liked_review_ids([i.id for i in shown_reviews])
+
+        found_reviews = [
+            ReviewResponseDTO.from_entity(
+                i, 
+                i.id in liked_review_ids if liked_review_ids is not None else None
+            )
+            for i in shown_reviews
+        ]
 
         return ReviewsListResponseDTO(
             reviews=found_reviews,
@@ -109,13 +172,16 @@ class ReviewService:
             await self._db_session.flush()
 
             new_review_dto = ReviewResponseDTO.from_entity(new_review)
+            self._add_event(ReviewEventType.CREATED, new_review.id, new_review.book_id, 1, new_review.rating)
 
             await self._db_session.commit()
-
-            return new_review_dto
         except Exception as e:
             logger.exception(e)
             raise ConflictException("Cannot create review cause of some conflicts or ruins of rules")
+
+        self._notify_events()
+
+        return new_review_dto
     
     async def update_review(self, review_id: uuid.UUID, review_update_dto: ReviewUpdateDTO) -> ReviewResponseDTO:
         review_query = select(Review).where(Review.id == review_id)
@@ -131,6 +197,7 @@ class ReviewService:
         ):
             raise ForbiddenException("You don't have permission to modify this review")
         
+        old_rating = review.rating
         is_smth_changed = False
         if review_update_dto.text is not None:
             review.text = review_update_dto.text
@@ -144,13 +211,18 @@ class ReviewService:
                 await self._db_session.flush()
 
                 updated_review_dto = ReviewResponseDTO.from_entity(review)
+                if review.rating != old_rating:
+                    self._add_event(ReviewEventType.UPDATED, review.id, review.book_id, 0, review.rating - old_rating)
 
                 await self._db_session.commit()
-
-                return updated_review_dto
             except Exception as e:
                 logger.exception(e)
                 raise ConflictException("Cannot add status cause of some conflicts or ruins of rules")
+
+            if updated_review_dto.rating != old_rating:
+                self._notify_events()
+
+            return updated_review_dto
         else:
             raise NoContentException("Nothing changed")
     
@@ -168,7 +240,11 @@ class ReviewService:
         ):
             raise ConflictException("You don't have permission to modify this review")
 
+        self._add_event(ReviewEventType.DELETED, review.id, review.book_id, -1, -review.rating)
+
         await self._db_session.delete(review)
         await self._db_session.commit()
+
+        self._notify_events()
         
     
\ No newline at end of file
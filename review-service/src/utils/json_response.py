@@ -0,0 +1,30 @@
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from typing import Any
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that serialises Pydantic models straight to bytes in
+    pydantic-core, without the `jsonable_encoder` dict pass and `json.dumps`.
+    Endpoints return it directly, FastAPI passes Response objects through
+    untouched. Plain dicts and lists go through orjson when it is installed.
+    Types unknown to both fall back to `jsonable_encoder` as before.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None or isinstance(content, BaseModel):
+            return pydantic_core.to_json(content, fallback=jsonable_encoder)
+
+        return orjson.dumps(content, default=_to_jsonable)
+
+
+def _to_jsonable(value: Any) -> Any:
+    return pydantic_core.to_jsonable_python(value, fallback=jsonable_encoder)
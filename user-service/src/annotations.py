@@ -1,6 +1,12 @@
 from src.middlewares.auth_middleware import extract_user_context
 from src.core.redis_core import get_redis_client
-from src.core.db_core import get_db_session
+from src.core.db_core import get_db_session, get_read_db_session
+from src.core.db_pool_core import get_db_pool_metrics
+from src.core.password_hasher_core import PasswordHasherPool, get_password_hasher
+from src.core.latency_metrics_core import LatencyMetricsRegistry, get_latency_metrics
+from src.core.user_cache_core import UserLookupCache, get_user_cache
+from src.core.session_store_core import RefreshSessionStore, get_session_store
+from src.core.token_signing_core import TokenSigningKeys, get_token_signing_keys
 
 from fastapi import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +18,16 @@ DatabaseSession = Annotated[
     Depends(get_db_session)
 ]
 
+ReadDatabaseSession = Annotated[
+    AsyncSession,
+    Depends(get_read_db_session)
+]
+
+DatabasePoolMetrics = Annotated[
+    list,
+    Depends(get_db_pool_metrics)
+]
+
 UserContext = Annotated[
     object,
     Depends(extract_user_context)
@@ -22,6 +38,31 @@ RedisClient = Annotated[
     Depends(get_redis_client)
 ]
 
+PasswordHasher = Annotated[
+    PasswordHasherPool,
+    Depends(get_password_hasher)
+]
+
+LatencyMetrics = Annotated[
+    LatencyMetricsRegistry,
+    Depends(get_latency_metrics)
+]
+
+UserCache = Annotated[
+    UserLookupCache,
+    Depends(get_user_cache)
+]
+
+SessionStore = Annotated[
+    RefreshSessionStore,
+    Depends(get_session_store)
+]
+
+SigningKeys = Annotated[
+    TokenSigningKeys,
+    Depends(get_token_signing_keys)
+]
+
 
 def get_common_params(
     page_number: int = Query(1, ge=0),
@@ -2,9 +2,10 @@ from src.models.enums import ResponseDataType, ResponseStatus
 from src.models.request_dtos import RefreshTokenDTO, UserRegistrationDTO, UserLoginDTO
 from src.models.response_dtos import CommonResponseModel
 from src.services.auth_service import AuthService
-from src.annotations import DatabaseSession, UserContext, RedisClient 
+from src.globals import TOKEN_JWKS_MAX_AGE
+from src.annotations import DatabaseSession, UserContext, RedisClient, PasswordHasher, LatencyMetrics, SessionStore, SigningKeys
+from src.utils.json_response import FastJSONResponse
 from fastapi import APIRouter, Request, Response
-from fastapi.responses import JSONResponse
 import logging
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -12,43 +13,70 @@ logger: logging.Logger = logging.getLogger(__name__)
 auth_router = APIRouter(prefix="/users", tags=["Auth"])
 
 
-@auth_router.post("/register", response_class=JSONResponse, status_code=200)
+@auth_router.post("/register", response_class=FastJSONResponse, status_code=200)
 async def register(
     user_reg_dto: UserRegistrationDTO,
     db: DatabaseSession,
+    password_hasher: PasswordHasher,
+    latency_metrics: LatencyMetrics,
+    session_store: SessionStore,
+    signing_keys: SigningKeys,
 ):
-    auth_service = AuthService(db)
+    auth_service = AuthService(db, password_hasher, latency_metrics, session_store, signing_keys)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await auth_service.register(user_reg_dto),
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await auth_service.register(user_reg_dto),
+        )
     )
 
 
-@auth_router.post("/login", response_class=JSONResponse, status_code=200)
+@auth_router.post("/login", response_class=FastJSONResponse, status_code=200)
 async def login(
     user_login_dto: UserLoginDTO,
     db: DatabaseSession,
+    password_hasher: PasswordHasher,
+    latency_metrics: LatencyMetrics,
+    session_store: SessionStore,
+    signing_keys: SigningKeys,
 ):
-    auth_service = AuthService(db)
+    auth_service = AuthService(db, password_hasher, latency_metrics, session_store, signing_keys)
     
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await auth_service.login(user_login_dto),
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await auth_service.login(user_login_dto),
+        )
     )
 
 
-@auth_router.post("/refresh", response_class=JSONResponse, status_code=200)
+@auth_router.post("/refresh", response_class=FastJSONResponse, status_code=200)
 async def refresh(
     refresh_token_dto: RefreshTokenDTO,
     db: DatabaseSession,
+    password_hasher: PasswordHasher,
+    latency_metrics: LatencyMetrics,
+    session_store: SessionStore,
+    signing_keys: SigningKeys,
 ):
-    auth_service = AuthService(db)
+    auth_service = AuthService(db, password_hasher, latency_metrics, session_store, signing_keys)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await auth_service.refresh(refresh_token_dto),
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await auth_service.refresh(refresh_token_dto),
+        )
+    )
+
+
+@auth_router.get("/.well-known/jwks.json", status_code=200)
+async def jwks(signing_keys: SigningKeys):
+    return Response(
+        content=signing_keys.jwks_body,
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={TOKEN_JWKS_MAX_AGE}"}
     )
@@ -3,10 +3,10 @@ from src.models.response_dtos import CommonResponseModel
 from src.models.request_dtos import UserUpdateDTO
 from src.models.enums import UserRole
 from src.middlewares.access_control import require_access
-from src.annotations import UserContext
+from src.annotations import UserContext, UserCache, SessionStore
 from src.services.user_service import UserService
-from src.annotations import DatabaseSession
-from fastapi.responses import JSONResponse
+from src.annotations import DatabaseSession, ReadDatabaseSession
+from src.utils.json_response import FastJSONResponse
 
 from fastapi import APIRouter, Request
 import uuid
@@ -19,7 +19,7 @@ logger: logging.Logger = logging.getLogger(__name__)
 user_crud_router = APIRouter(prefix="/users", tags=["User CREDS"])
 
 
-@user_crud_router.get("/{user_id}", response_class=JSONResponse, status_code=200)
+@user_crud_router.get("/{user_id}", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True,
@@ -28,19 +28,22 @@ user_crud_router = APIRouter(prefix="/users", tags=["User CREDS"])
 async def get_user_by_id(
     request: Request,
     user_id: uuid.UUID,
-    db: DatabaseSession,
-    user_context: UserContext
+    db: ReadDatabaseSession,
+    user_context: UserContext,
+    user_cache: UserCache
 ):
-    user_service = UserService(db, user_context)
+    user_service = UserService(db, user_context, user_cache)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await user_service.get_user_by_id(user_id),
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await user_service.get_user_by_id(user_id),
+        )
     )
 
 
-@user_crud_router.put("/{user_id}", response_class=JSONResponse, status_code=200)
+@user_crud_router.put("/{user_id}", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True,
@@ -51,18 +54,22 @@ async def update_user(
     user_id: uuid.UUID,
     update_user_dto: UserUpdateDTO,
     db: DatabaseSession,
-    user_context: UserContext
+    user_context: UserContext,
+    user_cache: UserCache,
+    session_store: SessionStore
 ):
-    user_service = UserService(db, user_context)
+    user_service = UserService(db, user_context, user_cache, session_store)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.JSON,
-        data=await user_service.update_user(user_id, update_user_dto),
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.JSON,
+            data=await user_service.update_user(user_id, update_user_dto),
+        )
     )
 
 
-@user_crud_router.delete("/{user_id}", response_class=JSONResponse, status_code=200)
+@user_crud_router.delete("/{user_id}", response_class=FastJSONResponse, status_code=200)
 @require_access(
     allowed_roles=[UserRole.USER, UserRole.ADMIN],
     require_authentication=True,
@@ -72,12 +79,41 @@ async def delete_user(
     request: Request,
     user_id: uuid.UUID,
     db: DatabaseSession,
-    user_context: UserContext
+    user_context: UserContext,
+    user_cache: UserCache,
+    session_store: SessionStore
+):
+    user_service = UserService(db, user_context, user_cache, session_store)
+
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data=await user_service.delete_user(user_id),
+        )
+    )
+
+
+@user_crud_router.post("/{user_id}/sessions/revoke", response_class=FastJSONResponse, status_code=200)
+@require_access(
+    allowed_roles=[UserRole.USER, UserRole.ADMIN],
+    require_authentication=True,
+    resource_owner_check=True
+)
+async def revoke_user_sessions(
+    request: Request,
+    user_id: uuid.UUID,
+    db: DatabaseSession,
+    user_context: UserContext,
+    user_cache: UserCache,
+    session_store: SessionStore
 ):
-    user_service = UserService(db, user_context)
+    user_service = UserService(db, user_context, user_cache, session_store)
 
-    return CommonResponseModel(
-        status=ResponseStatus.SUCCESS,
-        data_type=ResponseDataType.STRING,
-        data=await user_service.delete_user(user_id),
+    return FastJSONResponse(
+        CommonResponseModel(
+            status=ResponseStatus.SUCCESS,
+            data_type=ResponseDataType.STRING,
+            data=await user_service.revoke_sessions(user_id),
+        )
     )
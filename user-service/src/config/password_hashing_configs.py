@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+@dataclass
+class PasswordHashingConfig:
+    rounds: int = 12
+    workers: int = 2
+    max_queue: int = 16
+    queue_timeout: float = 2.0
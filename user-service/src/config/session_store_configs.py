@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+@dataclass
+class SessionStoreConfig:
+    session_ttl: int = 7 * 24 * 60 * 60
+    # Access tokens issued before a revocation stay valid for at most this long
+    revocation_window: int = 10 * 60
+    key_prefix: str = "users:sessions:"
+    revocation_channel: str = "users:revocations"
+    recent_revocations_key: str = "users:revocations:recent"
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class TokenSigningConfig:
+    keys_directory: str = "keys"
+    # Key id (file name without .pem) used for signing, the last one by name when empty
+    active_key_id: Optional[str] = None
+    # Algorithm of the key generated when the directory is empty: EdDSA or ES256
+    generated_key_algorithm: str = "EdDSA"
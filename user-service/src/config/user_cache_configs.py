@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+@dataclass
+class UserCacheConfig:
+    local_max_size: int = 10000
+    local_ttl: float = 5.0
+    redis_ttl: int = 60
+    # Seconds an invalidated user is not cached again, longer than a fill takes
+    invalidation_hold: int = 5
+    key_prefix: str = "users:cache:"
+    invalidation_channel: str = "users:invalidate"
@@ -0,0 +1,69 @@
+from fastapi import FastAPI, Request
+from typing import AsyncGenerator, Dict, List
+import time
+
+# Upper bounds of the latency histogram, in milliseconds
+LATENCY_BUCKETS_MS: List[float] = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class LatencyHistogram:
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+        latency_ms = seconds * 1000
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def snapshot(self) -> dict:
+        buckets = {
+            f"le_{bound:g}ms": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)
+        }
+        buckets["le_inf"] = self.buckets[-1]
+
+        return {
+            "name": self.name,
+            "count": self.count,
+            "avg_ms": (self.total / self.count * 1000) if self.count else 0.0,
+            "max_ms": self.max * 1000,
+            "buckets": buckets
+        }
+
+
+class LatencyMetricsRegistry:
+    def __init__(self):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = LatencyHistogram(name)
+            self._histograms[name] = histogram
+        return histogram
+
+    def observe(self, name: str, started_at: float) -> None:
+        self.histogram(name).observe(time.perf_counter() - started_at)
+
+    def snapshot(self) -> List[dict]:
+        return [histogram.snapshot() for histogram in self._histograms.values()]
+
+
+def latency_metrics_init(app: FastAPI) -> LatencyMetricsRegistry:
+    app.state.latency_metrics = LatencyMetricsRegistry()
+    return app.state.latency_metrics
+
+
+async def get_latency_metrics(req: Request) -> AsyncGenerator[LatencyMetricsRegistry, None]:
+    yield req.app.state.latency_metrics
@@ -0,0 +1,123 @@
+from src.exceptions.code_exceptions import ServiceUnavailableException
+from src.config.password_hashing_configs import PasswordHashingConfig
+from src.core.latency_metrics_core import LatencyMetricsRegistry
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator, Callable, TypeVar
+from fastapi import FastAPI, Request
+import asyncio
+import logging
+import bcrypt
+import time
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+ResultType = TypeVar("ResultType")
+
+
+class PasswordHasherPool:
+    """
+    Runs bcrypt in a dedicated thread pool. bcrypt releases the GIL, so the
+    event loop keeps serving other requests meanwhile. Admission is bounded:
+    a request is rejected with 503 when `workers + max_queue` jobs are
+    already pending, or when its job waited longer than `queue_timeout`.
+    """
+
+    def __init__(self, config: PasswordHashingConfig, metrics: LatencyMetricsRegistry):
+        self._config = config
+        self._metrics = metrics
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.workers,
+            thread_name_prefix="password-hasher"
+        )
+        self._pending = 0
+
+    @property
+    def rounds(self) -> int:
+        return self._config.rounds
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+    @staticmethod
+    def _call_in_loop(loop: asyncio.AbstractEventLoop, callback: Callable[[], None]) -> None:
+        # Jobs cancelled by shutdown may finish after the loop is closed
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(callback)
+
+    async def _run(self, operation: str, func: Callable[..., ResultType], *args) -> ResultType:
+        if self._pending >= self._config.workers + self._config.max_queue:
+            logger.warning(f"Password hashing queue is full, rejecting {operation}")
+            raise ServiceUnavailableException("Authentication is overloaded, try again later")
+
+        submitted_at = time.perf_counter()
+
+        def _job():
+            started_at = time.perf_counter()
+            # The job sat in the queue too long, skip the expensive work
+            if started_at - submitted_at > self._config.queue_timeout:
+                return True, None, started_at, started_at
+            return False, func(*args), started_at, time.perf_counter()
+
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        future = self._executor.submit(_job)
+        # Released when the job leaves the pool, a cancelled caller does not
+        # free the slot while its job is still queued or running
+        future.add_done_callback(lambda _: self._call_in_loop(loop, self._release))
+
+        is_expired, result, started_at, finished_at = await asyncio.wrap_future(future)
+
+        self._metrics.histogram("password_hash_queue_wait").observe(started_at - submitted_at)
+        if is_expired:
+            logger.warning(f"Password {operation} waited too long in the queue")
+            raise ServiceUnavailableException("Authentication is overloaded, try again later")
+
+        self._metrics.histogram(operation).observe(finished_at - started_at)
+        return result
+
+    async def hash(self, password: str) -> str:
+        def _hash() -> str:
+            salt = bcrypt.gensalt(rounds=self._config.rounds)
+            return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+        return await self._run("password_hash", _hash)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(
+            "password_verify",
+            bcrypt.checkpw,
+            password.encode('utf-8'),
+            hashed_password.encode('utf-8')
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # bcrypt hashes look like $2b$12$<salt and hash>
+        try:
+            rounds = int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return True
+        return rounds != self._config.rounds
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@asynccontextmanager
+async def password_hasher_init(
+    app: FastAPI,
+    config: PasswordHashingConfig
+) -> None:
+    app.state.password_hasher = PasswordHasherPool(config, app.state.latency_metrics)
+    logger.info(f"Password hasher started with {config.workers} workers")
+
+    try:
+        yield
+    finally:
+        app.state.password_hasher.shutdown()
+        logger.info("Password hasher stopped")
+
+
+async def get_password_hasher(req: Request) -> AsyncGenerator[PasswordHasherPool, None]:
+    yield req.app.state.password_hasher
@@ -0,0 +1,185 @@
+from src.config.session_store_configs import SessionStoreConfig
+from src.exceptions.code_exceptions import UnauthorizedException, ServiceUnavailableException
+from src.models.entities import User
+
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Dict, Tuple
+from fastapi import FastAPI, Request
+from redis.exceptions import RedisError
+from redis.asyncio import Redis
+import logging
+import json
+import time
+import uuid
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Claims copied into every access token, kept per user so refresh never reads the database
+SESSION_CLAIMS = ("name", "role", "status", "blocked_for")
+
+# KEYS: family, user. ARGV: user id, token id, ttl, claims...
+CREATE_SESSION_SCRIPT = """
+local generation = redis.call('HGET', KEYS[2], 'generation') or '0'
+redis.call('HSET', KEYS[2], 'generation', generation,
+    'name', ARGV[4], 'role', ARGV[5], 'status', ARGV[6], 'blocked_for', ARGV[7])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+redis.call('HSET', KEYS[1], 'user_id', ARGV[1], 'jti', ARGV[2], 'generation', generation)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+# KEYS: family, user. ARGV: user id, presented token id, new token id, ttl
+ROTATE_SESSION_SCRIPT = """
+local session = redis.call('HMGET', KEYS[1], 'user_id', 'jti', 'generation')
+if session[1] ~= ARGV[1] then
+    return {0}
+end
+local user = redis.call('HMGET', KEYS[2], 'generation', 'name', 'role', 'status', 'blocked_for')
+if session[3] ~= user[1] then
+    redis.call('DEL', KEYS[1])
+    return {-1}
+end
+if session[2] ~= ARGV[2] then
+    redis.call('DEL', KEYS[1])
+    return {-2}
+end
+redis.call('HSET', KEYS[1], 'jti', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return {1, user[2], user[3], user[4], user[5]}
+"""
+
+# KEYS: user. ARGV: claims...
+UPDATE_CLAIMS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HSET', KEYS[1], 'name', ARGV[1], 'role', ARGV[2], 'status', ARGV[3], 'blocked_for', ARGV[4])
+end
+return 1
+"""
+
+
+def get_session_claims(user: User) -> Dict[str, str]:
+    return {
+        "name": user.username,
+        "role": user.role,
+        "status": user.status,
+        "blocked_for": str(user.blocked_for),
+    }
+
+
+class RefreshSessionStore:
+    """
+    Server-side record of refresh token families. Every refresh rotates the
+    token id of its family, presenting an already rotated token drops the
+    whole family. Revoking a user bumps a per-user generation, so all of its
+    families become invalid at once, and announces it on a pub/sub channel
+    for the gateway.
+    """
+
+    def __init__(self, redis_client: Redis, config: SessionStoreConfig):
+        self._redis = redis_client
+        self._config = config
+        self._create_script = redis_client.register_script(CREATE_SESSION_SCRIPT)
+        self._rotate_script = redis_client.register_script(ROTATE_SESSION_SCRIPT)
+        self._update_claims_script = redis_client.register_script(UPDATE_CLAIMS_SCRIPT)
+
+    def _family_key(self, family_id: str) -> str:
+        return self._config.key_prefix + "family:" + family_id
+
+    def _user_key(self, user_id: str) -> str:
+        return self._config.key_prefix + "user:" + user_id
+
+    async def create(self, user_id: str, claims: Dict[str, str]) -> Tuple[str, str]:
+        family_id = uuid.uuid4().hex
+        token_id = uuid.uuid4().hex
+
+        try:
+            await self._create_script(
+                keys=[self._family_key(family_id), self._user_key(user_id)],
+                args=[user_id, token_id, self._config.session_ttl, *(claims[name] for name in SESSION_CLAIMS)]
+            )
+        except RedisError as e:
+            logger.error(f"Cannot create session for user {user_id}: {e}")
+            raise ServiceUnavailableException("Session store is unavailable")
+
+        return family_id, token_id
+
+    async def rotate(self, user_id: str, family_id: str, token_id: str) -> Tuple[str, Dict[str, str]]:
+        new_token_id = uuid.uuid4().hex
+
+        try:
+            result = await self._rotate_script(
+                keys=[self._family_key(family_id), self._user_key(user_id)],
+                args=[user_id, token_id, new_token_id, self._config.session_ttl]
+            )
+        except RedisError as e:
+            logger.error(f"Cannot rotate session {family_id}: {e}")
+            raise ServiceUnavailableException("Session store is unavailable")
+
+        code = result[0]
+        if code == 0:
+            raise UnauthorizedException("Session has expired")
+        if code == -1:
+            raise UnauthorizedException("Session has been revoked")
+        if code == -2:
+            logger.warning(f"Refresh token reuse in session {family_id} of user {user_id}, session revoked")
+            raise UnauthorizedException("Session has been revoked")
+
+        return new_token_id, {name: value.decode() for name, value in zip(SESSION_CLAIMS, result[1:])}
+
+    async def update_claims(self, user_id: str, claims: Dict[str, str]) -> None:
+        try:
+            await self._update_claims_script(
+                keys=[self._user_key(user_id)],
+                args=[claims[name] for name in SESSION_CLAIMS]
+            )
+        except RedisError as e:
+            # Sessions keep the old claims until the next login
+            logger.warning(f"Cannot update session claims of user {user_id}: {e}")
+
+    async def revoke_family(self, family_id: str) -> None:
+        try:
+            await self._redis.delete(self._family_key(family_id))
+        except RedisError as e:
+            logger.error(f"Cannot revoke session {family_id}: {e}")
+            raise ServiceUnavailableException("Session store is unavailable")
+
+    async def revoke_user(self, user_id: str) -> None:
+        revoked_at = time.time()
+
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hincrby(self._user_key(user_id), "generation", 1)
+                pipe.expire(self._user_key(user_id), self._config.session_ttl)
+                # Lets gateways that were disconnected catch up on resubscribe
+                pipe.zadd(self._config.recent_revocations_key, {user_id: revoked_at})
+                pipe.zremrangebyscore(
+                    self._config.recent_revocations_key,
+                    "-inf",
+                    revoked_at - self._config.revocation_window
+                )
+                pipe.publish(
+                    self._config.revocation_channel,
+                    json.dumps({"user_id": user_id, "revoked_at": revoked_at})
+                )
+                await pipe.execute()
+        except RedisError as e:
+            logger.error(f"Cannot revoke sessions of user {user_id}: {e}")
+            raise ServiceUnavailableException("Session store is unavailable")
+
+        logger.info(f"Sessions of user {user_id} revoked")
+
+
+@asynccontextmanager
+async def session_store_init(
+    app: FastAPI,
+    config: SessionStoreConfig
+) -> None:
+    app.state.session_store = RefreshSessionStore(app.state.redis_client, config)
+    logger.info("Session store started")
+
+    yield
+
+
+async def get_session_store(req: Request) -> AsyncGenerator[RefreshSessionStore, None]:
+    yield req.app.state.session_store
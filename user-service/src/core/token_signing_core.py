@@ -0,0 +1,121 @@
+from src.config.token_signing_configs import TokenSigningConfig
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives import serialization
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm
+from typing import AsyncGenerator, Dict, List
+from fastapi import FastAPI, Request
+from datetime import datetime
+import logging
+import json
+import jwt
+import os
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SIGNING_ALGORITHMS = ("EdDSA", "ES256")
+
+
+def _get_key_algorithm(private_key) -> str:
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        return "EdDSA"
+    if isinstance(private_key, ec.EllipticCurvePrivateKey) and isinstance(private_key.curve, ec.SECP256R1):
+        return "ES256"
+    raise ValueError(f"Unsupported signing key type {type(private_key).__name__}, use Ed25519 or EC P-256")
+
+
+def _get_public_jwk(key_id: str, algorithm: str, private_key) -> dict:
+    if algorithm == "EdDSA":
+        jwk = OKPAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    else:
+        jwk = ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+
+    jwk.update({"kid": key_id, "alg": algorithm, "use": "sig"})
+    return jwk
+
+
+def _generate_key(algorithm: str):
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+    raise ValueError(f"Unsupported signing algorithm {algorithm}, use one of {SIGNING_ALGORITHMS}")
+
+
+class TokenSigningKeys:
+    """
+    Private keys in PEM files, one per key id. Every key is published in the
+    JWKS document, only the active one signs. Rotation: add the new key,
+    give gateways time to fetch it, switch the active key id, then remove
+    the old file once the tokens it signed have expired.
+    """
+
+    def __init__(self, keys: Dict[str, object], active_key_id: str):
+        if active_key_id not in keys:
+            raise ValueError(f"Active signing key {active_key_id} is not in the keys directory")
+
+        self._private_keys = keys
+        self._algorithms = {key_id: _get_key_algorithm(key) for key_id, key in keys.items()}
+        self.active_key_id = active_key_id
+        # Served as is on every request
+        self.jwks_body = json.dumps({
+            "keys": [
+                _get_public_jwk(key_id, self._algorithms[key_id], key)
+                for key_id, key in keys.items()
+            ]
+        }).encode()
+
+    @classmethod
+    def load(cls, config: TokenSigningConfig) -> "TokenSigningKeys":
+        os.makedirs(config.keys_directory, exist_ok=True)
+        file_names = sorted(name for name in os.listdir(config.keys_directory) if name.endswith(".pem"))
+
+        if not file_names:
+            file_names = [cls._write_generated_key(config)]
+
+        keys = {}
+        for file_name in file_names:
+            with open(os.path.join(config.keys_directory, file_name), "rb") as key_file:
+                keys[file_name[:-len(".pem")]] = serialization.load_pem_private_key(key_file.read(), password=None)
+
+        return cls(keys, config.active_key_id or list(keys)[-1])
+
+    @staticmethod
+    def _write_generated_key(config: TokenSigningConfig) -> str:
+        key = _generate_key(config.generated_key_algorithm)
+        file_name = datetime.now().strftime("%Y%m%d%H%M%S") + ".pem"
+
+        with open(os.path.join(config.keys_directory, file_name), "wb") as key_file:
+            key_file.write(key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption()
+            ))
+        os.chmod(os.path.join(config.keys_directory, file_name), 0o600)
+
+        logger.warning(f"No token signing keys found, generated {file_name} in {config.keys_directory}")
+        return file_name
+
+    @property
+    def key_ids(self) -> List[str]:
+        return list(self._private_keys)
+
+    def sign(self, payload: dict) -> str:
+        return jwt.encode(
+            payload,
+            self._private_keys[self.active_key_id],
+            algorithm=self._algorithms[self.active_key_id],
+            headers={"kid": self.active_key_id}
+        )
+
+
+def token_signing_init(app: FastAPI, config: TokenSigningConfig) -> None:
+    app.state.token_signing_keys = TokenSigningKeys.load(config)
+    logger.info(
+        f"Token signing keys loaded: {app.state.token_signing_keys.key_ids}, "
+        f"active {app.state.token_signing_keys.active_key_id}"
+    )
+
+
+async def get_token_signing_keys(req: Request) -> AsyncGenerator[TokenSigningKeys, None]:
+    yield req.app.state.token_signing_keys
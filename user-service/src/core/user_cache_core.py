@@ -0,0 +1,177 @@
+from src.config.user_cache_configs import UserCacheConfig
+from src.models.entities import User
+
+from contextlib import asynccontextmanager, suppress
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select, bindparam
+from typing import AsyncGenerator, Optional
+from fastapi import FastAPI, Request
+from collections import OrderedDict
+from redis.exceptions import RedisError
+from redis.asyncio import Redis
+from datetime import datetime
+import asyncio
+import logging
+import json
+import time
+import uuid
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The password hash never leaves the database
+CACHED_USER_FIELDS = ("username", "profile_picture", "email", "status", "role")
+
+# Left in place of an invalidated entry, fills are written with NX and
+# cannot replace it with a user loaded before the invalidation
+INVALIDATED_MARK = b"-"
+
+USER_QUERY = select(User).where(User.id == bindparam("user_id"))
+
+
+def _dump_user(user: User) -> dict:
+    data = {field: getattr(user, field) for field in CACHED_USER_FIELDS}
+    data["id"] = str(user.id)
+    data["created_at"] = user.created_at.isoformat() if user.created_at else None
+    data["blocked_for"] = user.blocked_for.isoformat() if user.blocked_for else None
+    return data
+
+
+def _load_user(data: dict) -> User:
+    """Builds a transient User, it is read-only and must not be added to a session."""
+    return User(
+        **{field: data[field] for field in CACHED_USER_FIELDS},
+        id=uuid.UUID(data["id"]),
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        blocked_for=datetime.fromisoformat(data["blocked_for"]) if data["blocked_for"] else None
+    )
+
+
+class UserLookupCache:
+    """
+    Read-through user cache: a short-lived in-process LRU in front of Redis.
+    Misses are loaded from the primary, a replica may not have the latest
+    write yet. Invalidations replace the Redis entry with a short-lived
+    mark and are broadcast over pub/sub so every replica drops its local copy.
+    """
+
+    def __init__(self, redis_client: Redis, session_maker: sessionmaker, config: UserCacheConfig):
+        self._redis = redis_client
+        self._session_maker = session_maker
+        self._config = config
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _key(self, user_id: str) -> str:
+        return self._config.key_prefix + user_id
+
+    def _get_local(self, user_id: str) -> Optional[dict]:
+        entry = self._local.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            del self._local[user_id]
+            return None
+
+        self._local.move_to_end(user_id)
+        return data
+
+    def _set_local(self, user_id: str, data: dict) -> None:
+        self._local[user_id] = (time.monotonic() + self._config.local_ttl, data)
+        self._local.move_to_end(user_id)
+
+        while len(self._local) > self._config.local_max_size:
+            self._local.popitem(last=False)
+
+    def drop_local(self, user_id: str) -> None:
+        self._local.pop(user_id, None)
+
+    async def _load(self, user_id: uuid.UUID) -> Optional[User]:
+        async with self._session_maker() as session:
+            result = await session.execute(USER_QUERY, {"user_id": user_id})
+            return result.scalar_one_or_none()
+
+    async def get(self, user_id: uuid.UUID) -> Optional[User]:
+        key = str(user_id)
+
+        data = self._get_local(key)
+        if data is not None:
+            return _load_user(data)
+
+        try:
+            raw = await self._redis.get(self._key(key))
+        except RedisError as e:
+            logger.warning(f"User cache read failed: {e}")
+            raw = None
+
+        if raw is not None and raw != INVALIDATED_MARK:
+            data = json.loads(raw)
+            self._set_local(key, data)
+            return _load_user(data)
+
+        user = await self._load(user_id)
+        if user is None:
+            return None
+
+        data = _dump_user(user)
+        try:
+            stored = await self._redis.set(self._key(key), json.dumps(data), ex=self._config.redis_ttl, nx=True)
+        except RedisError as e:
+            logger.warning(f"User cache write failed: {e}")
+            stored = False
+
+        # The user may have been invalidated while it was loaded
+        if stored:
+            self._set_local(key, data)
+
+        return user
+
+    async def invalidate(self, user_id: uuid.UUID) -> None:
+        key = str(user_id)
+        self.drop_local(key)
+
+        try:
+            await self._redis.set(self._key(key), INVALIDATED_MARK, ex=self._config.invalidation_hold)
+            await self._redis.publish(self._config.invalidation_channel, key)
+        except RedisError as e:
+            # Other replicas keep their copy for at most local_ttl
+            logger.warning(f"User cache invalidation of {key} failed: {e}")
+
+
+async def _invalidation_listener(cache: UserLookupCache, redis_client: Redis, channel: str) -> None:
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        cache.drop_local(message["data"].decode())
+        except RedisError as e:
+            logger.warning(f"User cache invalidation listener failed: {e}")
+            await asyncio.sleep(1)
+
+
+@asynccontextmanager
+async def user_cache_init(
+    app: FastAPI,
+    config: UserCacheConfig
+) -> None:
+    cache = UserLookupCache(app.state.redis_client, app.state.db_session_maker, config)
+    app.state.user_cache = cache
+
+    listener_task = asyncio.create_task(
+        _invalidation_listener(cache, app.state.redis_client, config.invalidation_channel)
+    )
+    logger.info("User cache started")
+
+    try:
+        yield
+    finally:
+        listener_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener_task
+        logger.info("User cache stopped")
+
+
+async def get_user_cache(req: Request) -> AsyncGenerator[UserLookupCache, None]:
+    yield req.app.state.user_cache
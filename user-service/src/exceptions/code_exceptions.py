@@ -67,3 +67,6 @@ class BadGatewayException(CodeException):
     def __init__(self, message: str):
         super().__init__(message=message, status_code=502)
 
+class ServiceUnavailableException(CodeException):
+    def __init__(self, message: str):
+        super().__init__(message=message, status_code=503)
@@ -19,6 +19,21 @@ DB_NAME: str = os.environ.get("DB_NAME")
 DB_HOST: str = os.environ.get("DB_HOST")
 DB_URL: str = os.environ.get("DB_URL")
 DB_ECHO_MODE: bool = False
+# Connections per worker process: pool_size + max_overflow
+DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE") or 10)
+DB_POOL_MAX_OVERFLOW: int = int(os.environ.get("DB_POOL_MAX_OVERFLOW") or 10)
+DB_POOL_TIMEOUT: float = float(os.environ.get("DB_POOL_TIMEOUT") or 10)
+DB_POOL_RECYCLE: int = int(os.environ.get("DB_POOL_RECYCLE") or 1800)
+DB_POOL_PRE_PING: bool = (os.environ.get("DB_POOL_PRE_PING") or "false").lower() == "true"
+# Prepared statements kept per connection, 0 when running behind pgbouncer in transaction mode
+DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(os.environ.get("DB_PREPARED_STATEMENT_CACHE_SIZE") or 500)
+# Compiled SQL kept per engine
+DB_QUERY_CACHE_SIZE: int = int(os.environ.get("DB_QUERY_CACHE_SIZE") or 1200)
+# Comma separated replica hosts, read-only endpoints use the primary when empty
+DB_REPLICA_HOSTS: list = [host.strip() for host in (os.environ.get("DB_REPLICA_HOSTS") or "").split(",") if host.strip()]
+DB_REPLICA_MAX_LAG: float = float(os.environ.get("DB_REPLICA_MAX_LAG") or 5)
+DB_REPLICA_STICKY_SECONDS: float = float(os.environ.get("DB_REPLICA_STICKY_SECONDS") or 10)
+DB_REPLICA_LAG_CHECK_INTERVAL: float = float(os.environ.get("DB_REPLICA_LAG_CHECK_INTERVAL") or 2)
 
 #
 # Logging config
@@ -55,25 +70,57 @@ MAX_PAGES_PER_REQUEST: int = 10
 #
 # HEADER'S NAMES
 #
-USER_ID_HEADER_NAME = "x-user-id"
-USER_ROLE_HEADER_NAME = "x-user-role"
-USER_NAME_HEADER_NAME = "x-user-name"
-USER_STATUS_HEADER_NAME = "x-user-status"
-USER_BLOCKED_FOR_HEADER_NAME = "x-user-blocked-for"
 TRACE_ID_HEADER_NAME = "x-trace-id"
 
+#
+# User context configs
+#
+USER_CONTEXT_HEADER_NAME: str = "x-user-context"
+# Shared with the gateway, which signs the header
+USER_CONTEXT_SECRET: str = os.environ.get("USER_CONTEXT_SECRET")
+# Verified header values kept per worker
+USER_CONTEXT_CACHE_SIZE: int = int(os.environ.get("USER_CONTEXT_CACHE_SIZE") or 10000)
+
 #
 # Redis configs
 #
 REDIS_HOST: str = os.environ.get("REDIS_HOST")
-REDIS_PORT: int = os.environ.get("REDIS_PORT")
+REDIS_PORT: int = int(os.environ.get("REDIS_PORT") or 6379)
+
+#
+# User cache configs
+#
+# The local copy is short-lived, replicas also drop it on invalidation messages
+USER_CACHE_LOCAL_MAX_SIZE: int = int(os.environ.get("USER_CACHE_LOCAL_MAX_SIZE") or 10000)
+USER_CACHE_LOCAL_TTL: float = float(os.environ.get("USER_CACHE_LOCAL_TTL") or 5)
+USER_CACHE_REDIS_TTL: int = int(os.environ.get("USER_CACHE_REDIS_TTL") or 60)
 
 #
 # Token configs
 #
-ACCESS_TOKEN_SECRET: str = os.environ.get("ACCESS_TOKEN_SECRET")
 ACCESS_TOKEN_TTL: int = 10 * 60
+# Access tokens are signed with the private keys in this directory, one <key id>.pem per key
+TOKEN_SIGNING_KEYS_DIRECTORY: str = os.environ.get("TOKEN_SIGNING_KEYS_DIRECTORY") or "keys"
+TOKEN_SIGNING_ACTIVE_KEY_ID: str = os.environ.get("TOKEN_SIGNING_ACTIVE_KEY_ID") or None
+TOKEN_SIGNING_ALGORITHM: str = os.environ.get("TOKEN_SIGNING_ALGORITHM") or "EdDSA"
+TOKEN_JWKS_MAX_AGE: int = int(os.environ.get("TOKEN_JWKS_MAX_AGE") or 300)
 REFRESH_TOKEN_SECRET: str = os.environ.get("REFRESH_TOKEN_SECRET")
 REFRESH_TOKEN_TTL: int = 7 * 24 * 60 * 60
 
+#
+# Session store configs
+#
+# Gateways subscribe to this channel to reject access tokens of revoked users
+SESSION_REVOCATION_CHANNEL: str = os.environ.get("SESSION_REVOCATION_CHANNEL") or "users:revocations"
+
+#
+# Password hashing configs
+#
+# Stored hashes with another cost are rehashed on the next successful login
+PASSWORD_HASH_ROUNDS: int = int(os.environ.get("PASSWORD_HASH_ROUNDS") or 12)
+# bcrypt releases the GIL, so threads scale up to the number of cores
+PASSWORD_HASH_WORKERS: int = int(os.environ.get("PASSWORD_HASH_WORKERS") or min(4, os.cpu_count() or 1))
+PASSWORD_HASH_MAX_QUEUE: int = int(os.environ.get("PASSWORD_HASH_MAX_QUEUE") or 16)
+PASSWORD_HASH_QUEUE_TIMEOUT: float = float(os.environ.get("PASSWORD_HASH_QUEUE_TIMEOUT") or 2)
+
 
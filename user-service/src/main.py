@@ -1,8 +1,19 @@
-from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig
+from src.config.db_configs import DatabaseConfig, PoolConfig, ConnectionConfig, ReplicaConfig
 from src.api.users_cruds_api import user_crud_router
+from src.api.metrics_router import metrics_router
 from src.api.auth_api import auth_router
 from src.core.logging_core import setup_logging
-from src.core.db_core import init_engine
+from src.core.db_core import init_engine, replicas_init
+from src.core.password_hasher_core import password_hasher_init
+from src.config.user_cache_configs import UserCacheConfig
+from src.core.user_cache_core import user_cache_init
+from src.config.session_store_configs import SessionStoreConfig
+from src.core.session_store_core import session_store_init
+from src.config.token_signing_configs import TokenSigningConfig
+from src.core.token_signing_core import token_signing_init
+from src.core.redis_core import redis_client_init
+from src.core.latency_metrics_core import latency_metrics_init
+from src.config.password_hashing_configs import PasswordHashingConfig
 from src.exceptions.code_exceptions import CodeException
 from src.exceptions.exception_handlers import (
     exception_handler,
@@ -14,7 +25,14 @@ from src.middlewares.add_headers_middleware import AddTraceIdHeadersMiddleware
 from src.globals import (
     APP_HOST, APP_PORT,
     LOGS_LEVEL, LOGS_FILENAME, LOGS_FORMAT,
-    DB_HOST, DB_URL, DB_USER, DB_PASSWORD, DB_NAME, DB_ECHO_MODE
+    DB_HOST, DB_URL, DB_USER, DB_PASSWORD, DB_NAME, DB_ECHO_MODE,
+    DB_POOL_SIZE, DB_POOL_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING,
+    DB_PREPARED_STATEMENT_CACHE_SIZE, DB_QUERY_CACHE_SIZE,
+    DB_REPLICA_HOSTS, DB_REPLICA_MAX_LAG, DB_REPLICA_STICKY_SECONDS, DB_REPLICA_LAG_CHECK_INTERVAL,
+    PASSWORD_HASH_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_QUEUE_TIMEOUT,
+    REDIS_HOST, REDIS_PORT, USER_CACHE_LOCAL_MAX_SIZE, USER_CACHE_LOCAL_TTL, USER_CACHE_REDIS_TTL,
+    ACCESS_TOKEN_TTL, REFRESH_TOKEN_TTL, SESSION_REVOCATION_CHANNEL,
+    TOKEN_SIGNING_KEYS_DIRECTORY, TOKEN_SIGNING_ACTIVE_KEY_ID, TOKEN_SIGNING_ALGORITHM
 )
 
 from fastapi.exceptions import RequestValidationError
@@ -36,25 +54,87 @@ async def app_lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     logger: logging.Logger = logging.getLogger(__name__)
 
+    database_config = DatabaseConfig(
+        db_url=DB_URL,
+        db_username=DB_USER,
+        db_password=DB_PASSWORD,
+        db_host=DB_HOST,
+        db_name=DB_NAME
+    )
+    connection_config = ConnectionConfig(
+        prepared_statement_cache_size=DB_PREPARED_STATEMENT_CACHE_SIZE,
+        query_cache_size=DB_QUERY_CACHE_SIZE
+    )
+    pool_config = PoolConfig(
+        pool_size=DB_POOL_SIZE,
+        max_overflows=DB_POOL_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        echo=DB_ECHO_MODE,
+        hide_parameters=not DB_ECHO_MODE
+    )
+
     await init_engine(
         app=app,
-        db_config=DatabaseConfig(
-            db_url=DB_URL,
-            db_username=DB_USER,
-            db_password=DB_PASSWORD,
-            db_host=DB_HOST,
-            db_name=DB_NAME
-        ),
-        pool_config=PoolConfig(
-            echo=DB_ECHO_MODE,
-            hide_parameters=not DB_ECHO_MODE
-        ),
-        connection_config=ConnectionConfig()
+        db_config=database_config,
+        pool_config=pool_config,
+        connection_config=connection_config
     )
 
-    logger.info(f"Server is started on {APP_HOST}:{APP_PORT}")
-    yield
-    logger.error("Server shutdown...")
+    latency_metrics_init(app)
+    token_signing_init(
+        app=app,
+        config=TokenSigningConfig(
+            keys_directory=TOKEN_SIGNING_KEYS_DIRECTORY,
+            active_key_id=TOKEN_SIGNING_ACTIVE_KEY_ID,
+            generated_key_algorithm=TOKEN_SIGNING_ALGORITHM
+        )
+    )
+
+    async with (
+        redis_client_init(app, REDIS_HOST, REDIS_PORT),
+        replicas_init(
+            app=app,
+            db_config=database_config,
+            pool_config=pool_config,
+            connection_config=connection_config,
+            replica_config=ReplicaConfig(
+                hosts=DB_REPLICA_HOSTS,
+                max_lag=DB_REPLICA_MAX_LAG,
+                sticky_seconds=DB_REPLICA_STICKY_SECONDS,
+                lag_check_interval=DB_REPLICA_LAG_CHECK_INTERVAL
+            )
+        ),
+        password_hasher_init(
+            app=app,
+            config=PasswordHashingConfig(
+                rounds=PASSWORD_HASH_ROUNDS,
+                workers=PASSWORD_HASH_WORKERS,
+                max_queue=PASSWORD_HASH_MAX_QUEUE,
+                queue_timeout=PASSWORD_HASH_QUEUE_TIMEOUT
+            )
+        ),
+        user_cache_init(
+            app=app,
+            config=UserCacheConfig(
+                local_max_size=USER_CACHE_LOCAL_MAX_SIZE,
+                local_ttl=USER_CACHE_LOCAL_TTL,
+                redis_ttl=USER_CACHE_REDIS_TTL
+            )
+        ),
+        session_store_init(
+            app=app,
+            config=SessionStoreConfig(
+                session_ttl=REFRESH_TOKEN_TTL,
+                revocation_window=ACCESS_TOKEN_TTL,
+                revocation_channel=SESSION_REVOCATION_CHANNEL
+            )
+        )
+    ):
+        logger.info(f"Server is started on {APP_HOST}:{APP_PORT}")
+        yield
+        logger.error("Server shutdown...")
 
 
 app = FastAPI(lifespan=app_lifespan)
@@ -64,6 +144,11 @@ app.add_middleware(AddTraceIdHeadersMiddleware)
 
 app.include_router(auth_router)
 app.include_router(user_crud_router)
+app.include_router(metrics_router)
+
+@app.get("/ping")
+async def ping():
+    return "pong"
 
 app.add_exception_handler(RequestValidationError, pydantic_validation_exception_handler)
 app.add_exception_handler(CodeException, code_exception_handler)
@@ -1,14 +1,36 @@
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from src.globals import TRACE_ID_HEADER_NAME
 import logging
 
 logger = logging.getLogger(__name__)
 
-class AddTraceIdHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        response = await call_next(request)
-        
-        logger.debug(response.headers)
-        response.headers[TRACE_ID_HEADER_NAME] = request.headers.get(TRACE_ID_HEADER_NAME, None)
+TRACE_ID_HEADER_KEY = TRACE_ID_HEADER_NAME.encode()
 
-        return response
+
+class AddTraceIdHeadersMiddleware:
+    """Echoes the gateway trace id back in the response headers."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = None
+        for name, value in scope["headers"]:
+            if name == TRACE_ID_HEADER_KEY:
+                trace_id = value
+                break
+
+        if trace_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_trace_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), (TRACE_ID_HEADER_KEY, trace_id)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_trace_id)
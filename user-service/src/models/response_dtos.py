@@ -19,7 +19,7 @@ class UserResponseDTO(BaseModel):
     
     @classmethod
     def from_entity(cls, entity: User) -> 'UserResponseDTO':
-        return cls(
+        return cls.model_construct(
             id=str(entity.id),
             username=entity.username,
             email=entity.email,
@@ -35,7 +35,7 @@ class UserAuthResponseDTO(BaseModel):
 
     @classmethod
     def from_data(cls, access_token: str, refresh_token: str, user: User) -> 'UserAuthResponseDTO':
-        return cls(
+        return cls.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
             user_data=UserResponseDTO.from_entity(user)
@@ -44,6 +44,7 @@ class UserAuthResponseDTO(BaseModel):
 
 class AccessTokenResponseDTO(BaseModel):
     access_token: str
+    refresh_token: str
 
 
 class StatusUpdateResponseDTO(BaseModel):
@@ -2,22 +2,27 @@ from src.models.enums import UserStatus
 from src.models.request_dtos import UserRegistrationDTO, UserLoginDTO, RefreshTokenDTO
 from src.models.response_dtos import UserAuthResponseDTO, AccessTokenResponseDTO
 from src.middlewares.auth_middleware import UserContext
+from src.core.password_hasher_core import PasswordHasherPool
+from src.core.latency_metrics_core import LatencyMetricsRegistry
+from src.core.session_store_core import RefreshSessionStore, get_session_claims
+from src.core.token_signing_core import TokenSigningKeys
 from src.models.entities import User
 from src.globals import (
-    ACCESS_TOKEN_SECRET, ACCESS_TOKEN_TTL, 
+    ACCESS_TOKEN_TTL, 
     REFRESH_TOKEN_SECRET, REFRESH_TOKEN_TTL
 )
 from src.exceptions.code_exceptions import (
-    NotFoundException, ConflictException, UnauthorizedException,
+    NotFoundException, ConflictException, UnauthorizedException, ServiceUnavailableException,
 )
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from typing import Dict
 
 import datetime
 import logging
-import bcrypt
+import time
 import jwt
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -27,26 +32,37 @@ SessionIdStr = str
 
 
 class AuthService:
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        password_hasher: PasswordHasherPool,
+        latency_metrics: LatencyMetricsRegistry,
+        session_store: RefreshSessionStore,
+        signing_keys: TokenSigningKeys
+    ):
         self.db_session = db_session
+        self._password_hasher = password_hasher
+        self._latency_metrics = latency_metrics
+        self._session_store = session_store
+        self._signing_keys = signing_keys
 
 
-    def _create_access_token(self, user: User) -> str:
+    def _create_access_token(self, user_id: str, claims: Dict[str, str]) -> str:
         payload = {
-            "sub": str(user.id),
+            "sub": user_id,
             "exp": datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=ACCESS_TOKEN_TTL),
             "iat": datetime.datetime.now(datetime.timezone.utc),
-            "name": user.username,
-            "role": user.role,
-            "status": user.status,
-            "blocked_for": str(user.blocked_for),
+            **claims,
         }
-        token = jwt.encode(payload, ACCESS_TOKEN_SECRET, algorithm="HS256")
+        # Verified by the gateway with the public keys from the JWKS endpoint
+        token = self._signing_keys.sign(payload)
         return token
 
-    def _create_refresh_token(self, user: User) -> str:
+    def _create_refresh_token(self, user_id: str, family_id: str, token_id: str) -> str:
         payload = {
-            "sub": str(user.id),
+            "sub": user_id,
+            "fam": family_id,
+            "jti": token_id,
             "exp": datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=REFRESH_TOKEN_TTL),
             "iat": datetime.datetime.now(datetime.timezone.utc)
         }
@@ -64,8 +80,26 @@ class AuthService:
         except jwt.InvalidTokenError:
             raise UnauthorizedException("Refresh token is invalid")
 
+    async def _start_session(self, user: User) -> UserAuthResponseDTO:
+        user_id = str(user.id)
+        claims = get_session_claims(user)
+        family_id, token_id = await self._session_store.create(user_id, claims)
+
+        return UserAuthResponseDTO.from_data(
+            self._create_access_token(user_id, claims),
+            self._create_refresh_token(user_id, family_id, token_id),
+            user
+        )
+
 
     async def register(self, user_register_dto: UserRegistrationDTO) -> UserAuthResponseDTO:
+        started_at = time.perf_counter()
+        try:
+            return await self._register(user_register_dto)
+        finally:
+            self._latency_metrics.observe("register", started_at)
+
+    async def _register(self, user_register_dto: UserRegistrationDTO) -> UserAuthResponseDTO:
         similar_user_query = select(User).where(User.email == user_register_dto.email)
         similar_user_result = await self.db_session.execute(similar_user_query)
         similar_user = similar_user_result.scalar_one_or_none()
@@ -74,8 +108,7 @@ class AuthService:
             raise ConflictException("User with such email has already exist.")
 
         try:
-            salt = bcrypt.gensalt(rounds=12)
-            hashed_pass = bcrypt.hashpw(user_register_dto.password.encode('utf-8'), salt).decode('utf-8')
+            hashed_pass = await self._password_hasher.hash(user_register_dto.password)
 
             user = User(
                 password=hashed_pass,
@@ -88,10 +121,7 @@ class AuthService:
 
             await self.db_session.flush()
 
-            refresh_token = self._create_refresh_token(user)
-            access_token = self._create_access_token(user)
-            
-            return_dto = UserAuthResponseDTO.from_data(access_token, refresh_token, user)
+            return_dto = await self._start_session(user)
 
             await self.db_session.commit()
 
@@ -101,6 +131,13 @@ class AuthService:
  
 
     async def login(self, user_login_dto: UserLoginDTO) -> UserAuthResponseDTO:
+        started_at = time.perf_counter()
+        try:
+            return await self._login(user_login_dto)
+        finally:
+            self._latency_metrics.observe("login", started_at)
+
+    async def _login(self, user_login_dto: UserLoginDTO) -> UserAuthResponseDTO:
         user_query = select(User).where(User.email == user_login_dto.email)
         user_result = await self.db_session.execute(user_query)
         user = user_result.scalar_one_or_none()
@@ -108,30 +145,37 @@ class AuthService:
         if not user:
             raise NotFoundException("Cannot find user with such email.")
 
-        if not bcrypt.checkpw(
-            user_login_dto.password.encode('utf-8'), 
-            user.password.encode('utf-8')
-        ):
+        if not await self._password_hasher.verify(user_login_dto.password, user.password):
             raise UnauthorizedException("Invalid password.")
 
-        return UserAuthResponseDTO.from_data(
-            self._create_access_token(user),
-            self._create_refresh_token(user),
-            user
-        )
+        return_dto = await self._start_session(user)
+
+        if self._password_hasher.needs_rehash(user.password):
+            await self._rehash_password(user, user_login_dto.password)
+
+        return return_dto
+
+    async def _rehash_password(self, user: User, password: str) -> None:
+        """Upgrades the stored hash to the configured cost, skipped under load."""
+        try:
+            user.password = await self._password_hasher.hash(password)
+            await self.db_session.commit()
+        except ServiceUnavailableException:
+            logger.info(f"Password rehash for user {user.id} postponed, hasher is busy")
 
 
     async def refresh(self, refresh_token_dto: RefreshTokenDTO) -> AccessTokenResponseDTO:
-        user_payload = self._decode_refresh_token(refresh_token_dto.refresh_token)
-        user_id = user_payload["sub"]
+        payload = self._decode_refresh_token(refresh_token_dto.refresh_token)
 
-        user_query = select(User).where(User.id == user_id)
-        user_result = await self.db_session.execute(user_query)
-        user = user_result.scalar_one_or_none()
+        try:
+            user_id, family_id, token_id = payload["sub"], payload["fam"], payload["jti"]
+        except KeyError:
+            # Tokens issued before sessions were stored server-side
+            raise UnauthorizedException("Refresh token is invalid")
 
-        if not user:
-            raise NotFoundException("Cannot find user with such email.")
+        new_token_id, claims = await self._session_store.rotate(user_id, family_id, token_id)
 
         return AccessTokenResponseDTO(
-            access_token=self._create_access_token(user)
+            access_token=self._create_access_token(user_id, claims),
+            refresh_token=self._create_refresh_token(user_id, family_id, new_token_id)
         )
@@ -2,6 +2,8 @@ from src.models.response_dtos import UserResponseDTO
 from src.models.request_dtos import UserUpdateDTO
 from src.middlewares.access_control import check_resource_access
 from src.middlewares.auth_middleware import UserContext
+from src.core.user_cache_core import UserLookupCache
+from src.core.session_store_core import RefreshSessionStore, get_session_claims
 from src.models.entities import User
 from src.exceptions.code_exceptions import (
     ForbiddenException, NoContentException, NotFoundException, ConflictException,
@@ -10,6 +12,7 @@ from src.exceptions.code_exceptions import (
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import select
+from typing import Optional
 from uuid import UUID
 
 import logging
@@ -18,14 +21,28 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 class UserService:
-    def __init__(self, db_session: AsyncSession, user_context: UserContext):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        user_context: UserContext,
+        user_cache: Optional[UserLookupCache] = None,
+        session_store: Optional[RefreshSessionStore] = None
+    ):
         self.db_session = db_session
         self.user_context = user_context
+        self.user_cache = user_cache
+        self.session_store = session_store
 
-    async def _get_user_entity_by_id(self, user_id: UUID) -> User:
+    async def _load_user(self, user_id: UUID) -> Optional[User]:
         user_query = select(User).where(User.id == user_id)
         user_result = await self.db_session.execute(user_query)
-        user = user_result.scalar_one_or_none()
+        return user_result.scalar_one_or_none()
+
+    async def _get_user_entity_by_id(self, user_id: UUID, use_cache: bool = False) -> User:
+        if use_cache and self.user_cache is not None:
+            user = await self.user_cache.get(user_id)
+        else:
+            user = await self._load_user(user_id)
 
         if not user:
             raise NotFoundException("User not found")
@@ -41,7 +58,7 @@ class UserService:
 
 
     async def get_user_by_id(self, user_id: UUID) -> UserResponseDTO:
-        user = await self._get_user_entity_by_id(user_id)
+        user = await self._get_user_entity_by_id(user_id, use_cache=True)
 
         return UserResponseDTO.from_entity(user)
 
@@ -57,7 +74,11 @@ class UserService:
                 user.username = update_user_dto.username
 
             if is_smth_updated:
+                claims = get_session_claims(user)
                 await self.db_session.commit()
+                await self._invalidate_cached_user(user_id)
+                if self.session_store is not None:
+                    await self.session_store.update_claims(str(user_id), claims)
                 await self.db_session.refresh(user)
                 
                 return UserResponseDTO.from_entity(user)
@@ -72,5 +93,18 @@ class UserService:
             await self._get_user_entity_by_id(user_id)
         )
         await self.db_session.commit()
+        await self._invalidate_cached_user(user_id)
+        if self.session_store is not None:
+            await self.session_store.revoke_user(str(user_id))
 
         return "User was deleted"
+
+    async def revoke_sessions(self, user_id: UUID) -> str:
+        await self._get_user_entity_by_id(user_id, use_cache=True)
+        await self.session_store.revoke_user(str(user_id))
+
+        return "All sessions were revoked"
+
+    async def _invalidate_cached_user(self, user_id: UUID) -> None:
+        if self.user_cache is not None:
+            await self.user_cache.invalidate(user_id)